@@ -1,39 +1,21 @@
 #!/usr/bin/env python3
-import json, re, sys
-from pathlib import Path
+"""
+build_resume_v4.py — v4 entry point for the unified dynamic_resume engine.
+
+Equivalent to `dynamic-resume --profile v4 ...`; the parser, renderer,
+and template for this release live in projects/dynamic-resume/src/dynamic_resume
+(profile "v4", template templates/v4.html).
 
-md = Path(sys.argv[1]).read_text()
-out = Path(sys.argv[2])
+Usage:
+  python build_resume_v4.py resume.md resume.html
+"""
 
-lines = md.splitlines()
-name = lines[0][2:]
-i = 1
-header_lines=[]; bullets=[]; email=""
-while i<len(lines) and not lines[i].startswith("## "):
-    l=lines[i].strip()
-    if l.startswith("- "): bullets.append(l[2:])
-    elif "@" in l: email=l
-    elif l: header_lines.append(l)
-    i+=1
+import sys
+from pathlib import Path
 
-sections=[]
-cur=None; acc=[]
-def flush():
-    global cur, acc
-    if cur:
-        cur["body"]="\n".join(acc)
-        sections.append(cur)
-    cur=None; acc=[]
-while i<len(lines):
-    if lines[i].startswith("## "):
-        flush()
-        cur={"title":lines[i][3:]}
-    else:
-        acc.append(lines[i])
-    i+=1
-flush()
+# Use the in-repo package when it is not installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+from dynamic_resume.cli import main  # noqa: E402
 
-model={"header":{"name":name,"lines":header_lines,"email":email,"bullets":bullets},"sections":sections}
-html = Path("resume_template_configurable_v4.html").read_text()
-html = html.replace("__NAME__", name).replace("__JSON__", json.dumps({"model":model,"config":{}}))
-out.write_text(html)
+if __name__ == "__main__":
+    main(["--profile", "v4", *sys.argv[1:]])
@@ -0,0 +1,21 @@
+"""Markdown-to-standalone-HTML resume builder with one template profile per release."""
+
+from .document import Document, Section, parse_document
+from .engine import build_model, build_resume, load_template, render, resolve_config
+from .profiles import DEFAULT_PROFILE, PROFILES, Profile, get_profile
+
+__version__ = "0.1.0"
+__all__ = [
+    "DEFAULT_PROFILE",
+    "PROFILES",
+    "Document",
+    "Profile",
+    "Section",
+    "build_model",
+    "build_resume",
+    "get_profile",
+    "load_template",
+    "parse_document",
+    "render",
+    "resolve_config",
+]
@@ -0,0 +1,201 @@
+"""
+Batch mode: render many resumes from one manifest in a worker pool.
+
+Each distinct (profile, template) and (profile, config) pair is parsed once and
+shipped to every worker up front; jobs then only carry paths. A consolidated
+timing and size report (including gzip transfer size) is printed at the end.
+
+Manifest (paths are relative to the manifest file):
+
+  {
+    "defaults": {"profile": "v2.4"},
+    "jobs": [
+      {"markdown": "william-claytor-resume.md", "output": "build/short.html", "config": "resume.config.json"},
+      {"markdown": "william-claytor-resume.md", "output": "build/full.html", "config": "resume.config.v3.json"},
+      {"markdown": "william-claytor-resume.md", "output": "build/v1.html", "profile": "v1"}
+    ]
+  }
+
+A bare list of jobs is accepted too. A job without "profile" uses the command
+line profile; without "config" or "template" it uses the profile's defaults.
+A job may also name a "model" path to receive the parsed resume model as JSON,
+and a "pdf" path used by --pdf (default: the output with a .pdf suffix).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import ModelCache, write_model
+from .engine import ParsedTemplate, build_model, load_template, render, resolve_config
+from .profiles import get_profile
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    markdown: Path
+    output: Path
+    profile: str
+    template: Optional[Path] = None
+    config: Optional[Path] = None
+    model: Optional[Path] = None
+    pdf: Optional[Path] = None
+
+
+def load_batch_manifest(path: Path, default_profile: str) -> List[BatchJob]:
+    """
+    Read a batch manifest and resolve its paths relative to the manifest file.
+
+    Args:
+        path: Manifest JSON file
+        default_profile: Profile used by jobs that do not name one
+
+    Returns:
+        List of batch jobs in manifest order
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        raise SystemExit(f"Failed to read batch manifest at {path}: {e}")
+
+    if isinstance(data, list):
+        defaults, entries = {}, data
+    else:
+        defaults, entries = data.get("defaults", {}), data.get("jobs", [])
+
+    base = path.resolve().parent
+
+    def resolve(value: Optional[str]) -> Optional[Path]:
+        return None if value is None else base / value
+
+    jobs = []
+    for i, entry in enumerate(entries, 1):
+        merged = {**defaults, **entry}
+        if "markdown" not in merged or "output" not in merged:
+            raise SystemExit(f"Batch manifest {path}: job {i} needs both 'markdown' and 'output'")
+        profile = merged.get("profile", default_profile)
+        get_profile(profile)  # fail fast on typos
+        jobs.append(BatchJob(
+            markdown=resolve(merged["markdown"]),
+            output=resolve(merged["output"]),
+            profile=profile,
+            template=resolve(merged.get("template")),
+            config=resolve(merged.get("config")),
+            model=resolve(merged.get("model")),
+            pdf=resolve(merged.get("pdf")),
+        ))
+    return jobs
+
+
+# Per-worker state, filled once by _init_worker rather than pickled per job
+_templates: Dict[Tuple[str, Optional[Path]], ParsedTemplate] = {}
+_configs: Dict[Tuple[str, Optional[Path]], Dict[str, Any]] = {}
+_writer: Optional[Callable[[Path, str], Any]] = None
+_model_cache: Optional[ModelCache] = None
+_prerender = False
+
+
+def _init_worker(templates, configs, writer, model_cache, prerender) -> None:
+    global _templates, _configs, _writer, _model_cache, _prerender
+    _templates, _configs, _writer, _model_cache, _prerender = templates, configs, writer, model_cache, prerender
+
+
+def _render_job(job: BatchJob) -> Dict[str, Any]:
+    result = {"output": job.output, "profile": job.profile, "error": None, "cached": False,
+              "parse": 0.0, "render": 0.0, "write": 0.0, "bytes": 0, "gzip": 0}
+    try:
+        profile = get_profile(job.profile)
+        start = time.perf_counter()
+        model, result["cached"] = build_model(profile, job.markdown.read_text(encoding="utf-8"), _model_cache)
+        if job.model is not None:
+            write_model(job.model, model)
+        parsed = time.perf_counter()
+        prerender = _prerender and profile.prerender is not None
+        out = render(profile, model, _configs[job.profile, job.config], _templates[job.profile, job.template], prerender)
+        rendered = time.perf_counter()
+        job.output.parent.mkdir(parents=True, exist_ok=True)
+        if _writer is not None:
+            _writer(job.output, out)
+        else:
+            job.output.write_text(out, encoding="utf-8")
+        written = time.perf_counter()
+        data = out.encode("utf-8")
+        result.update(parse=parsed - start, render=rendered - parsed, write=written - rendered, bytes=len(data),
+                      gzip=len(gzip.compress(data, compresslevel=9, mtime=0)))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    workers: Optional[int] = None,
+    writer: Optional[Callable[[Path, str], Any]] = None,
+    model_cache: Optional[ModelCache] = None,
+    minify: bool = False,
+    prerender: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Render every job, sharing parsed templates and configs across the pool.
+
+    Args:
+        jobs: Jobs from load_batch_manifest
+        workers: Worker processes (default: CPU count, capped at the job count; 1 runs in-process)
+        writer: Optional writer(path, content) used instead of Path.write_text
+        model_cache: Optional parsed-model cache; hits skip parsing
+        minify: Minify every template once before sharing it
+        prerender: Server-render jobs whose profile supports it; others render as usual
+
+    Returns:
+        One result dict per job, in manifest order
+    """
+    templates = {(job.profile, job.template): load_template(get_profile(job.profile), job.template, minify) for job in jobs}
+    configs = {(job.profile, job.config): resolve_config(get_profile(job.profile), job.config) for job in jobs}
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    state = (templates, configs, writer, model_cache, prerender)
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(*state)
+        results = [_render_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=state) as pool:
+            results = list(pool.map(_render_job, jobs))
+    wall = time.perf_counter() - start
+
+    print_batch_report(results, wall, workers, len(templates), len(configs))
+    return results
+
+
+def print_batch_report(results: List[Dict[str, Any]], wall: float, workers: int, template_count: int, config_count: int) -> None:
+    """Print per-job timings and a consolidated summary."""
+    print(f"Batch: {len(results)} resumes | templates: {template_count} | configs: {config_count} | workers: {workers}")
+    print(f"  {'profile':<8} {'parse':>9}  {'render':>9} {'write':>9} {'size':>9} {'gzip':>9}  output")
+    for r in results:
+        if r["error"]:
+            print(f"  FAILED {r['output']}: {r['error']}")
+            continue
+        print(
+            f"  {r['profile']:<8} {r['parse'] * 1000:>7.2f}ms{'*' if r['cached'] else ' '} {r['render'] * 1000:>7.2f}ms "
+            f"{r['write'] * 1000:>7.2f}ms {r['bytes'] / 1024:>7.1f}KB {r['gzip'] / 1024:>7.1f}KB  {os.path.relpath(r['output'])}"
+        )
+
+    ok = [r for r in results if not r["error"]]
+    busy = sum(r["parse"] + r["render"] + r["write"] for r in ok)
+    print(
+        f"Total: {len(ok)}/{len(results)} written in {wall * 1000:.1f}ms wall "
+        f"({busy * 1000:.1f}ms in jobs: parse {sum(r['parse'] for r in ok) * 1000:.1f}, "
+        f"render {sum(r['render'] for r in ok) * 1000:.1f}, write {sum(r['write'] for r in ok) * 1000:.1f})"
+    )
+    print(f"Size: {sum(r['bytes'] for r in ok) / 1024:.1f}KB written, {sum(r['gzip'] for r in ok) / 1024:.1f}KB gzip")
+    cached = sum(1 for r in ok if r["cached"])
+    if cached:
+        print(f"Model cache: {cached}/{len(ok)} parses skipped (* above)")
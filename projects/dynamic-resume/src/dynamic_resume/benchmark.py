@@ -0,0 +1,166 @@
+"""
+Benchmark suite covering every profile.
+
+Suites:
+  profiles  parse (document + model) and render time for every profile on
+            synthetic resumes of growing size; parse cost per line should stay
+            flat (v2.1–v2.4 render grows faster only because every Links
+            section embeds the full link list, which the synthetic input repeats)
+  inline    single-pass md_inline() vs the original chained-replace version
+            over a ~10k-line corpus, with an output parity check
+  sections  one-pass section index vs the original per-Links-section rescans
+
+Usage:
+  python -m dynamic_resume.benchmark [--suite all] [--resume resume.md] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from .document import parse_document
+from .engine import load_template, render, resolve_config
+from .inline import md_inline, parse_links_block
+from .profiles import PROFILES
+
+
+def make_resume(sections: int) -> str:
+    """A deterministic resume exercising every profile's section handling."""
+    out = ["# Jane Example", "Springfield, USA | Remote", "jane@example.com", "", "- US Citizen", ""]
+    for i in range(sections):
+        kind = i % 6
+        if kind == 0:
+            out += ["## Links", f"- Project {i}: https://example.com/p{i}", f"- Docs — https://example.com/d{i}", ""]
+        elif kind == 1:
+            out += ["## Work Experience", "", "### Senior Engineer", "**Acme & Co**", "Springfield, USA", "01/2020 – 12/2023", "",
+                    "Acme is a company that makes everything for everyone everywhere.", "", "**Leadership:**",
+                    f"- Led a *team* of `5` on [project {i}](https://example.com/{i})", "- Shipped **big** things", ""]
+        elif kind == 2:
+            out += ["## Skills", "", "**Languages**", "Python, Go", ""]
+        elif kind == 3:
+            out += ["## Education", "", "BS Computer Science — State U", ""]
+        elif kind == 4:
+            out += ["## Summary", "", "Engineer with **depth** and *breadth*.", ""]
+        else:
+            out += [f"## Section {i}", "Paragraph with `code`.", "", "- item a", "- item b", ""]
+    return "\n".join(out) + "\n"
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_profiles(sizes: List[int], repeat: int) -> None:
+    print("== profiles: parse + render per profile")
+    print(f"  {'profile':<8} {'sections':>8} {'lines':>7} {'parse':>10} {'render':>10} {'per line':>10}")
+    for profile in PROFILES.values():
+        template = load_template(profile)
+        config = resolve_config(profile)
+        for n in sizes:
+            md = make_resume(n)
+            lines = md.count("\n")
+            model = profile.build_model(parse_document(md))
+            parse = best_of(lambda: profile.build_model(parse_document(md)), repeat)
+            rend = best_of(lambda: render(profile, model, config, template), repeat)
+            print(
+                f"  {profile.name:<8} {n:>8} {lines:>7} {parse * 1000:>8.2f}ms {rend * 1000:>8.2f}ms "
+                f"{(parse + rend) / lines * 1e6:>8.2f}us"
+            )
+
+
+def legacy_md_inline(text: str) -> str:
+    """The original chained-replace implementation, kept for comparison."""
+    t = (text or "").strip()
+    t = (
+        t.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+    t = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>', t)
+    t = re.sub(r"`([^`]+)`", r"<code>\1</code>", t)
+    t = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", t)
+    t = re.sub(r"\*([^*]+)\*", r"<em>\1</em>", t)
+    return t
+
+
+def bench_inline(resume: str, line_count: int, repeat: int) -> None:
+    lines = resume.splitlines()
+    corpus: List[str] = []
+    while len(corpus) < line_count:
+        corpus.extend(lines)
+    corpus = corpus[:line_count]
+
+    mismatches = sum(1 for ln in corpus if md_inline(ln) != legacy_md_inline(ln))
+    legacy = best_of(lambda: [legacy_md_inline(ln) for ln in corpus], repeat)
+    shared = best_of(lambda: [md_inline(ln) for ln in corpus], repeat)
+    print(f"== inline: {len(corpus)} lines, {mismatches} output mismatches vs legacy")
+    print(
+        f"  legacy {len(corpus) / legacy:>12,.0f} lines/s   single-pass {len(corpus) / shared:>12,.0f} lines/s   "
+        f"{legacy / shared:.2f}x"
+    )
+
+
+def legacy_md_section_lines(md: str, title: str) -> List[str]:
+    """The original rescanning lookup, kept for comparison."""
+    inside = False
+    out = []
+    for ln in md.splitlines():
+        if ln.startswith("## "):
+            inside = (ln[3:].strip().lower() == title.lower())
+            continue
+        if inside:
+            out.append(ln)
+    return out
+
+
+def bench_sections(sizes: List[int], repeat: int) -> None:
+    print("== sections: Links lookups, rescan per Links section vs one-pass index")
+    print(f"  {'sections':>8} {'lines':>7} {'rescan':>10} {'indexed':>10} {'speedup':>8}")
+    for n in sizes:
+        md = make_resume(n)
+        links_sections = md.count("\n## Links\n")
+        doc = parse_document(md)
+        if parse_links_block(doc.section_lines("Links")) != parse_links_block(legacy_md_section_lines(md, "Links")):
+            raise SystemExit(f"Links mismatch at {n} sections")
+
+        def rescan():
+            # Original cost: one rescan per Links section at each of the two lookup sites
+            for _ in range(2 * links_sections):
+                legacy_md_section_lines(md, "Links")
+
+        old = best_of(rescan, repeat)
+        new = best_of(lambda: parse_document(md).section_lines("Links"), repeat)
+        print(f"  {n:>8} {md.count(chr(10)):>7} {old * 1000:>8.2f}ms {new * 1000:>8.2f}ms {old / new:>7.1f}x")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark the dynamic_resume engine across every profile.")
+    ap.add_argument("--suite", choices=["all", "profiles", "inline", "sections"], default="all")
+    ap.add_argument("--resume", type=Path, default=None, help="Markdown resume for the inline corpus (default: synthetic)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 400], help="Section counts for scaling runs")
+    ap.add_argument("--lines", type=int, default=10_000, help="Inline corpus size in lines")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per measurement; best is reported")
+    args = ap.parse_args()
+
+    if args.suite in ("all", "profiles"):
+        bench_profiles(args.sizes, args.repeat)
+    if args.suite in ("all", "inline"):
+        resume = args.resume.read_text(encoding="utf-8") if args.resume else make_resume(50)
+        bench_inline(resume, args.lines, args.repeat)
+    if args.suite in ("all", "sections"):
+        bench_sections(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+On-disk cache of parsed resume models.
+
+A profile's model depends only on the markdown and the parser code, so a
+template-only or config-only rebuild can load the model from disk instead of
+re-parsing. Entries are JSON files named by a SHA-256 over the package's parser
+sources, the profile name, and the markdown:
+
+  <cache_dir>/<key>.json
+
+Editing any module in the package changes every key, so stale models are
+never served; old entries are simply left behind and can be deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+MODEL_CACHE_VERSION = "2"
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _source_fingerprint() -> str:
+    digest = hashlib.sha256(MODEL_CACHE_VERSION.encode("utf-8"))
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(_PACKAGE_DIR).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class ModelCache:
+    """Parsed resume models keyed by package source, profile, and markdown hash."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = _source_fingerprint()
+
+    def key(self, profile: str, md: str) -> str:
+        return hashlib.sha256("\0".join((self.fingerprint, profile, md)).encode("utf-8")).hexdigest()
+
+    def get(self, profile: str, md: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self.cache_dir / f"{self.key(profile, md)}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, profile: str, md: str, model: Dict[str, Any]) -> None:
+        path = self.cache_dir / f"{self.key(profile, md)}.json"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(model, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # a cache that cannot be written just means the next build parses again
+
+
+def write_model(path: Path, model: Dict[str, Any]) -> None:
+    """Write a parsed model as pretty JSON for other tools to consume."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(model, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,133 @@
+"""
+dynamic-resume — Markdown -> standalone HTML resume, rendered with a release profile.
+
+Every release (v1 … v4) is a profile: its template plus the model shape that
+template expects. All profiles share one parser front end and one renderer.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from .batch import load_batch_manifest, run_batch
+from .cache import ModelCache, write_model
+from .engine import build_model, fill_template, load_template, placeholder_values, resolve_config
+from .profiles import DEFAULT_PROFILE, PROFILES, get_profile
+from .pdf import DEFAULT_CONCURRENCY, PAGE_FORMATS, PdfJob, export_pdfs
+from .report import print_size_report
+
+try:
+    from precompress import compress_files, print_summary, write_output
+except ImportError:  # optional: pip install -e scripts/utility/precompress
+    compress_files = print_summary = write_output = None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(
+        prog="dynamic-resume",
+        description="Render a Markdown resume to a standalone HTML page using a release profile.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  dynamic-resume resume.md index.html
+  dynamic-resume --profile v1 resume.md resume-v1.html
+  dynamic-resume resume.md index.html --config resume.config.json --model-cache .resume-cache
+  dynamic-resume resume.md index.html --minify --size-report
+  dynamic-resume resume.md index.html --prerender
+  dynamic-resume resume.md resume.html --pdf
+  dynamic-resume --batch resume.batch.json -j 4
+  dynamic-resume --list-profiles
+        """,
+    )
+    ap.add_argument("input_md", type=Path, nargs="?", help="Markdown resume file")
+    ap.add_argument("output_html", type=Path, nargs="?", help="Output standalone HTML file (optional with --emit-model)")
+    ap.add_argument("--profile", default=DEFAULT_PROFILE, help=f"Release profile (default: {DEFAULT_PROFILE}); see --list-profiles")
+    ap.add_argument("--list-profiles", action="store_true", help="List available profiles and exit")
+    ap.add_argument("--config", type=Path, default=None, help="JSON config (default: the profile's default)")
+    ap.add_argument("--template", type=Path, default=None, help="HTML template (default: the profile's packaged template)")
+    ap.add_argument("--batch", type=Path, default=None, metavar="MANIFEST", help="Render every job in a batch manifest")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help=f"Worker processes for --batch (default: CPU count); also caps concurrent PDF pages (default: {DEFAULT_CONCURRENCY})")
+    ap.add_argument("--model-cache", type=Path, default=None, metavar="DIR", help="Cache parsed resume models here; unchanged markdown skips parsing")
+    ap.add_argument("--emit-model", type=Path, default=None, metavar="PATH", help="Write the parsed resume model as JSON")
+    ap.add_argument("--minify", action="store_true", help="Strip comments and indentation from the template's HTML, CSS and JS")
+    ap.add_argument("--prerender", action="store_true", help="Write the initial view's markup into the page; the script only hydrates it (v2.3, v2.4)")
+    ap.add_argument("--size-report", action="store_true", help="Print the page size breakdown and gzip/brotli transfer sizes")
+    ap.add_argument("--pdf", action="store_true", help="Also print each page to PDF with headless Chromium; unchanged pages are skipped (requires playwright)")
+    ap.add_argument("--pdf-format", choices=PAGE_FORMATS, default="Letter", help="PDF paper size (default: Letter)")
+    ap.add_argument("--force-pdf", action="store_true", help="Re-print PDFs even when their HTML is unchanged")
+    ap.add_argument("--precompress", action="store_true", help="Also write .gz/.br sidecars (requires the precompress package)")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = build_parser()
+    args = ap.parse_args(argv)
+
+    if args.list_profiles:
+        for profile in PROFILES.values():
+            print(f"{profile.name:<6} {profile.template:<10} {profile.description}")
+        return
+
+    profile = get_profile(args.profile)
+
+    if args.prerender and profile.prerender is None and args.batch is None:
+        raise SystemExit(f"--prerender is not supported by profile {profile.name}")
+
+    if args.precompress and write_output is None:
+        raise SystemExit("--precompress requires the precompress package (pip install -e scripts/utility/precompress)")
+
+    model_cache = ModelCache(args.model_cache) if args.model_cache else None
+
+    if args.batch is not None:
+        jobs = load_batch_manifest(args.batch, default_profile=profile.name)
+        results = run_batch(jobs, workers=args.jobs, model_cache=model_cache,
+                            minify=args.minify, prerender=args.prerender)
+        if args.precompress:
+            # Once, after the pool: workers sharing an output directory would each rewrite its manifest
+            print_summary(compress_files([r["output"] for r in results if not r["error"]], jobs=args.jobs))
+        if args.pdf:
+            pdf_jobs = [PdfJob(job.output, job.pdf or job.output.with_suffix(".pdf"))
+                        for job, r in zip(jobs, results) if not r["error"]]
+            pdf_results = export_pdfs(pdf_jobs, args.pdf_format, args.jobs or DEFAULT_CONCURRENCY, args.force_pdf)
+            if any(r["status"] == "failed" for r in pdf_results):
+                raise SystemExit(1)
+        if any(r["error"] for r in results):
+            raise SystemExit(1)
+        return
+
+    if args.input_md is None or (args.output_html is None and args.emit_model is None):
+        ap.error("input_md and output_html are required unless --batch is given")
+
+    md = args.input_md.read_text(encoding="utf-8")
+    model, hit = build_model(profile, md, model_cache)
+    if model_cache is not None:
+        print(f"Model cache {'hit' if hit else 'miss'} ({args.model_cache})")
+
+    if args.emit_model is not None:
+        write_model(args.emit_model, model)
+        print(f"Wrote {args.emit_model}")
+    if args.output_html is None:
+        return
+
+    template = load_template(profile, args.template, minify=args.minify)
+    values = placeholder_values(profile, model, resolve_config(profile, args.config), args.prerender)
+    out = fill_template(template, values)
+
+    if args.precompress:
+        write_output(args.output_html, out, precompress=True)
+    else:
+        args.output_html.write_text(out, encoding="utf-8")
+    print(f"Wrote {args.output_html}")
+    if args.size_report:
+        print_size_report(out, template, values, load_template(profile, args.template) if args.minify else None)
+    if args.pdf:
+        pdf_results = export_pdfs([PdfJob(args.output_html, args.output_html.with_suffix(".pdf"))],
+                                  args.pdf_format, force=args.force_pdf)
+        if pdf_results[0]["status"] == "failed":
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Shared one-pass split of a markdown resume.
+
+Every profile starts from the same Document: the lines, the '# Name' heading,
+and the '## ' sections with their line ranges, found in a single scan. Profiles
+build their release-specific models from it instead of each rescanning the
+markdown for headings and section bodies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class Section:
+    """A '## ' section: the heading line index and the [start, end) body range."""
+
+    title: str
+    heading: int
+    start: int
+    end: int
+
+
+@dataclass
+class Document:
+    lines: List[str]
+    name: str = ""
+    name_line: int = -1
+    sections: List[Section] = field(default_factory=list)
+    index: Dict[str, List[Section]] = field(default_factory=dict)
+
+    def body(self, section: Section) -> List[str]:
+        """Raw lines under a section heading."""
+        return self.lines[section.start:section.end]
+
+    def section_lines(self, title: str) -> List[str]:
+        """Raw lines under every '## {title}' heading (case-insensitive), in order."""
+        out: List[str] = []
+        for sec in self.index.get(title.lower(), ()):
+            out.extend(self.lines[sec.start:sec.end])
+        return out
+
+    def sections_after(self, line: int) -> List[Section]:
+        """Sections whose heading is at or after the given line index."""
+        return [sec for sec in self.sections if sec.heading >= line]
+
+
+def parse_document(md: str) -> Document:
+    """
+    Split markdown into lines, the first '# ' heading, and '## ' sections in one pass.
+
+    Args:
+        md: Markdown resume text
+
+    Returns:
+        Document shared by every profile's model builder
+    """
+    lines = md.splitlines()
+    doc = Document(lines=lines)
+
+    heading = -1
+    for i, ln in enumerate(lines):
+        if ln.startswith("## "):
+            if heading >= 0:
+                doc.sections.append(Section(lines[heading][3:].strip(), heading, heading + 1, i))
+            heading = i
+        elif doc.name_line < 0 and ln.startswith("# "):
+            doc.name, doc.name_line = ln[2:].strip(), i
+    if heading >= 0:
+        doc.sections.append(Section(lines[heading][3:].strip(), heading, heading + 1, len(lines)))
+
+    for sec in doc.sections:
+        doc.index.setdefault(sec.title.lower(), []).append(sec)
+    return doc
@@ -0,0 +1,165 @@
+"""
+Build engine shared by every profile: parse once, fill a pre-parsed template.
+
+A template is parsed once into literal chunks and placeholder names, so filling
+it is a single join instead of one full-template str.replace per placeholder.
+Minification, when asked for, happens at that same one-time load.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import ModelCache
+from .document import parse_document
+from .minify import minify_template
+from .profiles import DEFAULT_PROFILE, Profile, get_profile
+
+# Alternating literal / placeholder chunks: (lit, name, lit, name, ..., lit)
+ParsedTemplate = Tuple[str, ...]
+
+
+def parse_template(text: str, placeholder_names: Tuple[str, ...]) -> ParsedTemplate:
+    """Split a template into literal chunks and placeholder names."""
+    pattern = re.compile("(" + "|".join(re.escape(p) for p in placeholder_names) + ")")
+    return tuple(pattern.split(text))
+
+
+def fill_template(parts: ParsedTemplate, values: Dict[str, str]) -> str:
+    """Substitute placeholder values into a parsed template in one pass."""
+    out = list(parts)
+    out[1::2] = [values[name] for name in parts[1::2]]
+    return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def _load_template(path: Path, placeholder_names: Tuple[str, ...], minify: bool) -> ParsedTemplate:
+    text = path.read_text(encoding="utf-8")
+    if minify:
+        text = minify_template(text)
+    return parse_template(text, placeholder_names)
+
+
+def load_template(profile: Profile, path: Optional[Path] = None, minify: bool = False) -> ParsedTemplate:
+    """
+    Read and parse a template once per process.
+
+    Args:
+        profile: Profile whose placeholders are substituted
+        path: Template file (default: the profile's packaged template)
+        minify: Strip comments and indentation from the template's HTML, CSS and JS
+
+    Returns:
+        Parsed template, cached by path and minify flag
+    """
+    path = Path(path).resolve() if path is not None else profile.template_path
+    try:
+        return _load_template(path, profile.placeholder_names, minify)
+    except OSError as e:
+        raise SystemExit(f"Failed to read template at {path}: {e}")
+
+
+def load_json(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception as e:
+        raise SystemExit(f"Failed to read JSON config at {path}: {e}")
+
+
+def resolve_config(profile: Profile, path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Pick the config for a build.
+
+    An explicit path wins; otherwise releases that read a config file from the
+    working directory (v2, v3) still do; otherwise the profile default applies.
+    Profiles that take no config (v1, v4) always get an empty dict.
+    """
+    if not profile.uses_config:
+        return {}
+    if path is not None:
+        return load_json(path)
+    if profile.config_file and Path(profile.config_file).exists():
+        return load_json(Path(profile.config_file))
+    return profile.default_config
+
+
+def build_model(profile: Profile, md: str, cache: Optional[ModelCache] = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Parse markdown into the profile's model, via the model cache when given.
+
+    Returns:
+        (model, hit) where hit is True when parsing was skipped
+    """
+    if cache is not None:
+        model = cache.get(profile.name, md)
+        if model is not None:
+            return model, True
+    model = profile.build_model(parse_document(md))
+    if cache is not None:
+        cache.put(profile.name, md, model)
+    return model, False
+
+
+def placeholder_values(profile: Profile, model: Dict[str, Any], config: Dict[str, Any], prerender: bool = False) -> Dict[str, str]:
+    """
+    Placeholder values for one page.
+
+    Args:
+        profile: Profile being rendered
+        model: Resume model
+        config: Resolved config
+        prerender: Write the initial view's markup into the page instead of leaving it to the script
+
+    Returns:
+        Values for every placeholder in the profile's template
+    """
+    values = profile.placeholders(model, config)
+    if prerender:
+        if profile.prerender is None:
+            raise SystemExit(f"Profile {profile.name} does not support pre-rendering")
+        values.update(profile.prerender(model, config))
+    return values
+
+
+def render(
+    profile: Profile,
+    model: Dict[str, Any],
+    config: Dict[str, Any],
+    template: ParsedTemplate,
+    prerender: bool = False,
+) -> str:
+    """Fill a parsed template with a model and config."""
+    return fill_template(template, placeholder_values(profile, model, config, prerender))
+
+
+def build_resume(
+    md: str,
+    profile: str = DEFAULT_PROFILE,
+    config: Optional[Dict[str, Any]] = None,
+    template: Optional[Path] = None,
+    minify: bool = False,
+    prerender: bool = False,
+) -> str:
+    """
+    Render markdown to a standalone HTML page.
+
+    Args:
+        md: Markdown resume text
+        profile: Release profile name
+        config: Config dict (default: the profile default)
+        template: Template file (default: the profile's packaged template)
+        minify: Minify the template before filling it
+        prerender: Server-render the initial view (profiles that support it)
+
+    Returns:
+        Rendered HTML
+    """
+    prof = get_profile(profile)
+    model, _ = build_model(prof, md)
+    if config is None:
+        config = prof.default_config if prof.uses_config else {}
+    return render(prof, model, config, load_template(prof, template, minify), prerender)
@@ -0,0 +1,108 @@
+"""
+Inline markdown rendering shared by every profile.
+
+HTML is escaped in one str.translate pass, then links, `code`, **bold** and
+*em* are rendered in a single left-to-right pass over one precompiled
+alternation. Lines with no inline markup skip the regex entirely. Code spans
+are literal (no bold/em inside them) and link URLs are never reformatted.
+Link, bold and em text is rendered recursively, so one level of bold inside
+em (`*a **b** c*`) and em inside bold (`**a *b* c**`) nest as expected.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Match
+
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
+_ATTR_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    '"': "&quot;",
+    "<": "&lt;",
+    ">": "&gt;",
+})
+
+# Alternation order matches the original pass order: links, code, bold, em.
+# Bold may contain *em* and em may contain **bold**; both are rendered again.
+INLINE_PATTERN = re.compile(
+    r"\[(?P<text>[^\]]+)\]\((?P<url>[^)]+)\)"
+    r"|`(?P<code>[^`]+)`"
+    r"|\*\*(?P<strong>(?:[^*]|\*[^*]+\*)+)\*\*"
+    r"|\*(?P<em>(?:[^*]|\*\*[^*]+\*\*)+)\*"
+)
+
+# Characters that can start an inline token; text without them skips the regex
+_MARKUP_CHARS = frozenset("[`*")
+
+LINK_ITEM_PATTERN = re.compile(r"-\s*(.+?)(?:\s*[:—-]\s*)(https?://\S+)\s*$")
+BARE_LINK_PATTERN = re.compile(r"-\s*(https?://\S+)\s*$")
+
+
+class InlineRenderer:
+    """Single-pass inline renderer; link_attrs is appended inside every <a> tag."""
+
+    def __init__(self, link_attrs: str):
+        self.link_attrs = link_attrs
+
+    def _token(self, m: Match[str]) -> str:
+        kind = m.lastgroup
+        if kind == "url":
+            return f'<a href="{m.group("url")}"{self.link_attrs}>{self.render(m.group("text"))}</a>'
+        if kind == "code":
+            return f"<code>{m.group('code')}</code>"
+        if kind == "strong":
+            return f"<strong>{self.render(m.group('strong'))}</strong>"
+        return f"<em>{self.render(m.group('em'))}</em>"
+
+    def render(self, escaped: str) -> str:
+        """Render inline markup in already-escaped text."""
+        if _MARKUP_CHARS.isdisjoint(escaped):
+            return escaped
+        return INLINE_PATTERN.sub(self._token, escaped)
+
+
+_new_tab_links = InlineRenderer(' target="_blank" rel="noopener noreferrer"')
+_same_tab_links = InlineRenderer(' rel="noopener"')
+
+
+def escape_html(s: str) -> str:
+    return s.translate(_ESCAPE_TABLE)
+
+
+def escape_attr(s: str) -> str:
+    return (s or "").translate(_ATTR_ESCAPE_TABLE)
+
+
+def md_inline(text: str) -> str:
+    """Very small, safe inline markdown: **bold**, *em*, `code`, and links [t](u)."""
+    return _new_tab_links.render(escape_html((text or "").strip()))
+
+
+def md_inline_to_html(text: str) -> str:
+    """v2 flavour of md_inline: no stripping, and links open in the same tab."""
+    return _same_tab_links.render(escape_html(text))
+
+
+def parse_links_block(lines: List[str]) -> List[Dict[str, str]]:
+    links = []
+    for ln in lines:
+        ln = ln.strip()
+        if not ln.startswith("-"):
+            continue
+        # "- Label: URL" OR "- Label — URL"
+        m = LINK_ITEM_PATTERN.match(ln)
+        if m:
+            links.append({"label": m.group(1).strip(), "url": m.group(2).strip()})
+        else:
+            # "- https://example.com"
+            m2 = BARE_LINK_PATTERN.match(ln)
+            if m2:
+                links.append({"label": m2.group(1).strip(), "url": m2.group(1).strip()})
+    return links
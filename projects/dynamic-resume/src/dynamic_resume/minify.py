@@ -0,0 +1,160 @@
+"""
+Conservative template minifier, applied once per template at load time.
+
+Only the template is minified; the model JSON substituted into it is already
+compact. The rules are deliberately narrow so they cannot change rendering or
+script behaviour:
+
+  markup  HTML comments dropped; whitespace runs containing a newline become a
+          single newline (HTML collapses them identically)
+  <style> comments dropped, whitespace collapsed, spaces around { } ; , > removed
+  <script> indentation and blank/comment-only lines dropped; line breaks kept so
+          automatic semicolon insertion is unaffected; lines inside multi-line
+          template literals are kept verbatim
+  <pre>, <textarea>, JSON data blocks: untouched
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+RAW_BLOCK_PATTERN = re.compile(r"(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)", re.S | re.I)
+HTML_COMMENT_PATTERN = re.compile(r"<!--(?!\[if).*?-->", re.S)
+NEWLINE_WS_PATTERN = re.compile(r"[ \t\r\f]*\n\s*")
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+CSS_WS_PATTERN = re.compile(r"\s+")
+CSS_PUNCT_PATTERN = re.compile(r"\s*([{};,>])\s*")
+WORD_PATTERN = re.compile(r"[A-Za-z_$][\w$]*|\d[\w.]*")
+REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw"}
+
+
+def minify_markup(text: str) -> str:
+    text = HTML_COMMENT_PATTERN.sub("", text)
+    return NEWLINE_WS_PATTERN.sub("\n", text)
+
+
+def minify_css(css: str) -> str:
+    css = CSS_COMMENT_PATTERN.sub("", css)
+    css = CSS_WS_PATTERN.sub(" ", css)
+    css = CSS_PUNCT_PATTERN.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _template_line_starts(js: str) -> List[bool]:
+    """
+    For each line, whether it starts inside a template literal.
+
+    A small scanner that tracks strings, comments, regex literals and ${...}
+    nesting, so backticks inside regexes or strings are not miscounted.
+    """
+    starts = [False]
+    mode = "code"
+    exprs: List[int] = []  # open-brace depth inside each enclosing ${...}
+    prev = ""  # last significant code character or word
+    i, n = 0, len(js)
+    while i < n:
+        c = js[i]
+        if c == "\n":
+            starts.append(mode == "tpl")
+            if mode == "line":
+                mode = "code"
+        elif mode == "code":
+            if c in "'\"":
+                mode = c
+            elif c == "`":
+                mode = "tpl"
+            elif c == "/" and js.startswith("//", i):
+                mode = "line"
+            elif c == "/" and js.startswith("/*", i):
+                mode, i = "block", i + 1
+            elif c == "/" and (not prev or prev in REGEX_PRECEDERS or prev in REGEX_KEYWORDS):
+                mode = "re"
+            elif c == "{" and exprs:
+                exprs[-1] += 1
+            elif c == "}" and exprs:
+                if exprs[-1]:
+                    exprs[-1] -= 1
+                else:
+                    exprs.pop()
+                    mode = "tpl"
+            if not c.isspace() and mode == "code":
+                m = WORD_PATTERN.match(js, i)
+                if m:
+                    prev, i = m.group(), m.end() - 1
+                else:
+                    prev = c
+            elif mode != "code":
+                prev = ""
+        elif mode == "tpl":
+            if c == "\\":
+                i += 1
+            elif c == "`":
+                mode, prev = "code", ")"
+            elif js.startswith("${", i):
+                exprs.append(0)
+                mode, prev, i = "code", "", i + 1
+        elif mode in "'\"":
+            if c == "\\":
+                i += 1
+            elif c == mode:
+                mode, prev = "code", ")"
+        elif mode == "re":
+            if c == "\\":
+                i += 1
+            elif c == "[":
+                mode = "re["
+            elif c == "/":
+                mode, prev = "code", ")"
+        elif mode == "re[":
+            if c == "\\":
+                i += 1
+            elif c == "]":
+                mode = "re"
+        elif mode == "block" and js.startswith("*/", i):
+            mode, i = "code", i + 1
+        i += 1
+    return starts
+
+
+def minify_js(js: str) -> str:
+    out = []
+    lines = js.split("\n")
+    starts = _template_line_starts(js) + [False]
+    for i, line in enumerate(lines):
+        if starts[i]:
+            # Part of a multi-line template literal: whitespace is string content
+            out.append(line)
+            continue
+        stripped = line.strip()
+        if not stripped or stripped.startswith("//"):
+            continue
+        out.append(line.lstrip() if starts[i + 1] else stripped)
+    return "\n" + "\n".join(out) + "\n"
+
+
+def minify_template(text: str) -> str:
+    """
+    Minify a template's markup, CSS and JavaScript.
+
+    Args:
+        text: Template source
+
+    Returns:
+        Minified template; placeholders are left intact
+    """
+    out = []
+    pos = 0
+    for m in RAW_BLOCK_PATTERN.finditer(text):
+        out.append(minify_markup(text[pos:m.start()]))
+        open_tag, tag, body, close_tag = m.groups()
+        tag = tag.lower()
+        if tag == "style":
+            body = minify_css(body)
+        elif tag == "script" and "json" not in open_tag.lower():
+            body = minify_js(body)
+        out.append(open_tag + body + close_tag)
+        pos = m.end()
+    out.append(minify_markup(text[pos:]))
+    return "".join(out)
@@ -0,0 +1,158 @@
+"""
+PDF export: print built resume pages with headless Chromium (Playwright).
+
+One browser is launched per export and every page is printed from it
+concurrently. A PDF is only re-printed when the HTML it came from (or the print
+options) changed: the SHA-256 of each source is kept in a small state file next
+to the PDFs, so an unchanged rebuild does not even start the browser.
+
+Requires the optional playwright package and its Chromium build:
+
+  pip install playwright && playwright install chromium
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # optional: pip install playwright && playwright install chromium
+    async_playwright = None
+
+PDF_STATE_FILE = ".resume-pdf.json"
+PAGE_FORMATS = ("Letter", "A4")
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class PdfJob:
+    html: Path
+    pdf: Path
+
+
+def pdf_options(page_format: str) -> Dict[str, Any]:
+    # Backgrounds on: the print stylesheet decides what is shown
+    return {"format": page_format, "print_background": True, "prefer_css_page_size": True}
+
+
+def source_digest(html: bytes, options: Dict[str, Any]) -> str:
+    """Hash of the page and the print options a PDF was rendered from."""
+    digest = hashlib.sha256(html)
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_state(directory: Path) -> Dict[str, str]:
+    try:
+        return json.loads((directory / PDF_STATE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(directory: Path, state: Dict[str, str]) -> None:
+    path = directory / PDF_STATE_FILE
+    try:
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # without state the next export just prints again
+
+
+async def _print_pages(todo: List[Tuple[PdfJob, Dict[str, Any]]], options: Dict[str, Any], concurrency: int) -> None:
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch()
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def print_one(job: PdfJob, result: Dict[str, Any]) -> None:
+            async with limit:
+                start = time.perf_counter()
+                page = None
+                try:
+                    page = await browser.new_page()
+                    await page.goto(job.html.resolve().as_uri(), wait_until="load")
+                    job.pdf.parent.mkdir(parents=True, exist_ok=True)
+                    await page.pdf(path=str(job.pdf), **options)
+                    result["status"] = "rendered"
+                except Exception as e:
+                    result.update(status="failed", error=f"{type(e).__name__}: {e}")
+                finally:
+                    if page is not None:
+                        try:
+                            await page.close()
+                        except Exception:
+                            pass  # the PDF (or the failure) is already recorded
+                    result["seconds"] = time.perf_counter() - start
+
+        try:
+            await asyncio.gather(*(print_one(job, result) for job, result in todo))
+        finally:
+            await browser.close()
+
+
+def export_pdfs(
+    jobs: List[PdfJob],
+    page_format: str = "Letter",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    force: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Print HTML pages to PDF, skipping pages whose source is unchanged.
+
+    Args:
+        jobs: (html, pdf) pairs; the HTML must already be written
+        page_format: Paper size, one of PAGE_FORMATS
+        concurrency: Pages printed at once from the shared browser
+        force: Print even when the source hash matches
+
+    Returns:
+        One result dict per job, in order; status is "rendered", "unchanged" or "failed"
+    """
+    start = time.perf_counter()
+    options = pdf_options(page_format)
+    states: Dict[Path, Dict[str, str]] = {}
+    results: List[Dict[str, Any]] = []
+    todo: List[Tuple[PdfJob, Dict[str, Any]]] = []
+    for job in jobs:
+        directory = job.pdf.resolve().parent
+        state = states.setdefault(directory, _read_state(directory))
+        digest = source_digest(job.html.read_bytes(), options)
+        result = {"pdf": job.pdf, "status": "unchanged", "error": None, "seconds": 0.0, "digest": digest}
+        results.append(result)
+        if force or not job.pdf.exists() or state.get(job.pdf.name) != digest:
+            todo.append((job, result))
+
+    if todo:
+        if async_playwright is None:
+            raise SystemExit("--pdf requires playwright (pip install 'dynamic-resume[pdf]' && playwright install chromium)")
+        asyncio.run(_print_pages(todo, options, concurrency))
+        for job, result in todo:
+            if result["status"] == "rendered":
+                states[job.pdf.resolve().parent][job.pdf.name] = result["digest"]
+        for directory, state in states.items():
+            _write_state(directory, state)
+
+    print_pdf_report(results, time.perf_counter() - start)
+    return results
+
+
+def print_pdf_report(results: List[Dict[str, Any]], wall: float) -> None:
+    """Print one line per PDF and a summary."""
+    for r in results:
+        if r["status"] == "failed":
+            print(f"FAILED {r['pdf']}: {r['error']}")
+        elif r["status"] == "rendered":
+            print(f"Wrote {r['pdf']} ({r['seconds'] * 1000:.0f}ms)")
+        else:
+            print(f"Unchanged {r['pdf']}")
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("rendered", "unchanged", "failed")}
+    print(f"PDF: {counts['rendered']} rendered, {counts['unchanged']} unchanged, {counts['failed']} failed "
+          f"in {wall * 1000:.0f}ms")
@@ -0,0 +1,25 @@
+"""Template profiles, one per resume release."""
+
+from typing import Dict
+
+from . import v1, v2, v3, v4
+from .base import TEMPLATES_DIR, Profile
+from .v2x import V2_1, V2_2, V2_3, V2_4
+
+PROFILES: Dict[str, Profile] = {
+    profile.name: profile
+    for profile in (v1.PROFILE, v2.PROFILE, V2_1, V2_2, V2_3, V2_4, v3.PROFILE, v4.PROFILE)
+}
+
+DEFAULT_PROFILE = "v2.4"
+
+
+def get_profile(name: str) -> Profile:
+    """Look up a profile by release name (e.g. "v2.4")."""
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise SystemExit(f"Unknown profile {name!r}; choose from: {', '.join(PROFILES)}")
+
+
+__all__ = ["DEFAULT_PROFILE", "PROFILES", "TEMPLATES_DIR", "Profile", "get_profile"]
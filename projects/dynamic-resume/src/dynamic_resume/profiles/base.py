@@ -0,0 +1,60 @@
+"""Profile definition: how one release turns a Document into a rendered page."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..document import Document
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+Model = Dict[str, Any]
+Config = Dict[str, Any]
+
+# Compact separators: the JSON ships inside the page on every visit
+JSON_SEPARATORS = (",", ":")
+
+
+def dump_json(obj: Any, ensure_ascii: bool = False) -> str:
+    """Serialize a model or config for embedding in a page."""
+    return json.dumps(obj, ensure_ascii=ensure_ascii, separators=JSON_SEPARATORS)
+
+
+@dataclass(frozen=True)
+class Profile:
+    """
+    A release's template and model shape.
+
+    Attributes:
+        name: Release name used on the command line (e.g. "v2.4")
+        description: One-line summary shown by --list-profiles
+        template: Template filename under dynamic_resume/templates
+        placeholder_names: Placeholders substituted in the template
+        build_model: Document -> JSON-serializable model (cacheable: no timestamps)
+        placeholders: (model, config) -> placeholder values
+        default_config: Config used when none is given; None if the release takes no config
+        config_file: Config filename picked up from the working directory when --config is omitted
+        prerender: (model, config) -> placeholder values carrying server-rendered markup,
+            used instead of the client-rendered defaults; None if the template cannot be pre-rendered
+    """
+
+    name: str
+    description: str
+    template: str
+    placeholder_names: Tuple[str, ...]
+    build_model: Callable[[Document], Model]
+    placeholders: Callable[[Model, Config], Dict[str, str]]
+    default_config: Optional[Config] = None
+    config_file: Optional[str] = None
+    prerender: Optional[Callable[[Model, Config], Dict[str, str]]] = None
+
+    @property
+    def template_path(self) -> Path:
+        return TEMPLATES_DIR / self.template
+
+    @property
+    def uses_config(self) -> bool:
+        return self.default_config is not None
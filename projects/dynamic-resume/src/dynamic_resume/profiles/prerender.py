@@ -0,0 +1,191 @@
+"""
+Server-side pre-rendering for the v2.3 template (profiles v2.3 and v2.4).
+
+The template normally renders the header, navigation, mobile drawer and
+sections in the browser from the embedded JSON, so nothing meaningful paints
+until the script has run. Pre-rendering emits the same markup for the initial
+view (config ui.defaultView) straight into the page; the script then only
+hydrates it (link handlers, active-section observer) and keeps rendering
+client-side for the short/full view toggle.
+
+Each function mirrors its counterpart in the template's script (render,
+buildPageHeader, buildShortModel, slugify) and must be kept in step with it.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from typing import Any, Dict, List
+
+from ..inline import escape_html
+from .base import Config, Model
+
+SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+STATIC_PLACEHOLDER_NAMES = (
+    "__BRAND_NAME__",
+    "__HEAD_HTML__",
+    "__NAV_HTML__",
+    "__DRAWER_HTML__",
+    "__PANEL_HTML__",
+    "__PRERENDERED_VIEW__",
+)
+
+# Values for a client-rendered page: empty containers, filled by the script
+CLIENT_RENDERED: Dict[str, str] = {
+    "__BRAND_NAME__": "Navigation",
+    "__HEAD_HTML__": "",
+    "__NAV_HTML__": "",
+    "__DRAWER_HTML__": "",
+    "__PANEL_HTML__": "",
+    "__PRERENDERED_VIEW__": "",
+}
+
+HOME_LINK = '<a href="#"><span>Home</span></a>'
+CONTACT_SEPARATOR = '<span class="dot" aria-hidden="true">•</span>'
+DRAWER_STYLE = "box-shadow: none; border: 1px solid var(--border); background: var(--card);"
+
+
+def _esc(s: Any) -> str:
+    return escape_html(s or "")
+
+
+def slugify(s: str) -> str:
+    return SLUG_PATTERN.sub("-", (s or "").lower().replace("&", "and")).strip("-")
+
+
+def _keep(value: Any, default: int) -> int:
+    # JS `??`: only a missing/null value falls back
+    return default if value is None else value
+
+
+def build_short_model(full: Model, config: Config) -> Model:
+    """The short view: configured sections, trimmed work history, earlier experience summary."""
+    short_view = config.get("shortView") or {}
+    out = copy.deepcopy(full)
+    rules = short_view.get("sections") or {}
+    include = {s.lower() for s in rules.get("include") or []}
+    exclude = {s.lower() for s in rules.get("exclude") or []}
+
+    def wanted(sec: Dict[str, Any]) -> bool:
+        name = (sec.get("title") or "").lower()
+        return name not in exclude and (not include or name in include)
+
+    out["sections"] = [sec for sec in out["sections"] if wanted(sec)]
+
+    we = next((s for s in out["sections"] if (s.get("title") or "").lower() == "work experience"), None)
+    if we is not None and isinstance(we.get("items"), list):
+        work = short_view.get("workExperience") or {}
+        keep_n = _keep(work.get("jobsToKeep"), 3)
+        keep_b = _keep(work.get("bulletsPerJob"), 3)
+        kept = []
+        for job in we["items"][:keep_n]:
+            job = dict(job)
+            if isinstance(job.get("bullets"), list):
+                job["bullets"] = job["bullets"][:keep_b]
+            kept.append(job)
+        dropped = we["items"][keep_n:]
+        we["items"] = kept
+
+        earlier = short_view.get("earlierExperience") or {}
+        if earlier.get("enabled") and dropped:
+            companies = list(dict.fromkeys(d["company"] for d in dropped if d.get("company")))
+            max_c = _keep(earlier.get("maxCompanies"), 8)
+            more = f" +{len(companies) - max_c} more" if len(companies) > max_c else ""
+            we["items"].append({
+                "kind": "earlier",
+                "role": earlier.get("label") or "Earlier Experience",
+                "company": " • ".join(companies[:max_c]) + more,
+                "location": "",
+                "dates": "",
+                "description": "",
+                "bullets": [],
+            })
+
+    return out
+
+
+def render_page_header(model: Model) -> str:
+    location = _esc(model.get("location"))
+    email = _esc(model.get("email"))
+    contact = []
+    if location:
+        contact.append(f"<span>{location}</span>")
+    if email:
+        contact.append(f'<a href="mailto:{email}">{email}</a>')
+    return (
+        '<section class="card headcard" aria-labelledby="resumeName"><div class="headgrid"><div>'
+        f'<h1 id="resumeName" class="h1">{_esc(model.get("name"))}</h1>'
+        f'<div class="contact" aria-label="Contact information">{CONTACT_SEPARATOR.join(contact)}</div>'
+        "</div></div></section>"
+    )
+
+
+def render_nav(sections: List[Dict[str, Any]]) -> str:
+    return HOME_LINK + "".join(f'<a href="#{sec["id"]}"><span>{_esc(sec.get("title"))}</span></a>' for sec in sections)
+
+
+def _render_job(job: Dict[str, Any], collapse: bool) -> str:
+    title = _esc(job.get("role") or "Earlier Experience") if job.get("kind") == "earlier" else _esc(job.get("role"))
+    company = _esc(job.get("company"))
+    loc = _esc(job.get("location"))
+    dates = _esc(job.get("dates"))
+    sub = f" · {loc}{' · ' if loc and dates else ''}{dates}" if loc or dates else ""
+    desc = ""
+    if job.get("description"):
+        desc = (
+            f'<details{"" if collapse else " open"}><summary>About {company or "this company"}</summary>'
+            f'<p class="small">{_esc(job["description"])}</p></details>'
+        )
+    bullets = job.get("bullets") or []
+    items = f"<ul>{''.join(f'<li>{b}</li>' for b in bullets)}</ul>" if bullets else ""
+    return (
+        f'<div class="card"><div class="row"><div><div style="font-weight:850">{title}</div>'
+        f'<div class="small">{company}{sub}</div></div></div>{desc}{items}</div>'
+        '<div style="height: 10px;"></div>'
+    )
+
+
+def render_panel(sections: List[Dict[str, Any]], config: Config) -> str:
+    collapse = bool((config.get("ui") or {}).get("collapseCompanyDescriptionsByDefault"))
+    out = []
+    for sec in sections:
+        body = ""
+        if sec.get("kind") == "text":
+            body = sec.get("html") or ""
+        elif sec.get("kind") == "work":
+            body = "".join(_render_job(job, collapse) for job in sec.get("items") or [])
+        out.append(f'<section id="{sec["id"]}" tabindex="-1"><h2>{_esc(sec.get("title"))}</h2>{body}</section>')
+    return "".join(out)
+
+
+def prerender(model: Model, config: Config) -> Dict[str, str]:
+    """
+    Render the initial view's markup into the template's static placeholders.
+
+    Args:
+        model: v2.3/v2.4 resume model
+        config: Resolved config (ui.defaultView picks the view)
+
+    Returns:
+        Values for STATIC_PLACEHOLDER_NAMES
+    """
+    ui = config.get("ui") or {}
+    view = ui.get("defaultView") or "short"
+    shown = build_short_model(model, config) if view == "short" else model
+    sections = [{**sec, "id": slugify(sec.get("title") or "")} for sec in shown["sections"]]
+    nav = render_nav(sections) if ui.get("enableNav") else ""
+    meta = _esc(" · ".join(v for v in (shown.get("location"), shown.get("email")) if v))
+    drawer = (
+        f'<div class="brand" style="{DRAWER_STYLE}"><div class="name">{_esc(shown.get("name"))}</div>'
+        f'<div class="meta">{meta}</div><div class="navlinks" id="mNav">{nav}</div></div>'
+    )
+    return {
+        "__BRAND_NAME__": _esc(ui.get("sidebarTitle") or "Navigation"),
+        "__HEAD_HTML__": render_page_header(shown),
+        "__NAV_HTML__": nav,
+        "__DRAWER_HTML__": drawer,
+        "__PANEL_HTML__": render_panel(sections, config),
+        "__PRERENDERED_VIEW__": _esc(view),
+    }
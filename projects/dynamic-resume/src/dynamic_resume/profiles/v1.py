@@ -0,0 +1,223 @@
+"""
+v1 profile: fixed sections (Links, Summary, Work Experience, Education, Skills)
+parsed into a structured model with grouped job bullets.
+
+The Markdown must follow the same *structure* as the provided example:
+  - '# Name' on first line
+  - '## Links', '## Summary', '## Work Experience', '## Education', '## Skills'
+  - Jobs start with '### <Role Title>' and bullets use '- '.
+"""
+
+from __future__ import annotations
+
+import datetime
+import html
+import re
+from typing import Dict, List
+
+from ..document import Document
+from .base import Config, Model, Profile, dump_json
+
+LINK_PATTERN = re.compile(r"-\s+([^:]+):\s+(.*)$")
+DATES_PATTERN = re.compile(r"\d{2}/\d{4}")
+GROUP_PATTERN = re.compile(r"\*\*(.+?)\:\*\*")
+SKILL_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+
+
+def build_model(doc: Document) -> Model:
+    lines = doc.lines
+    i = 0
+    name = ""
+    contact_lines: List[str] = []
+    meta_bullets: List[str] = []
+    links: List[Dict[str, str]] = []
+    summary = ""
+    work: List[Dict] = []
+    education_lines: List[str] = []
+    skills: Dict[str, str] = {}
+
+    # Name
+    if lines and lines[0].startswith("# "):
+        name = lines[0][2:].strip()
+        i = 1
+    if not name:
+        raise SystemExit("Could not parse resume name; expected first line like '# First Last'.")
+
+    # Contact lines until blank
+    while i < len(lines) and lines[i].strip() != "":
+        contact_lines.append(lines[i].strip())
+        i += 1
+
+    # Skip blanks
+    while i < len(lines) and lines[i].strip() == "":
+        i += 1
+
+    # Meta bullets (e.g., citizenship/relocation)
+    while i < len(lines) and lines[i].lstrip().startswith("- "):
+        meta_bullets.append(lines[i].lstrip()[2:].strip())
+        i += 1
+
+    def parse_links(start: int):
+        found = []
+        j = start
+        while j < len(lines):
+            if lines[j].startswith("## "):
+                break
+            m = LINK_PATTERN.match(lines[j].strip())
+            if m:
+                found.append({"label": m.group(1).strip(), "url": m.group(2).strip()})
+            j += 1
+        return found, j
+
+    def parse_summary(start: int):
+        j = start
+        txt = []
+        while j < len(lines) and not lines[j].startswith("## "):
+            if lines[j].strip() != "":
+                txt.append(lines[j].strip())
+            j += 1
+        return " ".join(txt).strip(), j
+
+    def parse_work(start: int):
+        jobs = []
+        j = start
+        while j < len(lines):
+            if lines[j].startswith("## ") and not lines[j].startswith("## Work Experience"):
+                break
+            if lines[j].startswith("### "):
+                job = {"title": lines[j][4:].strip(), "company": "", "location": "", "dates": "", "company_desc": "", "groups": []}
+                j += 1
+
+                while j < len(lines) and lines[j].strip() == "":
+                    j += 1
+                if j < len(lines) and "**" in lines[j]:
+                    job["company"] = lines[j].replace("**", "").strip()
+                    j += 1
+                if j < len(lines) and lines[j].strip() != "":
+                    job["location"] = lines[j].strip()
+                    j += 1
+                if j < len(lines) and DATES_PATTERN.search(lines[j]):
+                    job["dates"] = lines[j].strip()
+                    j += 1
+
+                # Company description paragraph
+                while j < len(lines) and lines[j].strip() == "":
+                    j += 1
+                desc = []
+                while j < len(lines):
+                    line = lines[j].strip()
+                    if line == "":
+                        j += 1
+                        break
+                    if line.startswith("**") and line.endswith(":**"):
+                        break
+                    if line.startswith("---") or line.startswith("### ") or line.startswith("## "):
+                        break
+                    desc.append(line)
+                    j += 1
+                job["company_desc"] = " ".join(desc).strip()
+
+                heading, bullets = None, []
+                while j < len(lines):
+                    line = lines[j].rstrip()
+                    if line.startswith("---"):
+                        j += 1
+                        break
+                    if line.startswith("### ") or line.startswith("## "):
+                        break
+                    m = GROUP_PATTERN.match(line.strip())
+                    if m:
+                        if heading or bullets:
+                            job["groups"].append({"heading": heading, "bullets": bullets})
+                        heading, bullets = m.group(1).strip(), []
+                        j += 1
+                        continue
+                    if line.lstrip().startswith("- "):
+                        bullets.append(line.lstrip()[2:].strip())
+                        j += 1
+                        continue
+                    j += 1
+                if heading or bullets:
+                    job["groups"].append({"heading": heading, "bullets": bullets})
+
+                jobs.append(job)
+            else:
+                j += 1
+        return jobs, j
+
+    def parse_education(start: int):
+        j = start
+        ed = []
+        while j < len(lines) and not lines[j].startswith("## "):
+            if lines[j].strip() != "":
+                ed.append(lines[j].rstrip())
+            j += 1
+        return ed, j
+
+    def parse_skills(start: int):
+        j = start
+        found = {}
+        while j < len(lines) and not lines[j].startswith("## "):
+            line = lines[j].strip()
+            m = SKILL_PATTERN.match(line)
+            if m:
+                key = m.group(1).strip()
+                j += 1
+                while j < len(lines) and lines[j].strip() == "":
+                    j += 1
+                if j < len(lines) and not lines[j].startswith("**") and not lines[j].startswith("## "):
+                    found[key] = lines[j].strip()
+            j += 1
+        return found, j
+
+    # Dispatch on section headings from the shared index instead of walking every line
+    for sec in doc.sections:
+        if sec.heading < i:
+            continue
+        heading = lines[sec.heading]
+        if heading.startswith("## Links"):
+            links, i = parse_links(sec.start)
+        elif heading.startswith("## Summary"):
+            summary, i = parse_summary(sec.start)
+        elif heading.startswith("## Work Experience"):
+            work, i = parse_work(sec.start)
+        elif heading.startswith("## Education"):
+            education_lines, i = parse_education(sec.start)
+        elif heading.startswith("## Skills"):
+            skills, i = parse_skills(sec.start)
+
+    return {
+        "name": name,
+        "contact": contact_lines,
+        "meta": meta_bullets,
+        "links": links,
+        "summary": summary,
+        "work": work,
+        "education": education_lines,
+        "skills": skills,
+    }
+
+
+def safe_json_for_script(obj) -> str:
+    s = dump_json(obj)
+    # Prevent accidentally closing the <script> tag.
+    return s.replace("</", "<\\/")
+
+
+def placeholders(model: Model, config: Config) -> Dict[str, str]:
+    # The build timestamp is added at render time so cached models stay valid
+    data = {**model, "generated_at": datetime.datetime.now().isoformat(timespec="seconds")}
+    return {
+        "__NAME__": html.escape(model["name"]),
+        "__JSON__": safe_json_for_script(data),
+    }
+
+
+PROFILE = Profile(
+    name="v1",
+    description="Original fixed-section layout with grouped job bullets (takes no config)",
+    template="v1.html",
+    placeholder_names=("__NAME__", "__JSON__"),
+    build_model=build_model,
+    placeholders=placeholders,
+)
@@ -0,0 +1,216 @@
+"""
+v2 profile: structured Work Experience jobs plus HTML-rendered text sections.
+
+The Links section is lifted out of the section list into the header card.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List
+
+from ..document import Document
+from ..inline import md_inline_to_html
+from .base import Model, Profile
+from .v2x import PLACEHOLDER_NAMES, placeholders
+
+BULLET_PATTERN = re.compile(r"^\s*-\s+(.*)$")
+DATES_PATTERN = re.compile(r"\d{2}/\d{4}")
+LINK_PATTERN = re.compile(r"^\s*-\s+([^:]+):\s*(\S+)\s*$")
+
+
+def md_block_to_html(lines: List[str]) -> str:
+    """
+    Minimal block Markdown renderer for the non-Work sections:
+    - paragraphs
+    - unordered lists
+    - horizontal rule (---)
+    """
+    out: List[str] = []
+    buf: List[str] = []
+
+    def flush_paragraph():
+        nonlocal buf
+        if buf:
+            out.append("<p>" + md_inline_to_html(" ".join(buf).strip()) + "</p>")
+            buf = []
+
+    i = 0
+    while i < len(lines):
+        line = lines[i].rstrip()
+
+        if not line.strip():
+            flush_paragraph()
+            i += 1
+            continue
+
+        if line.strip() == "---":
+            flush_paragraph()
+            out.append("<hr />")
+            i += 1
+            continue
+
+        if BULLET_PATTERN.match(line):
+            flush_paragraph()
+            items = []
+            while i < len(lines):
+                m2 = BULLET_PATTERN.match(lines[i].rstrip())
+                if not m2:
+                    break
+                items.append("<li>" + md_inline_to_html(m2.group(1).strip()) + "</li>")
+                i += 1
+            out.append("<ul>" + "".join(items) + "</ul>")
+            continue
+
+        # default: paragraph line
+        buf.append(line.strip())
+        i += 1
+
+    flush_paragraph()
+    return "\n".join(out)
+
+
+def _parse_section(title: str, raw_lines: List[str]) -> Dict[str, Any]:
+    if title.lower() == "work experience":
+        return _parse_work_experience(title, raw_lines)
+    # Everything else: minimal markdown blocks
+    html = md_block_to_html([ln for ln in raw_lines if not ln.strip().startswith("<!--")])
+    return {"title": title, "kind": "text", "html": html, "items": []}
+
+
+def _parse_work_experience(title: str, raw_lines: List[str]) -> Dict[str, Any]:
+    jobs: List[Dict[str, Any]] = []
+
+    # Split by "### " role headings
+    current_role = None
+    cur: List[str] = []
+
+    def flush():
+        nonlocal current_role, cur
+        if current_role:
+            jobs.append(_parse_job(current_role, cur))
+        current_role = None
+        cur = []
+
+    for ln in raw_lines:
+        if ln.startswith("### "):
+            flush()
+            current_role = ln[4:].strip()
+        else:
+            if current_role is not None:
+                cur.append(ln.rstrip())
+
+    flush()
+
+    return {"title": title, "kind": "work", "html": "", "items": jobs}
+
+
+def _parse_job(role: str, lines: List[str]) -> Dict[str, Any]:
+    # Expected pattern:
+    # **Company**
+    # Location
+    # 05/2023 – 12/2025
+    # [optional blank]
+    # Company description sentence(s).
+    # Then bullets grouped under subheadings.
+    company = ""
+    location = ""
+    dates = ""
+    description_lines: List[str] = []
+    bullets: List[str] = []
+
+    i = 0
+
+    # company line
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    if i < len(lines) and lines[i].strip().startswith("**") and lines[i].strip().endswith("**"):
+        company = lines[i].strip().strip("*").strip()
+        i += 1
+
+    # location line
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    if i < len(lines) and lines[i].strip() and not lines[i].strip().startswith(("**", "-", "####", "###")):
+        location = lines[i].strip()
+        i += 1
+
+    # dates line
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    if i < len(lines) and DATES_PATTERN.search(lines[i]):
+        dates = lines[i].strip()
+        i += 1
+
+    # description until first heading/bullet
+    while i < len(lines):
+        ln = lines[i].strip()
+        if ln.startswith(("**", "####", "- ")):
+            break
+        if ln:
+            description_lines.append(ln)
+        i += 1
+
+    # bullets: include subheadings as bold labels inside list items (rendered inline)
+    while i < len(lines):
+        m = BULLET_PATTERN.match(lines[i].rstrip())
+        if m:
+            bullets.append(md_inline_to_html(m.group(1).strip()))
+        i += 1
+
+    return {
+        "role": role,
+        "company": company,
+        "location": location,
+        "dates": dates,
+        "description": " ".join(description_lines).strip(),
+        "bullets": bullets,
+        "kind": "job",
+    }
+
+
+def build_model(doc: Document) -> Model:
+    lines = doc.lines
+
+    # Rough header parsing: look for a line like "Bel Air, MD | Tucson, AZ" then email
+    location = ""
+    email = ""
+    for ln in lines[:25]:
+        if "|" in ln and "http" not in ln and "##" not in ln and "claytor" not in ln:
+            location = ln.strip()
+        if "@" in ln and " " not in ln and ln.strip().count("@") == 1:
+            email = ln.strip()
+
+    sections = [_parse_section(sec.title, doc.body(sec)) for sec in doc.sections if sec.title]
+
+    # Lift the first Links section into structured links; the header card renders them
+    links: List[Dict[str, str]] = []
+    for i, sec in enumerate(sections):
+        if sec["title"].lower() == "links":
+            block = next((s for s in doc.sections if s.title == "Links"), None)
+            for ln in doc.body(block) if block else ():
+                m = LINK_PATTERN.match(ln)
+                if m:
+                    links.append({"label": m.group(1).strip(), "url": m.group(2).strip()})
+            del sections[i]
+            break
+
+    return {
+        "name": doc.name,
+        "location": location,
+        "email": email,
+        "links": links,
+        "sections": sections,
+    }
+
+
+PROFILE = Profile(
+    name="v2",
+    description="Structured work history, links in the header card",
+    template="v2.html",
+    placeholder_names=PLACEHOLDER_NAMES,
+    build_model=build_model,
+    placeholders=placeholders,
+    default_config={},
+    config_file="resume.config.json",
+)
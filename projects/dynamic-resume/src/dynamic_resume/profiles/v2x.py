@@ -0,0 +1,277 @@
+"""
+v2.1–v2.4 profiles: a small JSON model of HTML-rendered sections.
+
+The four releases share one parser. They differ in how the Links section is
+rendered (v2.1/v2.2 link the label; v2.3/v2.4 show "Label — URL"), in their
+default config, and in their template.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List
+
+from ..document import Document
+from ..inline import escape_attr, md_inline, parse_links_block
+from .base import Config, Model, Profile, dump_json
+from .prerender import CLIENT_RENDERED, STATIC_PLACEHOLDER_NAMES, prerender
+
+COMPANY_LINE_PATTERN = re.compile(r"^\*\*.+\*\*\s*$")
+
+
+def md_block_to_html(lines: List[str]) -> str:
+    """Minimal block markdown: paragraphs, bullets, ### headings, **company** lines."""
+    html: List[str] = []
+    buf: List[str] = []
+    ul_open = False
+
+    def flush_paragraph():
+        nonlocal buf, html
+        if buf:
+            html.append("<p>" + md_inline(" ".join(buf).strip()) + "</p>")
+            buf = []
+
+    def close_ul():
+        nonlocal ul_open, html
+        if ul_open:
+            html.append("</ul>")
+            ul_open = False
+
+    for raw in lines:
+        ln = raw.rstrip()
+        if not ln.strip():
+            flush_paragraph()
+            close_ul()
+            continue
+
+        if ln.startswith("### "):
+            flush_paragraph()
+            close_ul()
+            html.append(f"<h3>{md_inline(ln[4:].strip())}</h3>")
+            continue
+
+        if ln.strip().startswith("- "):
+            flush_paragraph()
+            if not ul_open:
+                html.append("<ul>")
+                ul_open = True
+            html.append("<li>" + md_inline(ln.strip()[2:].strip()) + "</li>")
+            continue
+
+        # Bold-only company line like **Company**
+        if COMPANY_LINE_PATTERN.match(ln.strip()):
+            flush_paragraph()
+            close_ul()
+            company = ln.strip().strip("*").strip()
+            html.append(f"<div class=\"companyline\"><strong>{md_inline(company)}</strong></div>")
+            continue
+
+        buf.append(ln.strip())
+
+    flush_paragraph()
+    close_ul()
+    return "\n".join(html).strip()
+
+
+def _linked_label(link: Dict[str, str]) -> str:
+    return f'<li><a href="{escape_attr(link["url"])}" target="_blank" rel="noopener noreferrer">{md_inline(link["label"])}</a></li>'
+
+
+def _label_dash_url(link: Dict[str, str]) -> str:
+    # Format: "Label - URL" where URL is the clickable link
+    return f'<li>{md_inline(link["label"])} — <a href="{escape_attr(link["url"])}" target="_blank" rel="noopener noreferrer">{escape_attr(link["url"])}</a></li>'
+
+
+def _model_builder(links_kind: bool, link_item):
+    def build_model(doc: Document) -> Model:
+        """
+        Parse the resume into a small JSON model consumed by the template.
+
+        Expected structure (loose):
+          # Name
+          Location line
+          Email line (or anything containing '@')
+          ## Links
+          - Label: URL
+          ## Summary / ## Work Experience / ...
+        """
+        lines = doc.lines
+
+        # Location/email in the next few non-empty lines after the name
+        location = ""
+        email = ""
+        i = doc.name_line + 1 if doc.name_line >= 0 else len(lines)
+        scan = 0
+        while i < len(lines) and scan < 12:
+            ln = lines[i].strip()
+            if ln.startswith("## "):
+                break
+            if ln and not ln.startswith("-"):
+                if "@" in ln and not email:
+                    email = ln.strip()
+                elif not location and "@" not in ln:
+                    location = ln.strip()
+            i += 1
+            scan += 1
+
+        sections: List[Dict[str, Any]] = []
+        for sec in doc.sections:
+            if not sec.title:
+                continue
+            is_links = sec.title.lower() == "links"
+            sections.append({
+                "title": sec.title,
+                "kind": "links" if links_kind and is_links else "text",
+                "html": md_block_to_html(doc.body(sec)),
+                "items": [],
+            })
+
+        # Links come from the raw lines of every Links section, via the document index
+        links: List[Dict[str, str]] = []
+        if "links" in doc.index:
+            links = parse_links_block(doc.section_lines("Links"))
+            items = [link_item(link) for link in links]
+            links_html = "<ul>" + "".join(items) + "</ul>" if items else ""
+            for sec in sections:
+                if sec["title"].lower() == "links":
+                    sec["html"] = links_html
+
+        return {
+            "name": doc.name,
+            "location": location,
+            "email": email,
+            "links": links,
+            "sections": sections,
+        }
+
+    return build_model
+
+
+def placeholders(model: Model, config: Config) -> Dict[str, str]:
+    return {
+        "__DATA_JSON__": dump_json(model),
+        "__CONFIG_JSON__": dump_json(config),
+        "__TITLE__": model.get("name") or "Resume",
+    }
+
+
+def _v2_3_placeholders(model: Model, config: Config) -> Dict[str, str]:
+    return {**placeholders(model, config), **CLIENT_RENDERED}
+
+
+PLACEHOLDER_NAMES = ("__DATA_JSON__", "__CONFIG_JSON__", "__TITLE__")
+V2_3_PLACEHOLDER_NAMES = PLACEHOLDER_NAMES + STATIC_PLACEHOLDER_NAMES
+
+V2_1_DEFAULT_CONFIG: Config = {
+    "ui": {"defaultView": "short", "sidebarTitle": "Navigation"},
+    "shortView": {"workExperience": {"jobsToKeep": 3, "bulletsPerJob": 3}},
+    "companyDescriptions": {"collapsedByDefault": True},
+}
+
+
+def full_default_config(enable_search: bool) -> Config:
+    """Default config that enables all UI features (v2.2+)."""
+    return {
+        "meta": {
+            "generator": "resume-cleanroom",
+            "version": "1.1"
+        },
+        "ui": {
+            "defaultTheme": "system",
+            "enableThemeToggle": True,
+            "enableSearch": enable_search,
+            "enableNav": True,
+            "enableViewToggle": True,
+            "defaultView": "short",
+            "rememberView": True,
+            "rememberTheme": True,
+            "collapseCompanyDescriptionsByDefault": True,
+            "smoothScroll": True
+        },
+        "shortView": {
+            "workExperience": {
+                "jobsToKeep": 3,
+                "bulletsPerJob": 3,
+                "keepRoleHeadings": True,
+                "keepCompanyLine": True,
+                "keepDatesLine": True
+            },
+            "sections": {
+                "include": [
+                    "Summary",
+                    "Work Experience",
+                    "Skills",
+                    "Education",
+                    "Links"
+                ],
+                "exclude": []
+            },
+            "earlierExperience": {
+                "enabled": True,
+                "label": "Earlier Experience",
+                "format": "inline",
+                "maxCompanies": 8
+            }
+        },
+        "search": {
+            "minQueryLength": 2,
+            "highlightMatches": True,
+            "fields": [
+                "Summary",
+                "Work Experience",
+                "Skills",
+                "Education"
+            ]
+        },
+        "accessibility": {
+            "reduceMotionRespectsPreference": True,
+            "focusVisible": True,
+            "skipLink": True
+        }
+    }
+
+
+_classic_model = _model_builder(links_kind=True, link_item=_linked_label)
+_dash_model = _model_builder(links_kind=False, link_item=_label_dash_url)
+
+V2_1 = Profile(
+    name="v2.1",
+    description="Configurable template; Links section lists linked labels",
+    template="v2.1.html",
+    placeholder_names=PLACEHOLDER_NAMES,
+    build_model=_classic_model,
+    placeholders=placeholders,
+    default_config=V2_1_DEFAULT_CONFIG,
+)
+
+V2_2 = Profile(
+    name="v2.2",
+    description="v2.1 with the full UI default config (search enabled)",
+    template="v2.1.html",
+    placeholder_names=PLACEHOLDER_NAMES,
+    build_model=_classic_model,
+    placeholders=placeholders,
+    default_config=full_default_config(enable_search=True),
+)
+
+V2_3 = Profile(
+    name="v2.3",
+    description="Home nav item, \"Label — URL\" links, search disabled by default",
+    template="v2.3.html",
+    placeholder_names=V2_3_PLACEHOLDER_NAMES,
+    build_model=_dash_model,
+    placeholders=_v2_3_placeholders,
+    default_config=full_default_config(enable_search=False),
+    prerender=prerender,
+)
+
+V2_4 = Profile(
+    name="v2.4",
+    description="Current release (same template and model as v2.3)",
+    template="v2.3.html",
+    placeholder_names=V2_3_PLACEHOLDER_NAMES,
+    build_model=_dash_model,
+    placeholders=_v2_3_placeholders,
+    default_config=full_default_config(enable_search=False),
+    prerender=prerender,
+)
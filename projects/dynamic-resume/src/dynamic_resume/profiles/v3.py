@@ -0,0 +1,146 @@
+"""
+v3 profile: raw section bodies plus structured links and jobs, rendered client-side.
+
+The template receives {"model": ..., "config": ...} as one JSON payload.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict
+
+from ..document import Document
+from .base import Config, Model, Profile, dump_json
+
+EMAIL_PATTERN = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b")
+LINK_PATTERN = re.compile(r"^\s*-\s*([^:]+?)\s*:\s*(https?://\S+)\s*$", re.M)
+ROLE_SPLIT_PATTERN = re.compile(r"^\s*###\s+", re.M)
+COMPANY_PATTERN = re.compile(r"^\s*\*\*(.+?)\*\*\s*$", re.M)
+COMPANY_LINE_PATTERN = re.compile(r"^\*\*.+\*\*$")
+GROUP_HEADING_LINE_PATTERN = re.compile(r"^\*\*.+\*\*:\s*$")
+DESCRIPTION_PATTERN = re.compile(r"^\s*([A-Z][^\n]{20,})\s*$", re.M)
+GROUP_PATTERN = re.compile(r"^\s*\*\*([^*]+?)\*\*:\s*$", re.M)
+ITEM_PATTERN = re.compile(r"^\s*-\s+(.*)\s*$", re.M)
+
+
+def _parse_job(p: str) -> Dict:
+    plines = p.splitlines()
+    job_title = plines[0].strip()
+    rest = "\n".join(plines[1:]).strip("\n")
+
+    mco = COMPANY_PATTERN.search(rest)
+    company = mco.group(1).strip() if mco else ""
+
+    # simplistic location/dates extraction
+    location, dates = "", ""
+    rlines = [l.strip() for l in rest.splitlines()]
+    # find company line index
+    start = 0
+    for k, l in enumerate(rlines):
+        if COMPANY_LINE_PATTERN.match(l):
+            start = k + 1
+            break
+    next_lines = []
+    for k in range(start, len(rlines)):
+        t = rlines[k]
+        if not t:
+            continue
+        if GROUP_HEADING_LINE_PATTERN.match(t):
+            break
+        if " is " in t and len(t) > 40 and t.endswith("."):
+            break
+        next_lines.append(t)
+        if len(next_lines) >= 2:
+            break
+    if len(next_lines) >= 1:
+        location = next_lines[0]
+    if len(next_lines) >= 2:
+        dates = next_lines[1]
+
+    company_desc = ""
+    mdesc = DESCRIPTION_PATTERN.search(rest)
+    if mdesc and " is " in mdesc.group(1):
+        company_desc = mdesc.group(1).strip()
+
+    groups = []
+    for gm in GROUP_PATTERN.finditer(rest):
+        gtitle = gm.group(1).strip()
+        gs = gm.end()
+        nextm = GROUP_PATTERN.search(rest, gs)
+        block = rest[gs: nextm.start()] if nextm else rest[gs:]
+        items = [m.group(1).strip() for m in ITEM_PATTERN.finditer(block)]
+        groups.append({"title": gtitle, "items": items})
+
+    return {
+        "title": job_title,
+        "company": company,
+        "location": location,
+        "dates": dates,
+        "companyDescription": company_desc,
+        "groups": groups
+    }
+
+
+def build_model(doc: Document) -> Model:
+    lines = doc.lines
+
+    name = doc.name
+    header_lines = []
+    header_bullets = []
+    email = ""
+
+    # Header: everything between '# Name' and the first '## ' after it
+    i = doc.name_line + 1 if doc.name_line >= 0 else len(lines)
+    while i < len(lines) and not lines[i].startswith("## "):
+        ln = lines[i].strip()
+        if ln:
+            if ln.startswith("- "):
+                header_bullets.append(ln[2:].strip())
+            else:
+                if EMAIL_PATTERN.search(ln):
+                    email = ln.strip()
+                else:
+                    header_lines.append(ln)
+        i += 1
+
+    header = {"name": name, "lines": header_lines, "email": email, "bullets": header_bullets}
+
+    out_sections = []
+    for sec in doc.sections_after(i):
+        title = sec.title
+        raw = "\n".join(doc.body(sec)).strip("\n")
+
+        if title.lower() == "links":
+            links = []
+            for m in LINK_PATTERN.finditer(raw):
+                links.append({"label": m.group(1).strip(), "url": m.group(2).strip()})
+            out_sections.append({"title": "Links", "links": links, "body": raw})
+            continue
+
+        if title.lower() == "work experience":
+            jobs = [_parse_job(p) for p in ROLE_SPLIT_PATTERN.split(raw)[1:] if p.splitlines()]
+            out_sections.append({"title": "Work Experience", "jobs": jobs, "body": raw})
+            continue
+
+        out_sections.append({"title": title, "body": raw})
+
+    return {"header": header, "sections": out_sections}
+
+
+def placeholders(model: Model, config: Config) -> Dict[str, str]:
+    return {
+        "__NAME__": model["header"].get("name") or "Resume",
+        "__JSON__": dump_json({"model": model, "config": config}),
+    }
+
+
+PROFILE = Profile(
+    name="v3",
+    description="Client-rendered raw sections with structured links and job groups",
+    template="v3.html",
+    placeholder_names=("__NAME__", "__JSON__"),
+    build_model=build_model,
+    placeholders=placeholders,
+    default_config={},
+    config_file="resume.config.json",
+)
@@ -0,0 +1,56 @@
+"""v4 profile: minimal header plus raw section bodies; the template renders everything."""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from ..document import Document
+from .base import Config, Model, Profile, dump_json
+
+
+def build_model(doc: Document) -> Model:
+    lines = doc.lines
+    # v4 treats the first line as '# Name' and everything up to the first '## ' as header
+    name = lines[0][2:] if lines else ""
+    i = 1
+    header_lines = []
+    bullets = []
+    email = ""
+    while i < len(lines) and not lines[i].startswith("## "):
+        ln = lines[i].strip()
+        if ln.startswith("- "):
+            bullets.append(ln[2:])
+        elif "@" in ln:
+            email = ln
+        elif ln:
+            header_lines.append(ln)
+        i += 1
+
+    # Titles and bodies are kept verbatim (unstripped), as v4 always did
+    sections = [
+        {"title": lines[sec.heading][3:], "body": "\n".join(doc.body(sec))}
+        for sec in doc.sections_after(i)
+    ]
+
+    return {
+        "header": {"name": name, "lines": header_lines, "email": email, "bullets": bullets},
+        "sections": sections,
+    }
+
+
+def placeholders(model: Model, config: Config) -> Dict[str, str]:
+    # v4 always embedded an empty config and ASCII-escaped JSON
+    return {
+        "__NAME__": model["header"]["name"],
+        "__JSON__": dump_json({"model": model, "config": {}}, ensure_ascii=True),
+    }
+
+
+PROFILE = Profile(
+    name="v4",
+    description="Minimal model; the template does all rendering (takes no config)",
+    template="v4.html",
+    placeholder_names=("__NAME__", "__JSON__"),
+    build_model=build_model,
+    placeholders=placeholders,
+)
@@ -0,0 +1,75 @@
+"""
+Size report: what a visitor downloads for one rendered page.
+
+The page is broken into the template's own bytes and each substituted
+placeholder, followed by the transfer size of the whole page with gzip (and
+brotli when installed), at the same settings precompress writes sidecars with.
+"""
+
+from __future__ import annotations
+
+import gzip
+from typing import Dict, List, Optional, Tuple
+
+from .engine import ParsedTemplate
+
+try:
+    import brotli
+except ImportError:  # brotli sizes are omitted when it isn't installed
+    brotli = None
+
+
+def compressed_sizes(data: bytes) -> Dict[str, int]:
+    """Raw, gzip and (when available) brotli sizes of a payload."""
+    sizes = {"raw": len(data), "gzip": len(gzip.compress(data, compresslevel=9, mtime=0))}
+    if brotli is not None:
+        sizes["br"] = len(brotli.compress(data, quality=11))
+    return sizes
+
+
+def template_bytes(template: ParsedTemplate) -> int:
+    return sum(len(chunk.encode("utf-8")) for chunk in template[::2])
+
+
+def page_breakdown(template: ParsedTemplate, values: Dict[str, str]) -> List[Tuple[str, int]]:
+    """
+    Bytes contributed by the template and by each placeholder.
+
+    Args:
+        template: Parsed template the page was filled from
+        values: Placeholder values substituted into it
+
+    Returns:
+        (part, bytes) pairs; a placeholder used more than once counts every use
+    """
+    totals: Dict[str, int] = {}
+    for name in template[1::2]:
+        totals[name] = totals.get(name, 0) + len(values[name].encode("utf-8"))
+    return [("template", template_bytes(template)), *totals.items()]
+
+
+def print_size_report(
+    page: str,
+    template: ParsedTemplate,
+    values: Dict[str, str],
+    unminified: Optional[ParsedTemplate] = None,
+) -> None:
+    """
+    Print the page's size breakdown and transfer sizes.
+
+    Args:
+        page: Rendered HTML
+        template: Parsed template the page was filled from
+        values: Placeholder values substituted into it
+        unminified: The template before minification, to show the saving
+    """
+    print("Size report:")
+    for part, size in page_breakdown(template, values):
+        note = ""
+        if part == "template" and unminified is not None:
+            before = template_bytes(unminified)
+            note = f"  (minified from {before / 1024:.1f} KB, -{(before - size) / before:.1%})"
+        print(f"  {part:<16} {size / 1024:>7.1f} KB{note}")
+    sizes = compressed_sizes(page.encode("utf-8"))
+    transfer = "  ".join(f"{enc} {size / 1024:.1f} KB" for enc, size in sizes.items() if enc != "raw")
+    print(f"  {'page':<16} {sizes['raw'] / 1024:>7.1f} KB  {transfer}")
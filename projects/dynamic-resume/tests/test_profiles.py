@@ -0,0 +1,283 @@
+"""Tests for dynamic_resume."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from dynamic_resume import PROFILES, build_model, build_resume, get_profile, parse_document
+from dynamic_resume.engine import fill_template, parse_template
+
+RESUME = """# Jane Example
+Springfield, USA | Remote
+jane@example.com
+
+## Links
+- GitHub: https://github.com/jane
+
+## Summary
+Engineer with **depth**.
+
+## Work Experience
+
+### Senior Engineer
+**Acme**
+Springfield, USA
+01/2020 – 12/2023
+
+**Leadership:**
+- Led a *team*
+"""
+
+
+def test_parse_document_indexes_sections_once():
+    """Test that the shared document split finds the name and section ranges."""
+    doc = parse_document(RESUME)
+
+    assert doc.name == "Jane Example"
+    assert [s.title for s in doc.sections] == ["Links", "Summary", "Work Experience"]
+    assert doc.section_lines("links") == ["- GitHub: https://github.com/jane", ""]
+
+
+@pytest.mark.parametrize("name", list(PROFILES))
+def test_every_profile_renders_its_template(name):
+    """Test that every profile fills all of its placeholders."""
+    html = build_resume(RESUME, profile=name)
+
+    assert "Jane Example" in html
+    for placeholder in get_profile(name).placeholder_names:
+        assert placeholder not in html
+
+
+def test_parse_template_fills_in_one_pass():
+    """Test that placeholder values are not rescanned for other placeholders."""
+    parts = parse_template("<h1>__A__</h1>__B__", ("__A__", "__B__"))
+
+    assert fill_template(parts, {"__A__": "__B__", "__B__": "x"}) == "<h1>__B__</h1>x"
+
+
+def test_model_cache_skips_parsing(tmp_path):
+    """Test that a second build of the same markdown is served from the cache."""
+    from dynamic_resume.cache import ModelCache
+
+    cache = ModelCache(tmp_path)
+    profile = get_profile("v2.4")
+
+    first, hit1 = build_model(profile, RESUME, cache)
+    second, hit2 = build_model(profile, RESUME, cache)
+
+    assert (hit1, hit2) == (False, True)
+    assert json.dumps(first) == json.dumps(second)
+    assert second["links"] == [{"label": "GitHub", "url": "https://github.com/jane"}]
+
+
+@pytest.mark.parametrize("text, html", [
+    ("*a **b** c*", "<em>a <strong>b</strong> c</em>"),
+    ("**a *b* c**", "<strong>a <em>b</em> c</strong>"),
+    ("***x***", "<strong><em>x</em></strong>"),
+    ("**a** and *b*", "<strong>a</strong> and <em>b</em>"),
+    ("`*a*` [**l**](https://x.test/*y*)", '<code>*a*</code> <a href="https://x.test/*y*" rel="noopener"><strong>l</strong></a>'),
+    ("unclosed **bold", "unclosed **bold"),
+])
+def test_inline_markup_nests(text, html):
+    """Test that bold and em nest one level, while code spans and URLs stay literal."""
+    from dynamic_resume.inline import md_inline_to_html
+
+    assert md_inline_to_html(text) == html
+
+
+def test_inline_matches_legacy_for_bold_inside_em():
+    """Test that em around bold renders as the original sequential passes did."""
+    from dynamic_resume.benchmark import legacy_md_inline
+    from dynamic_resume.inline import md_inline
+
+    for text in ["*a **b** c*", "**a** *b* `c` [d](https://e.test)", "Led a *team* of **five**"]:
+        assert md_inline(text) == legacy_md_inline(text)
+
+
+def test_batch_renders_every_job(tmp_path, capsys):
+    """Test a two-job batch: shared defaults, per-job profile and model, outputs in manifest order."""
+    from dynamic_resume.batch import load_batch_manifest, run_batch
+
+    (tmp_path / "jane.md").write_text(RESUME, encoding="utf-8")
+    manifest = tmp_path / "resume.batch.json"
+    manifest.write_text(json.dumps({
+        "defaults": {"markdown": "jane.md"},
+        "jobs": [
+            {"output": "out/short.html", "model": "out/jane.model.json"},
+            {"output": "out/v1.html", "profile": "v1"},
+        ],
+    }), encoding="utf-8")
+
+    jobs = load_batch_manifest(manifest, "v2.4")
+    results = run_batch(jobs, workers=2)
+
+    assert [job.profile for job in jobs] == ["v2.4", "v1"]
+    assert [r["error"] for r in results] == [None, None]
+    assert [r["output"] for r in results] == [tmp_path / "out" / "short.html", tmp_path / "out" / "v1.html"]
+    assert (tmp_path / "out" / "short.html").read_text(encoding="utf-8") == build_resume(RESUME, profile="v2.4")
+    assert "Jane Example" in (tmp_path / "out" / "v1.html").read_text(encoding="utf-8")
+    assert json.loads((tmp_path / "out" / "jane.model.json").read_text())["name"] == "Jane Example"
+    assert "Total: 2/2 written" in capsys.readouterr().out
+
+
+def test_batch_precompress_with_workers(tmp_path, capsys):
+    """Test that --precompress with -j 2 leaves sidecars and a manifest entry for every output."""
+    pytest.importorskip("precompress")
+    from dynamic_resume.cli import main
+
+    (tmp_path / "jane.md").write_text(RESUME, encoding="utf-8")
+    manifest = tmp_path / "resume.batch.json"
+    names = [f"page-{n}.html" for n in range(6)]
+    manifest.write_text(json.dumps({
+        "defaults": {"markdown": "jane.md"},
+        "jobs": [{"output": f"out/{name}", "profile": "v1" if n % 2 else "v2.4"} for n, name in enumerate(names)],
+    }), encoding="utf-8")
+
+    main(["--batch", str(manifest), "-j", "2", "--precompress"])
+
+    out = tmp_path / "out"
+    assert sorted(json.loads((out / ".precompress.json").read_text())) == sorted(names)
+    for name in names:
+        assert gzip.decompress((out / f"{name}.gz").read_bytes()) == (out / name).read_bytes()
+    assert "Precompressed 6 file(s)" in capsys.readouterr().out
+
+
+def test_example_batch_manifest_builds_resumes():
+    """Test that the shipped example manifest names real resumes and writes under build/."""
+    from dynamic_resume.batch import load_batch_manifest
+
+    manifest = Path(__file__).parent.parent / "releases" / "v2.4" / "resume.batch.json"
+
+    for job in load_batch_manifest(manifest, "v2.4"):
+        assert parse_document(job.markdown.read_text(encoding="utf-8")).section_lines("Work Experience")
+        assert job.output.parent == manifest.parent / "build"
+
+
+def test_embedded_json_is_compact():
+    """Test that the model is embedded without separator whitespace."""
+    html = build_resume(RESUME, profile="v2.4")
+
+    assert '"name":"Jane Example"' in html
+    assert '"name": "Jane Example"' not in html
+
+
+@pytest.mark.parametrize("name", list(PROFILES))
+def test_minified_template_keeps_placeholders_and_literals(name):
+    """Test that minifying shrinks every template without touching placeholders or template literals."""
+    from dynamic_resume.engine import load_template
+
+    profile = get_profile(name)
+    plain, minified = load_template(profile), load_template(profile, minify=True)
+
+    assert minified[1::2] == plain[1::2]
+    assert len("".join(minified)) < len("".join(plain))
+    assert "Jane Example" in build_resume(RESUME, profile=name, minify=True)
+
+
+def test_minify_js_keeps_multiline_template_literals():
+    """Test that indentation inside a template literal survives, even after a regex with a backtick."""
+    from dynamic_resume.minify import minify_js
+
+    js = "  // comment\n  t = t.replace(/`([^`]+)`/g, 'x');\n  el.innerHTML = `\n    <pre>  a</pre>\n  `;\n"
+
+    assert minify_js(js) == "\nt = t.replace(/`([^`]+)`/g, 'x');\nel.innerHTML = `\n    <pre>  a</pre>\n  `;\n"
+
+
+def test_prerender_writes_initial_view_markup():
+    """Test that --prerender fills the page with the short view's sections and marks it for hydration."""
+    from dynamic_resume.profiles.prerender import slugify
+
+    client = build_resume(RESUME, profile="v2.4")
+    html = build_resume(RESUME, profile="v2.4", prerender=True)
+
+    assert 'data-prerendered=""' in client and '<section id="summary"' not in client
+    assert 'data-prerendered="short"' in html
+    assert '<h1 id="resumeName" class="h1">Jane Example</h1>' in html
+    assert '<section id="work-experience" tabindex="-1"><h2>Work Experience</h2>' in html
+    assert '<a href="#links"><span>Links</span></a>' in html
+    assert slugify("Q&A: Skills!") == "qanda-skills"
+
+
+def test_prerender_unsupported_profile():
+    """Test that profiles whose template renders client-side only refuse to pre-render."""
+    with pytest.raises(SystemExit):
+        build_resume(RESUME, profile="v3", prerender=True)
+
+
+def test_pdf_export_skips_unchanged_html(tmp_path, monkeypatch):
+    """Test that a PDF is only re-printed when its HTML changes."""
+    from dynamic_resume import pdf
+
+    printed = []
+
+    async def fake_print(todo, options, concurrency):
+        for job, result in todo:
+            job.pdf.write_bytes(b"%PDF")
+            printed.append(job.pdf.name)
+            result["status"] = "rendered"
+
+    monkeypatch.setattr(pdf, "async_playwright", object())
+    monkeypatch.setattr(pdf, "_print_pages", fake_print)
+    html = tmp_path / "resume.html"
+    jobs = [pdf.PdfJob(html, tmp_path / "resume.pdf")]
+
+    html.write_text("<h1>v1</h1>", encoding="utf-8")
+    first = pdf.export_pdfs(jobs)
+    second = pdf.export_pdfs(jobs)
+    html.write_text("<h1>v2</h1>", encoding="utf-8")
+    third = pdf.export_pdfs(jobs)
+
+    assert [r[0]["status"] for r in (first, second, third)] == ["rendered", "unchanged", "rendered"]
+    assert printed == ["resume.pdf", "resume.pdf"]
+
+
+def test_pdf_page_failure_only_fails_its_job(tmp_path, monkeypatch):
+    """Test that a page that cannot be opened (or closed) does not abort the other PDFs."""
+    from contextlib import asynccontextmanager
+
+    from dynamic_resume import pdf
+
+    class FakePage:
+        async def goto(self, url, wait_until):
+            pass
+
+        async def pdf(self, path, **options):
+            Path(path).write_bytes(b"%PDF")
+
+        async def close(self):
+            raise RuntimeError("target closed")
+
+    class FakeBrowser:
+        opened = 0
+
+        async def new_page(self):
+            FakeBrowser.opened += 1
+            if FakeBrowser.opened == 1:
+                raise RuntimeError("browser has disconnected")
+            return FakePage()
+
+        async def close(self):
+            pass
+
+    class FakeChromium:
+        async def launch(self):
+            return FakeBrowser()
+
+    @asynccontextmanager
+    async def fake_playwright():
+        yield type("Playwright", (), {"chromium": FakeChromium()})()
+
+    monkeypatch.setattr(pdf, "async_playwright", fake_playwright)
+    jobs = []
+    for name in ("first", "second"):
+        (tmp_path / f"{name}.html").write_text(f"<h1>{name}</h1>", encoding="utf-8")
+        jobs.append(pdf.PdfJob(tmp_path / f"{name}.html", tmp_path / f"{name}.pdf"))
+
+    results = pdf.export_pdfs(jobs, concurrency=1)
+
+    assert [r["status"] for r in results] == ["failed", "rendered"]
+    assert "browser has disconnected" in results[0]["error"]
+    assert (tmp_path / "second.pdf").read_bytes() == b"%PDF"
+    assert pdf.export_pdfs(jobs, concurrency=1)[1]["status"] == "unchanged"
@@ -0,0 +1,6 @@
+"""Shared gh CLI runner: asyncio subprocesses, a concurrency cap, rate-limit backoff and latency stats."""
+
+from .runner import GhResult, GhRunner, GhStats, rate_limit_kind
+
+__version__ = "0.1.0"
+__all__ = ["GhResult", "GhRunner", "GhStats", "rate_limit_kind"]
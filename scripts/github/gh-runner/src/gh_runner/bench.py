@@ -0,0 +1,75 @@
+"""
+Helpers shared by the tools' benchmark modules.
+
+Each tool's `benchmark` module replays synthetic gh responses through the fake
+gh (gh_runner.fake), runs its real code path end to end and reports the rows
+printed here: wall time, items per second, gh calls and the peak growth of
+the process's resident memory while the case ran.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+SAMPLE_INTERVAL = 0.01
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class Measurement:
+    seconds: float = 0.0
+    peak_rss: Optional[int] = None  # bytes above the RSS at the start
+
+
+@contextlib.contextmanager
+def measure() -> Iterator[Measurement]:
+    """Time a block and sample RSS in a thread every 10ms to find its peak growth."""
+    result = Measurement()
+    baseline = current_rss()
+    peak = [baseline or 0]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(SAMPLE_INTERVAL):
+            peak[0] = max(peak[0], current_rss() or 0)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    if baseline is not None:
+        sampler.start()
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - start
+        done.set()
+        if baseline is not None:
+            sampler.join()
+            result.peak_rss = max(peak[0], current_rss() or 0) - baseline
+
+
+def print_header(title: str, latency: float) -> None:
+    print(f"== {title} (fake gh latency {latency * 1000:.0f}ms)")
+    print(f"  {'case':<10} {'items':>7} {'wall':>9} {'items/s':>10} {'gh calls':>9} {'peak RSS':>10}")
+
+
+def print_row(case: str, items: int, measurement: Measurement, gh_calls: int) -> None:
+    rss = "n/a" if measurement.peak_rss is None else f"{measurement.peak_rss / 2**20:.1f}MB"
+    rate = items / measurement.seconds if measurement.seconds else 0.0
+    print(
+        f"  {case:<10} {items:>7} {measurement.seconds:>8.2f}s {rate:>10,.0f} {gh_calls:>9} {rss:>10}",
+        flush=True,
+    )
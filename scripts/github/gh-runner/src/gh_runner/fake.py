@@ -0,0 +1,237 @@
+"""
+Fake gh executable that replays canned responses from a cassette.
+
+A cassette is a JSON file of interactions, each the response to one gh command:
+
+  {"interactions": [
+    {"args": ["api", "graphql", "--paginate"], "prefix": true,
+     "stdout": ["<page 1 lines>", "<page 2 lines>"]},
+    {"args": ["issue", "create"], "prefix": true, "sequence": true,
+     "stdout": "https://github.com/octo/repo/issues/{seq}\\n"},
+    {"args": ["auth", "status"], "stdout": "", "returncode": 0}
+  ]}
+
+A command is answered by the first interaction whose args equal its arguments,
+or failing that the longest `prefix` interaction that starts them. Anything
+else exits 1 with an error, so a replay never reaches the network.
+
+  stdout      text, or a list of chunks written one at a time (one per API page)
+  stderr      text (default "")
+  returncode  exit status (default 0)
+  sequence    replace "{seq}" in stdout with a counter shared by all calls to
+              this interaction (e.g. new issue numbers), starting at `start`
+  latency     seconds before any output, overriding the global latency
+
+install() writes a `gh` shim that runs this file with a cassette and latency;
+put its directory first on PATH (or use on_path()) and every tool, or a
+GhRunner(executable=...), talks to the fake. With record=True the shim instead
+runs the real gh and appends each command and its output to the cassette.
+
+Only the standard library is used, so the fake starts about as fast as gh.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; sequences and recording are then not safe across concurrent calls
+    fcntl = None
+
+CASSETTE_ENV = "FAKE_GH_CASSETTE"
+LATENCY_ENV = "FAKE_GH_LATENCY"
+PAGE_LATENCY_ENV = "FAKE_GH_PAGE_LATENCY"
+RECORD_ENV = "FAKE_GH_RECORD"
+REAL_GH_ENV = "FAKE_GH_REAL"
+
+
+def interaction(
+    args: Sequence[str],
+    stdout: Union[str, List[str]] = "",
+    prefix: bool = False,
+    sequence: bool = False,
+    start: int = 1,
+    stderr: str = "",
+    returncode: int = 0,
+    latency: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Build one cassette interaction (see the module docstring for the fields)."""
+    entry: Dict[str, Any] = {"args": list(args), "stdout": stdout}
+    if prefix:
+        entry["prefix"] = True
+    if sequence:
+        entry.update(sequence=True, start=start)
+    if stderr:
+        entry["stderr"] = stderr
+    if returncode:
+        entry["returncode"] = returncode
+    if latency is not None:
+        entry["latency"] = latency
+    return entry
+
+
+def json_lines(values) -> str:
+    """Values as `gh --jq` prints them: one compact JSON document per line."""
+    return "".join(json.dumps(value, separators=(",", ":")) + "\n" for value in values)
+
+
+def write_cassette(path: Path, interactions: List[Dict[str, Any]]) -> Path:
+    path = Path(path)
+    path.write_text(json.dumps({"interactions": interactions}), encoding="utf-8")
+    return path
+
+
+def find_interaction(interactions: List[Dict[str, Any]], argv: List[str]) -> Optional[int]:
+    """Index of the interaction answering argv: an exact match, else the longest prefix."""
+    best, best_length = None, -1
+    for i, entry in enumerate(interactions):
+        args = entry["args"]
+        if args == argv:
+            return i
+        if entry.get("prefix") and argv[:len(args)] == args and len(args) > best_length:
+            best, best_length = i, len(args)
+    return best
+
+
+def install(
+    directory: Path,
+    cassette: Path,
+    latency: float = 0.0,
+    page_latency: float = 0.0,
+    record: bool = False,
+) -> Path:
+    """
+    Write a `gh` shim into directory that runs the fake against a cassette.
+
+    Args:
+        directory: Where to put the shim (put it first on PATH)
+        cassette: Cassette to replay, or to append to when recording
+        latency: Seconds every command waits before answering
+        page_latency: Extra seconds before each stdout chunk after the first
+        record: Proxy to the real gh (found on PATH, or $FAKE_GH_REAL) and record
+
+    Returns:
+        Path of the shim
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    env = {
+        CASSETTE_ENV: str(Path(cassette).resolve()),
+        LATENCY_ENV: str(latency),
+        PAGE_LATENCY_ENV: str(page_latency),
+    }
+    if record:
+        real = os.environ.get(REAL_GH_ENV) or shutil.which("gh")
+        if not real or Path(real).resolve() == (directory / "gh").resolve():
+            raise FileNotFoundError("recording needs the real gh on PATH (or $FAKE_GH_REAL)")
+        env.update({RECORD_ENV: "1", REAL_GH_ENV: str(Path(real).resolve())})
+    assignments = " ".join(f"{name}={shlex.quote(value)}" for name, value in env.items())
+    shim = directory / "gh"
+    shim.write_text(
+        "#!/bin/sh\n"
+        f"{assignments} exec {shlex.quote(sys.executable)} -I {shlex.quote(str(Path(__file__).resolve()))} \"$@\"\n"
+    )
+    shim.chmod(0o755)
+    return shim
+
+
+@contextlib.contextmanager
+def on_path(directory: Path, interactions: List[Dict[str, Any]], latency: float = 0.0, page_latency: float = 0.0) -> Iterator[Path]:
+    """Replay interactions as the `gh` on PATH for the duration of the block; yields the shim."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    cassette = write_cassette(directory / "cassette.json", interactions)
+    shim = install(directory, cassette, latency=latency, page_latency=page_latency)
+    previous = os.environ.get("PATH", "")
+    os.environ["PATH"] = f"{directory}{os.pathsep}{previous}"
+    try:
+        yield shim
+    finally:
+        os.environ["PATH"] = previous
+
+
+@contextlib.contextmanager
+def _locked(path: Path):
+    with open(path, "a+", encoding="utf-8") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        f.seek(0)
+        yield f
+
+
+def _next_sequence(cassette: Path, index: int, start: int) -> int:
+    # One counter per interaction, shared by every fake process replaying the cassette
+    with _locked(cassette.with_name(cassette.name + ".seq")) as f:
+        counters = json.loads(f.read() or "{}")
+        value = counters.get(str(index), start)
+        counters[str(index)] = value + 1
+        f.seek(0)
+        f.truncate()
+        f.write(json.dumps(counters))
+    return value
+
+
+def _replay(cassette: Path, argv: List[str]) -> int:
+    interactions = json.loads(cassette.read_text(encoding="utf-8"))["interactions"]
+    index = find_interaction(interactions, argv)
+    if index is None:
+        sys.stderr.write(f"fake gh: no response in {cassette} for: gh {shlex.join(argv)}\n")
+        return 1
+    entry = interactions[index]
+
+    latency = entry.get("latency", float(os.environ.get(LATENCY_ENV) or 0))
+    page_latency = float(os.environ.get(PAGE_LATENCY_ENV) or 0)
+    chunks = entry.get("stdout", "")
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    if entry.get("sequence"):
+        seq = str(_next_sequence(cassette, index, entry.get("start", 1)))
+        chunks = [chunk.replace("{seq}", seq) for chunk in chunks]
+
+    time.sleep(latency)
+    for i, chunk in enumerate(chunks):
+        if i and page_latency:
+            time.sleep(page_latency)
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+    sys.stderr.write(entry.get("stderr", ""))
+    return entry.get("returncode", 0)
+
+
+def _record(cassette: Path, argv: List[str]) -> int:
+    result = subprocess.run([os.environ[REAL_GH_ENV]] + argv, capture_output=True, text=True, encoding="utf-8")
+    sys.stdout.write(result.stdout)
+    sys.stderr.write(result.stderr)
+    entry = interaction(argv, result.stdout, stderr=result.stderr, returncode=result.returncode)
+    with _locked(cassette) as f:
+        data = json.loads(f.read() or '{"interactions": []}')
+        data["interactions"].append(entry)
+        f.seek(0)
+        f.truncate()
+        f.write(json.dumps(data, indent=1))
+    return result.returncode
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    cassette = os.environ.get(CASSETTE_ENV)
+    if not cassette:
+        sys.stderr.write(f"fake gh: set {CASSETTE_ENV} (see gh_runner.fake.install)\n")
+        return 2
+    if os.environ.get(RECORD_ENV):
+        return _record(Path(cassette), argv)
+    return _replay(Path(cassette), argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""
+Shared gh CLI runner for the scripts/github tools.
+
+Every gh command runs as an asyncio subprocess on one event loop owned by the
+runner, in a background thread. Synchronous code calls run(), run_many() or
+stream() from any thread, while a semaphore caps how many gh processes are
+alive at once.
+
+A command that fails with a GitHub rate limit is retried with exponential
+backoff, and all other calls pause with it:
+
+  primary    "API rate limit exceeded": wait until the reset time reported by
+             `gh api rate_limit` (or back off exponentially if unknown)
+  secondary  "secondary rate limit" / abuse detection: back off exponentially,
+             starting at one minute as GitHub asks
+
+Per-call latency, attempts and rate-limit waits are kept in GhRunner.stats.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import json
+import random
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 5
+READ_CHUNK = 64 * 1024
+
+PRIMARY_RATE_LIMIT_PATTERN = re.compile(r"API rate limit (?:already )?exceeded|HTTP 429", re.I)
+SECONDARY_RATE_LIMIT_PATTERN = re.compile(r"secondary rate limit|abuse detection", re.I)
+
+
+def rate_limit_kind(stderr: str) -> Optional[str]:
+    """Classify a failed gh call's stderr: "primary", "secondary" or None."""
+    if SECONDARY_RATE_LIMIT_PATTERN.search(stderr):
+        return "secondary"
+    if PRIMARY_RATE_LIMIT_PATTERN.search(stderr):
+        return "primary"
+    return None
+
+
+@dataclass
+class GhResult:
+    args: List[str]
+    returncode: int
+    stdout: str
+    stderr: str
+    seconds: float
+    attempts: int = 1
+
+    def check(self) -> "GhResult":
+        """Raise subprocess.CalledProcessError if the command failed."""
+        if self.returncode:
+            raise subprocess.CalledProcessError(self.returncode, ["gh"] + self.args, self.stdout, self.stderr)
+        return self
+
+
+@dataclass
+class GhStats:
+    """Latency of every finished gh call, and time spent waiting out rate limits."""
+
+    calls: List[GhResult] = field(default_factory=list)
+    rate_limit_waits: int = 0
+    waited: float = 0.0
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of call latency in seconds (0 with no calls)."""
+        if not self.calls:
+            return 0.0
+        latencies = sorted(call.seconds for call in self.calls)
+        return latencies[min(len(latencies) - 1, max(0, round(p / 100 * len(latencies)) - 1))]
+
+    def by_command(self) -> List[tuple]:
+        """(command, calls, total seconds) per gh subcommand, busiest first."""
+        totals = {}
+        for call in self.calls:
+            name = " ".join(call.args[:2])
+            count, seconds = totals.get(name, (0, 0.0))
+            totals[name] = (count + 1, seconds + call.seconds)
+        return sorted(((name, n, s) for name, (n, s) in totals.items()), key=lambda t: -t[2])
+
+    def summary(self) -> str:
+        """One line: calls, total and percentile latency, retries and rate-limit waits."""
+        if not self.calls:
+            return "gh: no calls"
+        total = sum(call.seconds for call in self.calls)
+        retried = sum(1 for call in self.calls if call.attempts > 1)
+        line = (
+            f"gh: {len(self.calls)} call{'s' if len(self.calls) != 1 else ''} in {total:.1f}s "
+            f"(p50 {self.percentile(50) * 1000:.0f}ms, p95 {self.percentile(95) * 1000:.0f}ms, "
+            f"max {max(call.seconds for call in self.calls) * 1000:.0f}ms)"
+        )
+        if retried:
+            line += f", {retried} retried"
+        if self.rate_limit_waits:
+            line += f", {self.rate_limit_waits} rate-limit wait{'s' if self.rate_limit_waits != 1 else ''} ({self.waited:.0f}s)"
+        return line
+
+
+class GhRunner:
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = 1.0,
+        secondary_backoff: float = 60.0,
+        max_backoff: float = 900.0,
+        executable: str = "gh",
+    ):
+        """
+        Create a runner; its event loop thread starts with the first command.
+
+        Args:
+            concurrency: Most gh processes alive at once
+            retries: Retries of a rate-limited command before it fails
+            backoff: First primary rate-limit delay (doubles per retry) when the reset time is unknown
+            secondary_backoff: First secondary rate-limit delay (doubles per retry)
+            max_backoff: Longest single wait; a primary limit that resets later fails instead
+            executable: gh binary (looked up on PATH)
+        """
+        self.concurrency = max(1, concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.secondary_backoff = secondary_backoff
+        self.max_backoff = max_backoff
+        self.executable = executable
+        self.stats = GhStats()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._start_lock = threading.Lock()
+        self._limit = asyncio.Semaphore(self.concurrency)
+        self._resume_at = 0.0  # loop time before which no command starts
+
+    # --- Synchronous API (any thread) ---
+
+    def run(self, args: Sequence[str], input: Optional[str] = None) -> GhResult:
+        """
+        Run one gh command and wait for it.
+
+        Args:
+            args: Arguments after "gh"
+            input: Text for the command's stdin
+
+        Returns:
+            GhResult; call .check() to raise on a non-zero exit
+        """
+        return self._call(self._run(list(args), input))
+
+    def run_many(self, commands: Sequence[Sequence[str]]) -> List[GhResult]:
+        """Run several gh commands concurrently (up to the cap); results in input order."""
+        async def gather():
+            return await asyncio.gather(*(self._run(list(args), None) for args in commands))
+        return self._call(gather())
+
+    async def run_async(self, args: Sequence[str], input: Optional[str] = None) -> GhResult:
+        """run() for coroutines: awaitable from any event loop."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._run(list(args), input), self._start())
+        )
+
+    def stream(self, args: Sequence[str]) -> Iterator[str]:
+        """
+        Run a gh command and yield its stdout line by line as it arrives.
+
+        Output is read in chunks as the caller asks for more, so a long paginated
+        response is never held in memory whole. A rate-limited command is only
+        retried if it failed before printing anything.
+
+        The command's slot is given back as soon as gh exits, not when the
+        caller finishes iterating, so other commands can run from the loop
+        body. While gh is still printing it keeps its slot: with concurrency=1
+        a command run from the loop body would wait for it forever.
+
+        Raises:
+            subprocess.CalledProcessError: gh exited with an error (after the
+                lines it did print have been yielded)
+        """
+        args = list(args)
+        start = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            proc, stderr_task = self._call(self._spawn_stream(args))
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            buffer = ""
+            printed = False
+            finished = False
+            try:
+                while True:
+                    chunk = self._call(proc.stdout.read(READ_CHUNK))
+                    if not chunk:
+                        break
+                    *lines, buffer = (buffer + decoder.decode(chunk)).split("\n")
+                    for line in lines:
+                        printed = True
+                        yield line
+                buffer += decoder.decode(b"", final=True)
+                if buffer:
+                    printed = True
+                    yield buffer
+                returncode, stderr = self._call(self._reap(proc, stderr_task))
+                finished = True
+            finally:
+                if not finished:
+                    self._call(self._kill(proc, stderr_task))
+
+            if returncode and not printed and attempts <= self.retries:
+                if self._call(self._rate_limit_wait(stderr, attempts)):
+                    continue
+            result = GhResult(args, returncode, "", stderr, time.perf_counter() - start, attempts)
+            self.stats.calls.append(result)
+            result.check()
+            return
+
+    def close(self):
+        """Stop the event loop thread (a later command starts a new one)."""
+        with self._start_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._loop = None
+                self._limit = asyncio.Semaphore(self.concurrency)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Event loop side ---
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="gh-runner", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._start()).result()
+
+    async def _spawn(self, args: List[str], stdin: bool):
+        """Start gh once a slot is free and no rate-limit pause is running."""
+        await self._limit.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            while (pause := self._resume_at - loop.time()) > 0:
+                await asyncio.sleep(pause)
+            proc = await asyncio.create_subprocess_exec(
+                self.executable, *args,
+                stdin=subprocess.PIPE if stdin else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except BaseException:
+            self._limit.release()
+            raise
+        # stderr is drained alongside stdout so a chatty gh cannot block on it
+        return proc, asyncio.ensure_future(proc.stderr.read())
+
+    async def _spawn_stream(self, args: List[str]):
+        """_spawn() for stream(): the slot is released when gh exits, not when the caller stops reading."""
+        proc, stderr_task = await self._spawn(args, stdin=False)
+        # wait() resolves once gh has exited and the rest of its output is buffered
+        asyncio.ensure_future(proc.wait()).add_done_callback(lambda _: self._limit.release())
+        return proc, stderr_task
+
+    async def _reap(self, proc, stderr_task):
+        stderr = await stderr_task
+        return await proc.wait(), stderr.decode("utf-8", errors="replace")
+
+    async def _kill(self, proc, stderr_task):
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        await stderr_task
+
+    async def _run(self, args: List[str], input: Optional[str]) -> GhResult:
+        start = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            proc, stderr_task = await self._spawn(args, stdin=input is not None)
+            try:
+                stdout, _ = await asyncio.gather(proc.stdout.read(), self._feed(proc, input))
+                stderr = (await stderr_task).decode("utf-8", errors="replace")
+                await proc.wait()
+            finally:
+                self._limit.release()
+            if proc.returncode and attempts <= self.retries and await self._rate_limit_wait(stderr, attempts):
+                continue
+            result = GhResult(
+                args, proc.returncode, stdout.decode("utf-8", errors="replace"), stderr,
+                time.perf_counter() - start, attempts
+            )
+            self.stats.calls.append(result)
+            return result
+
+    async def _feed(self, proc, input: Optional[str]):
+        if input is not None:
+            proc.stdin.write(input.encode("utf-8"))
+            await proc.stdin.drain()
+            proc.stdin.close()
+
+    async def _rate_limit_wait(self, stderr: str, attempt: int) -> bool:
+        """If stderr shows a rate limit worth waiting for, pause every command and return True."""
+        kind = rate_limit_kind(stderr)
+        if kind is None:
+            return False
+        if kind == "secondary":
+            delay = self.secondary_backoff * 2 ** (attempt - 1)
+        else:
+            delay = self.backoff * 2 ** (attempt - 1)
+            reset = await self._primary_reset()
+            if reset is not None:
+                until_reset = reset - time.time() + 1
+                if until_reset > self.max_backoff:
+                    return False  # not worth blocking for; the command fails
+                delay = max(delay, until_reset)
+        delay = min(delay, self.max_backoff) * random.uniform(1.0, 1.1)
+        self.stats.rate_limit_waits += 1
+        self.stats.waited += delay
+        loop = asyncio.get_running_loop()
+        self._resume_at = max(self._resume_at, loop.time() + delay)
+        return True
+
+    async def _primary_reset(self) -> Optional[float]:
+        """Epoch time at which the first exhausted rate limit resets, if any."""
+        # The rate_limit endpoint does not count against the limits
+        proc = await asyncio.create_subprocess_exec(
+            self.executable, "api", "rate_limit",
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+        try:
+            resources = json.loads(stdout)["resources"].values()
+            resets = [r["reset"] for r in resources if r.get("remaining") == 0]
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return min(resets) if resets else None
@@ -0,0 +1,123 @@
+"""Tests for gh_runner.fake."""
+
+import json
+import os
+import subprocess
+import time
+
+import pytest
+from gh_runner import GhRunner, fake
+
+
+def gh(shim, *args):
+    return subprocess.run([str(shim), *args], capture_output=True, text=True)
+
+
+def test_find_interaction_prefers_exact_then_longest_prefix():
+    """Test how a command is matched to an interaction."""
+    interactions = [
+        fake.interaction(["issue"], "short", prefix=True),
+        fake.interaction(["issue", "view"], "long", prefix=True),
+        fake.interaction(["issue", "view", "1"], "exact"),
+    ]
+
+    assert fake.find_interaction(interactions, ["issue", "view", "1"]) == 2
+    assert fake.find_interaction(interactions, ["issue", "view", "2"]) == 1
+    assert fake.find_interaction(interactions, ["issue", "list"]) == 0
+    assert fake.find_interaction(interactions, ["pr", "list"]) is None
+
+
+def test_replay(tmp_path):
+    """Test stdout pages, stderr, exit codes and the error for unknown commands."""
+    cassette = fake.write_cassette(tmp_path / "cassette.json", [
+        fake.interaction(["api", "graphql"], ["page 1\n", "page 2\n"], prefix=True),
+        fake.interaction(["issue", "view", "404"], stderr="HTTP 404: Not Found\n", returncode=1),
+    ])
+    shim = fake.install(tmp_path / "bin", cassette)
+
+    result = gh(shim, "api", "graphql", "--paginate")
+    assert (result.returncode, result.stdout) == (0, "page 1\npage 2\n")
+
+    result = gh(shim, "issue", "view", "404")
+    assert (result.returncode, result.stderr) == (1, "HTTP 404: Not Found\n")
+
+    result = gh(shim, "repo", "delete")
+    assert result.returncode == 1
+    assert "no response" in result.stderr and "gh repo delete" in result.stderr
+
+
+def test_sequence_is_shared_by_concurrent_calls(tmp_path):
+    """Test that every call to a sequence interaction gets the next number, also in parallel."""
+    interactions = [
+        fake.interaction(["issue", "create"], "https://github.com/o/r/issues/{seq}\n", prefix=True, sequence=True, start=10)
+    ]
+    with fake.on_path(tmp_path, interactions), GhRunner(concurrency=4) as runner:
+        results = runner.run_many([["issue", "create", "--title", str(n)] for n in range(8)])
+
+    numbers = sorted(int(r.stdout.rsplit("/", 1)[1]) for r in results)
+    assert numbers == list(range(10, 18))
+
+
+def test_latency(tmp_path):
+    """Test the per-call latency and the delay between pages."""
+    cassette = fake.write_cassette(tmp_path / "cassette.json", [
+        fake.interaction(["a"], ["1\n", "2\n", "3\n"]),
+        fake.interaction(["b"], "fast\n", latency=0),
+    ])
+    shim = fake.install(tmp_path / "bin", cassette, latency=0.3, page_latency=0.1)
+
+    start = time.perf_counter()
+    assert gh(shim, "a").stdout == "1\n2\n3\n"
+    slow = time.perf_counter() - start
+    start = time.perf_counter()
+    assert gh(shim, "b").stdout == "fast\n"
+    fast = time.perf_counter() - start
+
+    assert slow >= 0.5
+    assert fast < slow - 0.3
+
+
+def test_on_path_restores_path(tmp_path):
+    """Test that on_path puts the shim first on PATH only inside the block."""
+    before = os.environ["PATH"]
+    with fake.on_path(tmp_path, [fake.interaction(["--version"], "gh version fake\n")]) as shim:
+        assert os.environ["PATH"].split(os.pathsep)[0] == str(tmp_path)
+        assert GhRunner().run(["--version"]).stdout == "gh version fake\n"
+    assert os.environ["PATH"] == before
+    assert shim == tmp_path / "gh"
+
+
+def test_record_then_replay(tmp_path, monkeypatch):
+    """Test recording through the real gh and replaying the cassette without it."""
+    real = tmp_path / "real" / "gh"
+    real.parent.mkdir()
+    real.write_text('#!/bin/sh\necho "real: $*"\n[ "$1" = fail ] && { echo nope >&2; exit 4; }\nexit 0\n')
+    real.chmod(0o755)
+    monkeypatch.setenv(fake.REAL_GH_ENV, str(real))
+    cassette = tmp_path / "cassette.json"
+
+    recorder = fake.install(tmp_path / "record", cassette, record=True)
+    assert gh(recorder, "issue", "list").stdout == "real: issue list\n"
+    assert gh(recorder, "fail").returncode == 4
+
+    recorded = json.loads(cassette.read_text())["interactions"]
+    assert [entry["args"] for entry in recorded] == [["issue", "list"], ["fail"]]
+
+    real.unlink()
+    player = fake.install(tmp_path / "replay", cassette)
+    assert gh(player, "issue", "list").stdout == "real: issue list\n"
+    result = gh(player, "fail")
+    assert (result.returncode, result.stderr) == (4, "nope\n")
+
+
+def test_json_lines():
+    """Test the `gh --jq` output format."""
+    assert fake.json_lines([{"a": 1}, [1, 2]]) == '{"a":1}\n[1,2]\n'
+
+
+def test_record_needs_real_gh(tmp_path, monkeypatch):
+    """Test that recording refuses to proxy to itself or to nothing."""
+    monkeypatch.delenv(fake.REAL_GH_ENV, raising=False)
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+    with pytest.raises(FileNotFoundError):
+        fake.install(tmp_path / "bin", tmp_path / "cassette.json", record=True)
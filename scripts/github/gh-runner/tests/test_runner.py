@@ -0,0 +1,217 @@
+"""Tests for gh_runner."""
+
+import asyncio
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+from gh_runner import GhRunner, GhStats, GhResult, rate_limit_kind
+
+
+@pytest.fixture
+def fake_gh(tmp_path, monkeypatch):
+    """Install a shell script as `gh` on PATH; returns a function that sets its body."""
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.chdir(tmp_path)
+
+    def install(body):
+        gh = tmp_path / "gh"
+        gh.write_text("#!/bin/sh\n" + body)
+        gh.chmod(0o755)
+
+    return install
+
+
+@pytest.fixture
+def runner():
+    with GhRunner(concurrency=2, backoff=0.01, secondary_backoff=0.05, max_backoff=1.0) as runner:
+        yield runner
+
+
+def test_rate_limit_kind():
+    """Test classification of gh's rate-limit errors."""
+    assert rate_limit_kind("gh: API rate limit exceeded for user ID 1. (HTTP 403)") == "primary"
+    assert rate_limit_kind("GraphQL: API rate limit already exceeded for user ID 1.") == "primary"
+    assert rate_limit_kind("You have exceeded a secondary rate limit. Please wait.") == "secondary"
+    assert rate_limit_kind("You have triggered an abuse detection mechanism.") == "secondary"
+    assert rate_limit_kind("HTTP 404: Not Found") is None
+
+
+def test_run_returns_output_and_records_stats(fake_gh, runner):
+    """Test stdout, stdin, exit codes and per-call stats."""
+    fake_gh('if [ "$1" = fail ]; then echo "HTTP 404: Not Found" >&2; exit 1; fi\necho "args: $*"\ncat\n')
+
+    result = runner.run(["issue", "list"], input="from stdin\n")
+    assert result.returncode == 0
+    assert result.stdout == "args: issue list\nfrom stdin\n"
+
+    failed = runner.run(["fail"])
+    assert failed.returncode == 1
+    assert failed.attempts == 1
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        failed.check()
+    assert "Not Found" in excinfo.value.stderr
+
+    assert [call.args for call in runner.stats.calls] == [["issue", "list"], ["fail"]]
+    assert runner.stats.summary().startswith("gh: 2 calls in ")
+
+
+def test_run_many_respects_concurrency_cap(fake_gh, runner):
+    """Test that at most `concurrency` processes run at once and results keep their order."""
+    fake_gh(
+        'echo start >> log\n'
+        'sleep 0.2\n'
+        'echo end >> log\n'
+        'echo "$1"\n'
+    )
+
+    start = time.perf_counter()
+    results = runner.run_many([[str(n)] for n in range(4)])
+    elapsed = time.perf_counter() - start
+
+    assert [r.stdout.strip() for r in results] == ["0", "1", "2", "3"]
+    assert 0.4 <= elapsed < 0.8  # two waves of two
+    running = peak = 0
+    for event in open("log").read().split():
+        running += 1 if event == "start" else -1
+        peak = max(peak, running)
+    assert peak == 2
+
+
+def test_secondary_rate_limit_is_retried(fake_gh, runner):
+    """Test exponential backoff on a secondary rate limit until the command succeeds."""
+    fake_gh(
+        'n=$(cat count 2>/dev/null || echo 0); echo $((n + 1)) > count\n'
+        'if [ "$n" -lt 2 ]; then echo "You have exceeded a secondary rate limit" >&2; exit 1; fi\n'
+        'echo ok\n'
+    )
+
+    start = time.perf_counter()
+    result = runner.run(["api", "user"])
+
+    assert result.stdout == "ok\n"
+    assert result.attempts == 3
+    assert runner.stats.rate_limit_waits == 2
+    assert time.perf_counter() - start >= 0.05 + 0.1  # 1x then 2x the first delay
+    assert "1 retried, 2 rate-limit waits" in runner.stats.summary()
+
+
+def test_primary_rate_limit_waits_for_reset(fake_gh):
+    """Test that a primary limit waits until the reset reported by `gh api rate_limit`."""
+    reset = int(time.time()) + 1
+    fake_gh(
+        'if [ "$2" = rate_limit ]; then\n'
+        f'  echo \'{{"resources": {{"core": {{"remaining": 5000, "reset": 1}}, "graphql": {{"remaining": 0, "reset": {reset}}}}}}}\'\n'
+        '  exit 0\n'
+        'fi\n'
+        'if [ ! -f limited ]; then touch limited; echo "GraphQL: API rate limit exceeded for user ID 1." >&2; exit 1; fi\n'
+        'echo ok\n'
+    )
+
+    with GhRunner(backoff=0.01, max_backoff=5.0) as runner:
+        result = runner.run(["api", "graphql"])
+
+    assert result.stdout == "ok\n"
+    assert result.attempts == 2
+    assert time.time() >= reset
+
+
+def test_primary_rate_limit_fails_when_reset_is_far(fake_gh, runner):
+    """Test that a limit resetting after max_backoff fails instead of blocking."""
+    fake_gh(
+        'if [ "$2" = rate_limit ]; then\n'
+        f'  echo \'{{"resources": {{"core": {{"remaining": 0, "reset": {int(time.time()) + 3600}}}}}}}\'\n'
+        '  exit 0\n'
+        'fi\n'
+        'echo "API rate limit exceeded for user ID 1. (HTTP 403)" >&2; exit 1\n'
+    )
+
+    result = runner.run(["api", "user"])
+
+    assert result.returncode == 1
+    assert runner.stats.rate_limit_waits == 0
+
+
+def test_stream_yields_lines_then_raises(fake_gh, runner):
+    """Test line streaming across chunk boundaries and the error after partial output."""
+    fake_gh(
+        'printf \'{"a": 1}\\n\'\n'
+        'head -c 200000 /dev/zero | tr "\\0" x\n'
+        'printf \'\\n{"b": 2}\'\n'
+        'echo oops >&2\n'
+        'exit 3\n'
+    )
+
+    lines = []
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        for line in runner.stream(["api", "graphql", "--paginate"]):
+            lines.append(line)
+
+    assert lines[0] == '{"a": 1}'
+    assert lines[1] == "x" * 200000
+    assert lines[2] == '{"b": 2}'
+    assert excinfo.value.stderr.strip() == "oops"
+    assert runner.stats.calls[-1].returncode == 3
+
+
+def test_abandoned_stream_frees_its_slot(fake_gh, runner):
+    """Test that breaking out of a stream kills gh and releases the concurrency slot."""
+    fake_gh('while true; do echo line; done\n')
+
+    for _ in range(3):  # more than the cap of 2
+        for line in runner.stream(["api", "x"]):
+            break
+
+    fake_gh('echo done\n')
+    assert runner.run(["api", "y"]).stdout == "done\n"
+
+
+def test_nested_run_while_streaming_with_one_slot(fake_gh):
+    """Test that with concurrency=1 a command run from a stream's loop body gets the slot once gh exits."""
+    fake_gh(
+        'if [ "$1" = view ]; then echo "comments of $2"; exit 0; fi\n'
+        'printf "1\\n2\\n3\\n"\n'
+    )
+
+    with GhRunner(concurrency=1) as runner:
+        seen = []
+
+        def sync():
+            for line in runner.stream(["api", "graphql"]):
+                seen.append((line, runner.run(["view", line]).check().stdout.strip()))
+
+        # A daemon thread, so a deadlock fails the test instead of hanging it
+        thread = threading.Thread(target=sync, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert seen == [("1", "comments of 1"), ("2", "comments of 2"), ("3", "comments of 3")]
+
+        # Released once per command, so the cap is still one
+        assert runner.run_many([["view", "a"], ["view", "b"]])[1].stdout == "comments of b\n"
+        assert runner._limit._value == 1
+
+
+def test_run_async_from_another_loop(fake_gh, runner):
+    """Test awaiting commands from a caller's own event loop."""
+    fake_gh('echo "$1"\n')
+
+    async def main():
+        return await asyncio.gather(runner.run_async(["a"]), runner.run_async(["b"]))
+
+    assert [r.stdout for r in asyncio.run(main())] == ["a\n", "b\n"]
+
+
+def test_stats_percentiles_and_breakdown():
+    """Test nearest-rank percentiles and the per-command totals."""
+    stats = GhStats()
+    for n in range(1, 101):
+        stats.calls.append(GhResult(["issue", "create" if n % 2 else "view"], 0, "", "", n / 1000))
+
+    assert stats.percentile(50) == 0.05
+    assert stats.percentile(95) == 0.095
+    assert [name for name, _, _ in stats.by_command()] == ["issue view", "issue create"]
+    assert "p50 50ms, p95 95ms, max 100ms" in stats.summary()
@@ -0,0 +1,122 @@
+"""
+Benchmark GitHubIssueCreator end to end against a fake gh.
+
+A synthetic epic file with N tickets is created through the real code path
+(parsing, label and milestone handling, issue creation, epic linking and the
+final epic update), with every gh command answered by gh_runner.fake: new
+issues get increasing numbers, and some labels and milestones are missing so
+they have to be created.
+
+Usage:
+  python -m issues_create_epic.benchmark [--sizes 100 1000 10000] [--latency 0.5] [--jobs N]
+"""
+
+import argparse
+import logging
+import tempfile
+from pathlib import Path
+
+from gh_runner import GhRunner, fake
+from gh_runner.bench import measure, print_header, print_row
+
+from .create_epic import DEFAULT_WORKERS, GitHubIssueCreator
+
+MILESTONES_API = "repos/{owner}/{repo}/milestones"
+EXISTING_LABELS = ["epic", "bug", "enhancement", "backend", "frontend"]
+NEW_LABELS = ["performance", "infra", "docs"]
+EXISTING_SPRINTS = 5
+SPRINTS = 8
+
+
+def make_epic_markdown(count):
+    """An epic file with `count` tickets; each depends on up to two earlier ones (a shallow tree, not a chain)."""
+    labels = EXISTING_LABELS[1:] + NEW_LABELS
+    out = [
+        "---",
+        "epic:",
+        f'  title: "Epic: Benchmark with {count} tickets"',
+        '  labels: ["epic"]',
+        "  description: |",
+        "    Synthetic epic generated for benchmarking.",
+        "---",
+        "",
+        "# Benchmark Tickets",
+        "",
+    ]
+    for n in range(1, count + 1):
+        dependencies = [f"BENCH-{d:05d}" for d in sorted({n // 2, n // 3}) if 0 < d < n]
+        out += [
+            "---",
+            "ticket:",
+            f"  id: BENCH-{n:05d}",
+            f"  title: Benchmark ticket {n}",
+            "  type: task",
+            f"  priority: P{n % 3}",
+            f"  points: {n % 8 + 1}",
+            f"  sprint: {n % SPRINTS + 1}",
+            f'  labels: ["{labels[n % len(labels)]}", "{labels[(n + 3) % len(labels)]}"]',
+            f'  milestone: "Sprint {n % SPRINTS + 1}"',
+            f"  dependencies: {dependencies}",
+            "---",
+            "",
+            f"### BENCH-{n:05d}: Benchmark ticket {n}",
+            "",
+            "**Acceptance Criteria:**",
+            "- [ ] Works",
+            "",
+        ]
+    return "\n".join(out)
+
+
+def creator_interactions():
+    """Cassette answering every gh command GitHubIssueCreator runs."""
+    milestones = "".join(f"Sprint {n}|{n}\n" for n in range(1, EXISTING_SPRINTS + 1))
+    return [
+        fake.interaction(["--version"], "gh version 2.60.0 (fake)\n"),
+        fake.interaction(["auth", "status"], "Logged in to github.com\n"),
+        fake.interaction(["label", "list"], "".join(f"{label}\n" for label in EXISTING_LABELS), prefix=True),
+        fake.interaction(["label", "create"], "", prefix=True),
+        fake.interaction(["api", MILESTONES_API, "--jq"], milestones, prefix=True),
+        fake.interaction(["api", MILESTONES_API, "-f"], "{seq}\n", prefix=True, sequence=True, start=EXISTING_SPRINTS + 1),
+        fake.interaction(["issue", "create"], "https://github.com/octo/bench/issues/{seq}\n", prefix=True, sequence=True),
+        fake.interaction(["issue", "comment"], "https://github.com/octo/bench/issues/1#issuecomment-1\n", prefix=True),
+        fake.interaction(["issue", "view"], "Epic\n\n## Child Issues\n*Will be updated with ticket links*\n", prefix=True),
+        fake.interaction(["issue", "edit"], "https://github.com/octo/bench/issues/1\n", prefix=True),
+    ]
+
+
+def bench_create(sizes, latency, workers):
+    print_header(f"issues-create-epic, {workers} worker(s)", latency)
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            epic_file = tmp / "epic.md"
+            epic_file.write_text(make_epic_markdown(count), encoding="utf-8")
+            with fake.on_path(tmp / "bin", creator_interactions(), latency):
+                gh = GhRunner(concurrency=workers)
+                # The per-ticket log would dominate; errors still show
+                logging.disable(logging.INFO)
+                try:
+                    with measure() as measurement:
+                        creator = GitHubIssueCreator(gh=gh, workers=workers)
+                        creator.create_issues_from_file(str(epic_file))
+                finally:
+                    logging.disable(logging.NOTSET)
+                    gh.close()
+            if len(creator.created_issues) != count:
+                raise SystemExit(f"expected {count} tickets, created {len(creator.created_issues)}")
+            print_row("create", count, measurement, len(gh.stats.calls))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GitHubIssueCreator against a fake gh.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Ticket counts")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the fake gh answers a call")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WORKERS, help="Tickets created at once")
+    args = parser.parse_args()
+
+    bench_create(args.sizes, args.latency, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,20 @@ Uses GitHub CLI (gh) for API interactions.
 import subprocess
 import sys
 import re
+import heapq
+import threading
 import yaml
 import json
 import argparse
 import logging
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+from gh_runner import GhRunner
+
 
 # Configure logging
 logging.basicConfig(
@@ -24,9 +30,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tickets created at once; GitHub's secondary rate limits make many more counterproductive
+DEFAULT_WORKERS = 4
+
 
 class GitHubIssueCreator:
-    def __init__(self, repo: Optional[str] = None, dry_run: bool = False, verbose: bool = False):
+    def __init__(
+        self,
+        repo: Optional[str] = None,
+        dry_run: bool = False,
+        verbose: bool = False,
+        gh: Optional[GhRunner] = None,
+        workers: int = DEFAULT_WORKERS
+    ):
         """
         Initialize the GitHub Issue Creator.
         
@@ -34,13 +50,19 @@ class GitHubIssueCreator:
             repo: Repository in format "owner/repo". If None, uses current repo.
             dry_run: If True, don't actually create issues
             verbose: If True, show detailed command output
+            gh: Runner for gh commands (concurrency cap, rate-limit backoff,
+                latency stats). If None, one allowing `workers` gh processes is created.
+            workers: Tickets created at once
         """
         self.repo = repo
         self.dry_run = dry_run
         self.verbose = verbose
+        self.workers = max(1, workers)
+        self.gh = gh or GhRunner(concurrency=self.workers)
         self.created_issues = {}  # Map ticket IDs to issue numbers
+        self._created_lock = threading.Lock()  # created_issues is written from the ticket workers
         self.existing_labels = set()  # Cache of existing labels
-        self.existing_milestones = {}  # Cache of existing milestones (title -> number)
+        self.existing_milestones = {}  # Cache of existing milestones (title -> number, None if creating it failed)
         
         # Set logging level
         if verbose:
@@ -48,8 +70,11 @@ class GitHubIssueCreator:
         
         if not dry_run:
             self._verify_gh_cli()
-            self._load_existing_labels()
-            self._load_existing_milestones()
+            # Independent lookups; both caches are filled before anything is created
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                loads = [pool.submit(self._load_existing_labels), pool.submit(self._load_existing_milestones)]
+                for load in loads:
+                    load.result()
     
     def _verify_gh_cli(self):
         """Verify that gh CLI is installed and authenticated."""
@@ -57,12 +82,7 @@ class GitHubIssueCreator:
         
         try:
             # Check if gh is installed
-            result = subprocess.run(
-                ['gh', '--version'],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            result = self.gh.run(['--version'])
             
             if result.returncode != 0:
                 logger.error("❌ Error: gh CLI is not installed")
@@ -74,12 +94,7 @@ class GitHubIssueCreator:
                 logger.debug(f"  ✓ Found: {version_line}")
             
             # Check authentication
-            result = subprocess.run(
-                ['gh', 'auth', 'status'],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            result = self.gh.run(['auth', 'status'])
             
             if result.returncode != 0:
                 logger.error("❌ Error: Not authenticated with GitHub")
@@ -107,12 +122,7 @@ class GitHubIssueCreator:
             args.extend(['--repo', self.repo])
         
         try:
-            result = subprocess.run(
-                ['gh'] + args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            result = self.gh.run(args).check()
             
             if result.stdout.strip():
                 self.existing_labels = set(result.stdout.strip().split('\n'))
@@ -127,33 +137,16 @@ class GitHubIssueCreator:
         if self.verbose:
             logger.debug("  Loading existing milestones...")
         
-        args = ['api', 'repos/{owner}/{repo}/milestones', '--jq', '.[].title']
+        # Titles and numbers in one call
+        args = ['api', 'repos/{owner}/{repo}/milestones', '--jq', r'.[] | "\(.title)|\(.number)"']
         
         if self.repo:
             args.extend(['--repo', self.repo])
         
         try:
-            result = subprocess.run(
-                ['gh'] + args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            result = self.gh.run(args).check()
             
             if result.stdout.strip():
-                milestone_titles = result.stdout.strip().split('\n')
-                # Get milestone numbers too
-                args_with_number = ['api', 'repos/{owner}/{repo}/milestones', '--jq', r'.[] | "\(.title)|\(.number)"']
-                if self.repo:
-                    args_with_number.extend(['--repo', self.repo])
-                
-                result = subprocess.run(
-                    ['gh'] + args_with_number,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
                 for line in result.stdout.strip().split('\n'):
                     if '|' in line:
                         title, number = line.rsplit('|', 1)
@@ -166,7 +159,7 @@ class GitHubIssueCreator:
                 logger.debug("  Could not load milestones (may need to create them)")
     
     def _ensure_milestone_exists(self, milestone: str) -> Optional[int]:
-        """Create a milestone if it doesn't exist and return its number."""
+        """Create a milestone if it doesn't exist and return its number (None if creating it failed)."""
         if milestone in self.existing_milestones:
             return self.existing_milestones[milestone]
         
@@ -179,26 +172,19 @@ class GitHubIssueCreator:
         if self.repo:
             args.extend(['--repo', self.repo])
         
+        milestone_number = None
         try:
-            result = subprocess.run(
-                ['gh'] + args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            result = self.gh.run(args).check()
             
             if result.stdout.strip():
                 milestone_number = int(result.stdout.strip())
-                self.existing_milestones[milestone] = milestone_number
                 logger.info(f"  ✓ Created milestone: {milestone}")
-                return milestone_number
-        except subprocess.CalledProcessError as e:
-            if self.verbose:
-                logger.debug(f"  Milestone creation failed: {milestone}")
-            # Add to cache anyway in case it already exists
-            return None
+        except subprocess.CalledProcessError:
+            logger.warning(f"  ⚠️  Could not create milestone: {milestone}")
         
-        return None
+        # Cached even on failure, so the tickets that use it don't each try again
+        self.existing_milestones[milestone] = milestone_number
+        return milestone_number
     
     def _ensure_label_exists(self, label: str):
         """Create a label if it doesn't exist."""
@@ -214,12 +200,7 @@ class GitHubIssueCreator:
             args.extend(['--repo', self.repo])
         
         try:
-            subprocess.run(
-                ['gh'] + args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self.gh.run(args).check()
             self.existing_labels.add(label)
             logger.info(f"  ✓ Created label: {label}")
         except subprocess.CalledProcessError as e:
@@ -228,35 +209,52 @@ class GitHubIssueCreator:
             # Add to cache anyway in case it already exists
             self.existing_labels.add(label)
     
-    def _run_gh_command(self, args: List[str], capture_output: bool = True) -> Optional[str]:
+    def resolve_labels_and_milestones(self, items: List[Dict[str, Any]]):
+        """
+        Create every label and milestone the items use that is not in the caches yet.
+        
+        Done once before any issue is created, so creating the epic and the
+        tickets finds everything in the caches and runs no extra gh commands.
+        
+        Args:
+            items: Epic and ticket dicts with optional 'labels' and 'milestone'
+        """
+        labels = sorted({label for item in items for label in item.get('labels') or []} - self.existing_labels)
+        milestones = sorted({item['milestone'] for item in items if item.get('milestone')} - set(self.existing_milestones))
+        
+        # A dry run loads no caches and creates nothing
+        if self.dry_run or not (labels or milestones):
+            return
+        
+        logger.info(f"🏷️  Creating {len(labels)} label(s) and {len(milestones)} milestone(s)...")
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            jobs = [pool.submit(self._ensure_label_exists, label) for label in labels]
+            jobs += [pool.submit(self._ensure_milestone_exists, milestone) for milestone in milestones]
+            for job in jobs:
+                job.result()
+        logger.info("")
+    
+    def _run_gh_command(self, args: List[str]) -> Optional[str]:
         """
         Run a gh command and return the output.
         
         Args:
             args: Command arguments (excluding 'gh')
-            capture_output: Whether to capture and return output
             
         Returns:
             Command output as string, or None on error
         """
-        cmd = ['gh'] + args
+        command = ' '.join(['gh', *args])
         
         if self.verbose:
-            logger.debug(f"  → Running: {' '.join(cmd)}")
+            logger.debug(f"  → Running: {command}")
         
         if self.dry_run:
-            logger.info(f"  [DRY RUN] Would run: {' '.join(cmd)}")
+            logger.info(f"  [DRY RUN] Would run: {command}")
             return None
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=capture_output,
-                text=True,
-                check=True
-            )
-            
-            output = result.stdout.strip() if capture_output else None
+            output = self.gh.run(args).check().stdout.strip()
             
             if self.verbose and output:
                 logger.debug(f"  ← Output: {output[:100]}..." if len(output) > 100 else f"  ← Output: {output}")
@@ -264,7 +262,7 @@ class GitHubIssueCreator:
             return output
             
         except subprocess.CalledProcessError as e:
-            logger.error(f"❌ Command failed: {' '.join(cmd)}")
+            logger.error(f"❌ Command failed: {command}")
             if e.stderr:
                 # Extract just the error message, not the full help text
                 error_lines = e.stderr.split('\n')
@@ -446,8 +444,9 @@ class GitHubIssueCreator:
         
         if self.dry_run:
             logger.info(f"  [DRY RUN] Would create ticket {ticket_id}")
-            self.created_issues[ticket_id] = 1000 + len(self.created_issues)
-            return self.created_issues[ticket_id]
+            with self._created_lock:
+                self.created_issues[ticket_id] = 1000 + len(self.created_issues)
+                return self.created_issues[ticket_id]
         
         # Run command and get URL
         output = self._run_gh_command(args)
@@ -455,16 +454,81 @@ class GitHubIssueCreator:
         if output:
             issue_number = self._extract_issue_number_from_url(output)
             if issue_number:
-                self.created_issues[ticket_id] = issue_number
-                logger.info(f"  ✅ Created: #{issue_number}")
+                with self._created_lock:
+                    self.created_issues[ticket_id] = issue_number
+                logger.info(f"  ✅ Created {ticket_id}: #{issue_number}")
                 if self.verbose:
                     logger.debug(f"  🔗 URL: {output}")
-                logger.info("")
                 return issue_number
         
         logger.error(f"  ❌ Failed to create ticket {ticket_id}")
         return None
     
+    def _create_and_link(self, ticket: Dict[str, Any], epic_number: Optional[int]) -> Optional[int]:
+        issue_number = self.create_ticket(ticket, epic_number)
+        if issue_number and epic_number:
+            self.link_issue_to_epic(issue_number, epic_number, ticket['id'])
+        return issue_number
+    
+    def create_tickets(self, tickets: List[Dict[str, Any]], epic_number: Optional[int]):
+        """
+        Create tickets concurrently, each only after the tickets it depends on.
+        
+        Up to `workers` tickets are in flight. A ticket starts once every
+        ticket in its 'dependencies' that is also in this batch has finished,
+        so its body can link their issue numbers; otherwise tickets start in
+        file order. Dependencies outside the batch don't hold a ticket back. A
+        dependency cycle is broken at its first ticket in file order.
+        
+        Args:
+            tickets: Ticket dicts as returned by parse_markdown_with_frontmatter
+            epic_number: Parent epic issue number (None if there is no epic)
+        """
+        positions = defaultdict(list)
+        for i, ticket in enumerate(tickets):
+            positions[ticket['id']].append(i)
+        
+        # waiting[i]: tickets that must finish before ticket i starts
+        waiting = {
+            i: {j for dep_id in ticket.get('dependencies') or [] for j in positions.get(dep_id, ()) if j != i}
+            for i, ticket in enumerate(tickets)
+        }
+        dependents = defaultdict(list)
+        for i, deps in waiting.items():
+            for j in deps:
+                dependents[j].append(i)
+        
+        ready = [i for i, deps in waiting.items() if not deps]
+        heapq.heapify(ready)
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while waiting or running:
+                while ready and len(running) < self.workers:
+                    i = heapq.heappop(ready)
+                    del waiting[i]
+                    running[pool.submit(self._create_and_link, tickets[i], epic_number)] = i
+                
+                if not running:
+                    i = min(waiting)
+                    pending = [tickets[j]['id'] for j in sorted(waiting[i])]
+                    logger.warning(f"⚠️  Dependency cycle: creating {tickets[i]['id']} before {', '.join(pending)}")
+                    waiting[i] = set()
+                    heapq.heappush(ready, i)
+                    continue
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = running.pop(future)
+                    future.result()
+                    for j in dependents[i]:
+                        if j in waiting:
+                            waiting[j].discard(i)
+                            if not waiting[j]:
+                                heapq.heappush(ready, j)
+        
+        logger.info("")
+    
     def update_epic_with_tickets(self, epic_number: int):
         """Update the epic with links to all created tickets."""
         logger.info(f"🔄 Updating Epic #{epic_number} with ticket links...")
@@ -508,11 +572,7 @@ class GitHubIssueCreator:
         if self.repo:
             edit_args.extend(['--repo', self.repo])
         
-        result = subprocess.run(
-            ['gh'] + edit_args,
-            capture_output=True,
-            text=True
-        )
+        result = self.gh.run(edit_args)
         
         if result.returncode == 0:
             logger.info(f"  ✅ Updated epic with {len(self.created_issues)} ticket links\n")
@@ -554,6 +614,9 @@ class GitHubIssueCreator:
         
         data = self.parse_markdown_with_frontmatter(file_path)
         
+        # Labels and milestones once, up front
+        self.resolve_labels_and_milestones(([data['epic']] if data.get('epic') else []) + data['tickets'])
+        
         # Create epic
         epic_number = None
         if data.get('epic'):
@@ -561,12 +624,8 @@ class GitHubIssueCreator:
         
         # Create tickets
         if data['tickets']:
-            logger.info(f"📋 Creating {len(data['tickets'])} ticket(s)...\n")
-            for i, ticket in enumerate(data['tickets'], 1):
-                logger.info(f"[{i}/{len(data['tickets'])}]")
-                issue_number = self.create_ticket(ticket, epic_number)
-                if issue_number and epic_number:
-                    self.link_issue_to_epic(issue_number, epic_number, ticket['id'])
+            logger.info(f"📋 Creating {len(data['tickets'])} ticket(s), {self.workers} at a time...\n")
+            self.create_tickets(data['tickets'], epic_number)
         
         # Update epic with ticket links
         if epic_number and self.created_issues:
@@ -591,6 +650,9 @@ class GitHubIssueCreator:
             repo_part = f"/{self.repo}" if self.repo else "/<current-repo>"
             logger.info(f"\n  🔗 View Epic: https://github.com{repo_part}/issues/{epic_number}")
         
+        if self.gh.stats.calls:
+            logger.info(f"\n  ⏱️  {self.gh.stats.summary()}")
+        
         logger.info(f"{'='*60}\n")
 
 
@@ -604,6 +666,10 @@ def main():
     parser.add_argument('--repo', help='GitHub repo (owner/repo). If not specified, uses current repo.')
     parser.add_argument('--dry-run', action='store_true', help='Preview without creating issues')
     parser.add_argument('-v', '--verbose', action='store_true', help='Show detailed command output')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=DEFAULT_WORKERS, metavar='N',
+        help=f'Tickets created at once (default: {DEFAULT_WORKERS})'
+    )
     
     args = parser.parse_args()
     
@@ -613,7 +679,7 @@ def main():
         sys.exit(1)
     
     # Create issues
-    creator = GitHubIssueCreator(args.repo, args.dry_run, args.verbose)
+    creator = GitHubIssueCreator(args.repo, args.dry_run, args.verbose, workers=args.jobs)
     creator.create_issues_from_file(args.file)
 
 
@@ -1,6 +1,9 @@
 """Tests for issues_create_epic."""
 
+import time
+
 import pytest
+from gh_runner import GhRunner, fake
 from issues_create_epic import GitHubIssueCreator
 
 
@@ -22,3 +25,133 @@ def test_extract_issue_number_from_url():
     # Invalid URL
     assert creator._extract_issue_number_from_url("not a url") is None
     assert creator._extract_issue_number_from_url("https://github.com/owner/repo") is None
+
+
+def ticket(ticket_id, *dependencies, labels=(), milestone=None):
+    return {
+        'id': ticket_id, 'title': f"Ticket {ticket_id}", 'content': "Body",
+        'dependencies': list(dependencies), 'labels': list(labels), 'milestone': milestone,
+    }
+
+
+def record_order(creator, monkeypatch, delay=0.05):
+    """Make create_ticket log start/end events and take `delay` seconds."""
+    events = []
+    create_ticket = creator.create_ticket
+
+    def slow_create_ticket(ticket, epic_number):
+        events.append(('start', ticket['id']))
+        time.sleep(delay)
+        number = create_ticket(ticket, epic_number)
+        events.append(('end', ticket['id']))
+        return number
+
+    monkeypatch.setattr(creator, 'create_ticket', slow_create_ticket)
+    return events
+
+
+def test_create_tickets_waits_for_dependencies(monkeypatch):
+    """Test that tickets run concurrently but never before the tickets they depend on."""
+    creator = GitHubIssueCreator(dry_run=True, workers=3)
+    events = record_order(creator, monkeypatch)
+    tickets = [
+        ticket('C', 'B'),
+        ticket('B', 'A'),
+        ticket('A'),
+        ticket('D'),
+        ticket('E', 'A', 'D', 'OUTSIDE-1'),
+    ]
+
+    start = time.perf_counter()
+    creator.create_tickets(tickets, epic_number=1)
+    elapsed = time.perf_counter() - start
+
+    position = {event: i for i, event in enumerate(events)}
+    for t in tickets:
+        for dep in t['dependencies']:
+            if dep != 'OUTSIDE-1':
+                assert position[('end', dep)] < position[('start', t['id'])]
+    assert len(creator.created_issues) == 5
+    assert elapsed < 5 * 0.05  # A and D (then B and E) overlapped
+
+
+def test_create_tickets_breaks_dependency_cycles(monkeypatch):
+    """Test that a cycle starts at its first ticket in file order instead of hanging."""
+    creator = GitHubIssueCreator(dry_run=True, workers=2)
+    events = record_order(creator, monkeypatch, delay=0)
+
+    creator.create_tickets([ticket('X', 'Y'), ticket('Y', 'X'), ticket('Z', 'Y')], epic_number=None)
+
+    assert [ticket_id for kind, ticket_id in events if kind == 'start'] == ['X', 'Y', 'Z']
+
+
+def test_create_issues_resolves_labels_once_and_links_dependencies(tmp_path):
+    """Test a full run against a fake gh: labels/milestones first, dependency links in bodies."""
+    epic_file = tmp_path / "epic.md"
+    epic_file.write_text(
+        "---\nepic:\n  title: Epic\n  labels: [epic]\n  description: Desc\n---\n\n"
+        + "".join(
+            f"---\nticket:\n  id: T-{n}\n  title: Ticket {n}\n  labels: [{label}]\n  milestone: {milestone}\n"
+            f"  dependencies: {deps}\n---\n\nBody {n}\n\n"
+            for n, label, milestone, deps in [
+                (1, "new-label", "Sprint 1", []),
+                (2, "bug", "Sprint 9", ["T-1"]),
+                (3, "new-label", "Sprint 9", ["T-1", "T-2"]),
+                (4, "bug", "Sprint 1", []),
+            ]
+        )
+    )
+    interactions = [
+        fake.interaction(["--version"], "gh version fake\n"),
+        fake.interaction(["auth", "status"]),
+        fake.interaction(["label", "list"], "epic\nbug\n", prefix=True),
+        fake.interaction(["label", "create"], prefix=True),
+        fake.interaction(["api", "repos/{owner}/{repo}/milestones", "--jq"], "Sprint 1|1\n", prefix=True),
+        fake.interaction(["api", "repos/{owner}/{repo}/milestones", "-f"], "{seq}\n", prefix=True, sequence=True, start=2),
+        fake.interaction(["issue", "create"], "https://github.com/o/r/issues/{seq}\n", prefix=True, sequence=True),
+        fake.interaction(["issue", "comment"], prefix=True),
+        fake.interaction(["issue", "view"], "## Child Issues\n*Will be updated with ticket links*\n", prefix=True),
+        fake.interaction(["issue", "edit"], prefix=True),
+    ]
+
+    with fake.on_path(tmp_path / "bin", interactions), GhRunner(concurrency=4) as gh:
+        creator = GitHubIssueCreator(gh=gh, workers=4)
+        creator.create_issues_from_file(str(epic_file))
+
+    commands = [call.args for call in gh.stats.calls]
+    creates = [i for i, args in enumerate(commands) if args[:2] == ["issue", "create"]]
+    setup = [args[:3] for args in commands if args[:2] == ["label", "create"] or "-f" in args[:3]]
+    assert setup == [["label", "create", "new-label"], ["api", "repos/{owner}/{repo}/milestones", "-f"]]
+    assert all(i < creates[0] for i, args in enumerate(commands) if args[:3] in setup)
+
+    assert creator.created_issues.keys() == {"T-1", "T-2", "T-3", "T-4"}
+    bodies = {args[args.index("--title") + 1]: args[args.index("--body") + 1] for args in commands if args[:2] == ["issue", "create"]}
+    t1, t2 = creator.created_issues["T-1"], creator.created_issues["T-2"]
+    assert f"**Dependencies:** #{t1}, #{t2}" in bodies["T-3: Ticket 3"]
+    assert "not yet created" not in "".join(bodies.values())
+
+
+def test_failed_milestone_is_not_retried_per_ticket(tmp_path):
+    """Test that a milestone that could not be created is tried once, not once per ticket."""
+    epic_file = tmp_path / "epic.md"
+    epic_file.write_text("".join(
+        f"---\nticket:\n  id: T-{n}\n  title: Ticket {n}\n  milestone: Sprint 2\n---\n\nBody {n}\n\n"
+        for n in range(1, 5)
+    ))
+    interactions = [
+        fake.interaction(["--version"], "gh version fake\n"),
+        fake.interaction(["auth", "status"]),
+        fake.interaction(["label", "list"], "", prefix=True),
+        fake.interaction(["api", "repos/{owner}/{repo}/milestones", "--jq"], "", prefix=True),
+        fake.interaction(["api", "repos/{owner}/{repo}/milestones", "-f"], stderr="HTTP 403: Forbidden\n", returncode=1, prefix=True),
+        fake.interaction(["issue", "create"], "https://github.com/o/r/issues/{seq}\n", prefix=True, sequence=True),
+    ]
+
+    with fake.on_path(tmp_path / "bin", interactions), GhRunner(concurrency=4) as gh:
+        creator = GitHubIssueCreator(gh=gh, workers=4)
+        creator.create_issues_from_file(str(epic_file))
+
+    commands = [call.args for call in gh.stats.calls]
+    assert sum(1 for args in commands if "-f" in args[:3]) == 1
+    assert creator.existing_milestones == {"Sprint 2": None}
+    assert len(creator.created_issues) == 4
@@ -0,0 +1,100 @@
+"""
+Benchmark `issues-sync pull` end to end against a fake gh.
+
+Synthetic issues are served by gh_runner.fake in pages of 100, exactly as
+`gh api graphql --paginate --jq ...nodes[]` prints them, so the run covers the
+real streaming, folder writes and index updates without a network.
+
+Cases:
+  pull    first pull into an empty directory (every issue created)
+  repull  `pull --full` over the result (every issue unchanged)
+
+Usage:
+  python -m issues_sync.benchmark [--sizes 100 1000 10000] [--latency 0.5] [--jobs N]
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+from gh_runner import GhRunner, fake
+from gh_runner.bench import measure, print_header, print_row
+
+from . import sync
+
+PAGE_SIZE = 100
+LABELS = ["bug", "enhancement", "documentation", "performance", "good first issue"]
+
+
+def make_issue_node(n):
+    """A deterministic GraphQL issue node, as ISSUES_QUERY returns it."""
+    closed = n % 3 == 0
+    return {
+        "number": n,
+        "title": f"Issue {n}: handle case {n % 97} in the parser",
+        "body": (f"Steps to reproduce issue {n}:\n\n1. Open the app\n2. Do thing {n}\n\n"
+                 + "Expected it to work. " * 20),
+        "state": "CLOSED" if closed else "OPEN",
+        "createdAt": f"2024-01-01T00:00:{n % 60:02d}Z",
+        "updatedAt": f"2024-06-01T{n // 3600 % 24:02d}:{n // 60 % 60:02d}:{n % 60:02d}Z",
+        "closedAt": "2024-07-01T00:00:00Z" if closed else None,
+        "author": {"login": f"user{n % 50}"},
+        "labels": {"nodes": [{"name": LABELS[(n + i) % len(LABELS)]} for i in range(n % 3)]},
+        "assignees": {"nodes": [{"login": f"user{n % 7}"}] if n % 2 else []},
+        "milestone": {"title": f"Sprint {n % 10}"} if n % 4 == 0 else None,
+        "comments": {"totalCount": n % 5, "nodes": [
+            {"author": {"login": f"user{(n + i) % 50}"}, "createdAt": "2024-02-01T00:00:00Z", "body": f"Comment {i} on {n}."}
+            for i in range(n % 5)
+        ]},
+    }
+
+
+def issue_interactions(count):
+    """Cassette answering the paginated issues query with `count` issues."""
+    nodes = [make_issue_node(n) for n in range(1, count + 1)]
+    pages = [fake.json_lines(nodes[i:i + PAGE_SIZE]) for i in range(0, len(nodes), PAGE_SIZE)]
+    return [fake.interaction(["api", "graphql", "--paginate"], pages or [""], prefix=True)]
+
+
+def run_case(case, count, workers):
+    sync.GH = GhRunner()
+    try:
+        # The per-issue log would dominate at 10k issues
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            with measure() as measurement:
+                sync.pull_all_issues(workers=workers, full=True)
+        print_row(case, count, measurement, len(sync.GH.stats.calls))
+    finally:
+        sync.GH.close()
+
+
+def bench_pull(sizes, latency, page_latency, workers):
+    print_header("issues-sync pull", latency)
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            with fake.on_path(tmp / "bin", issue_interactions(count), latency, page_latency):
+                sync.set_issues_dir(str(tmp / "repo"))
+                sync.ISSUES_DIR.mkdir(parents=True)
+                run_case("pull", count, workers)
+                run_case("repull", count, workers)
+                written = sum(1 for _ in sync.ISSUES_DIR.glob("issue-*/issue-*.md"))
+                if written != count:
+                    raise SystemExit(f"expected {count} issue files, found {written}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark issues-sync pull against a fake gh.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Issue counts")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the fake gh answers a call")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Extra seconds per further page of 100")
+    parser.add_argument("-j", "--jobs", type=int, help="Parallel folder writes (as `pull --jobs`)")
+    args = parser.parse_args()
+
+    bench_pull(args.sizes, args.latency, args.page_latency, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Issue rows of the SQLite index over .github/issues/ (see sync_index).
+
+Listings filter on state and labels; the index keeps them in step with the
+markdown files so listing issues never re-parses them.
+"""
+
+from sync_index import INDEX_FILE, SyncIndex, file_fields
+
+ISSUES = SyncIndex(table="issues", labels_table="issue_labels")
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def issue_entry(frontmatter, file, directory, data):
+    """Build an index row from an issue file's frontmatter.
+
+    Args:
+        frontmatter: Frontmatter dict as written by the sync (issue_number, title, ...)
+        file: The issue's markdown file, already written
+        directory: The issues directory
+        data: The file's bytes
+    """
+    return {
+        'number': frontmatter['issue_number'],
+        'title': str(frontmatter.get('title', '')),
+        'state': str(frontmatter.get('state', '')),
+        'author': _text(frontmatter.get('author')),
+        'labels': [str(label) for label in frontmatter.get('labels') or []],
+        'created_at': _text(frontmatter.get('created_at')),
+        'updated_at': _text(frontmatter.get('updated_at')),
+        'closed_at': _text(frontmatter.get('closed_at')),
+        **file_fields(file, directory, data),
+    }
@@ -6,16 +6,56 @@ Manages local issue documentation in .github/issues/ folder
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
+from gh_runner import GhRunner
+
+from . import index
 
 # Configuration - can be overridden via --output flag
 ISSUES_DIR = Path(".github/issues")
 
+# Every gh call goes through one runner: it caps concurrent gh processes, waits
+# out GitHub rate limits and keeps per-call latency for the end-of-run summary
+GH = GhRunner()
+
+# libyaml's parser when available: reading every file for an index rebuild is
+# dominated by YAML parsing
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Kept inside ISSUES_DIR; records the newest updatedAt seen so pulls can be incremental
+SYNC_STATE_FILE = ".sync-state.json"
+
+# One page of issues with everything the markdown needs; `gh api graphql --paginate`
+# follows $endCursor until pageInfo.hasNextPage is false. filterBy.since selects
+# issues updated at or after the watermark (null: all issues). Issues with more
+# than 100 comments get theirs from get_issue_comments() instead.
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $since: DateTime, $endCursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $endCursor, filterBy: {since: $since},
+           orderBy: {field: UPDATED_AT, direction: ASC}) {
+      nodes {
+        number title body state createdAt updatedAt closedAt
+        author { login }
+        labels(first: 100) { nodes { name } }
+        assignees(first: 100) { nodes { login } }
+        milestone { title }
+        comments(first: 100) { totalCount nodes { author { login } createdAt body } }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
 
 def set_issues_dir(output_path: str | None) -> None:
     """Set the issues directory based on output path."""
@@ -29,65 +69,157 @@ def set_issues_dir(output_path: str | None) -> None:
 def run_gh_command(args):
     """Run a gh CLI command and return the output."""
     try:
-        result = subprocess.run(
-            ["gh"] + args,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
+        return GH.run(args).check().stdout.strip()
     except subprocess.CalledProcessError as e:
         print(f"Error running gh command: {e}")
         print(f"Error output: {e.stderr}")
         return None
 
 
+def stream_gh_json(args):
+    """Run a gh command and yield each JSON value as its line arrives.
+    
+    Meant for `--jq` filters that emit one value per line, so a paginated
+    response is processed page by page instead of being buffered whole.
+    
+    Raises:
+        subprocess.CalledProcessError: gh exited with an error (after the
+            values it did print have been yielded)
+    """
+    for line in GH.stream(args):
+        if line.strip():
+            yield json.loads(line)
+
+
 def ensure_issues_directory():
     """Create the issues directory if it doesn't exist."""
     ISSUES_DIR.mkdir(parents=True, exist_ok=True)
     print(f"✓ Issues directory ready: {ISSUES_DIR}")
 
 
-def pull_all_issues():
-    """Pull all issues from GitHub and create/update local folders."""
-    print("\n📥 Pulling all issues from GitHub...")
+def load_sync_state():
+    """Read the sync state saved by the last pull ({} if there is none)."""
+    try:
+        return json.loads((ISSUES_DIR / SYNC_STATE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(state):
+    """Write the sync state next to the issue folders."""
+    (ISSUES_DIR / SYNC_STATE_FILE).write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def issue_from_node(node):
+    """Convert a GraphQL issue node to the shape `gh issue list --json` produces.
     
-    # Get all issues (open and closed) as JSON
-    issues_json = run_gh_command([
-        "issue", "list",
-        "--state", "all",
-        "--limit", "1000",
-        "--json", "number,title,body,state,labels,assignees,milestone,createdAt,updatedAt,closedAt,author,comments"
-    ])
+    `comments` is only set when the node holds all of them; _write_issue
+    fetches them separately for issues with more than 100.
+    """
+    issue = {
+        **node,
+        'author': node.get('author') or {},
+        'labels': node['labels']['nodes'],
+        'assignees': node['assignees']['nodes'],
+    }
     
-    if not issues_json:
-        print("Failed to fetch issues")
-        return
+    comments = issue.pop('comments')
+    if len(comments['nodes']) >= comments['totalCount']:
+        issue['comments'] = [
+            {**comment, 'author': comment.get('author') or {}}
+            for comment in comments['nodes']
+        ]
     
-    issues = json.loads(issues_json)
-    print(f"Found {len(issues)} issues")
+    return issue
+
+
+def get_issue_comments(issue_number):
+    """Get every comment on an issue.
     
-    for issue in issues:
-        create_issue_folder(issue)
+    Raises:
+        subprocess.CalledProcessError: gh failed; the pull stops before the
+            watermark moves, so the issue is fetched again next time
+    """
+    comments_json = GH.run([
+        "issue", "view", str(issue_number),
+        "--json", "comments",
+        "--jq", ".comments"
+    ]).check().stdout
+    return [
+        {**comment, 'author': comment.get('author') or {}}
+        for comment in json.loads(comments_json or "[]")
+    ]
+
+
+def fetch_issues(since=None):
+    """Stream every issue of the current repository, page by page.
     
-    print("✓ All issues synced")
+    Args:
+        since: Only issues updated at or after this ISO 8601 timestamp
+    
+    Yields:
+        dict: Issues in `gh issue list --json` shape, least recently updated first
+    """
+    args = [
+        "api", "graphql", "--paginate",
+        "-f", f"query={ISSUES_QUERY}",
+        "-F", "owner={owner}",
+        "-F", "name={repo}",
+        "--jq", ".data.repository.issues.nodes[]"
+    ]
+    if since:
+        args += ["-f", f"since={since}"]
+    for node in stream_gh_json(args):
+        yield issue_from_node(node)
 
 
-def create_issue_folder(issue_data):
-    """Create a folder and markdown file for an issue."""
-    issue_number = issue_data['number']
-    issue_dir = ISSUES_DIR / f"issue-{issue_number:04d}"
-    issue_dir.mkdir(exist_ok=True)
+def pull_all_issues(workers=None, full=False):
+    """Pull issues from GitHub and create/update local folders.
     
-    # Create the markdown file with YAML frontmatter
-    issue_file = issue_dir / f"issue-{issue_number:04d}.md"
+    Issues are fetched a page at a time and written as they arrive, so there is
+    no cap on their number and memory stays flat. After the first pull only
+    issues updated since the saved watermark are requested and merged into the
+    existing tree.
     
-    # Get comments
-    comments = issue_data.get('comments', [])
+    Args:
+        workers: Thread count for folder writes
+        full: Ignore the saved watermark and fetch every issue
+    """
+    state = load_sync_state()
+    watermark = None if full else state.get("updated_at")
+    newest = watermark
+    
+    if watermark:
+        print(f"\n📥 Pulling issues updated since {watermark}...")
+    else:
+        print("\n📥 Pulling all issues from GitHub...")
+    
+    def tracked(issues):
+        nonlocal newest
+        for issue in issues:
+            # ISO 8601 UTC timestamps compare correctly as strings
+            newest = max(newest or "", issue['updatedAt'])
+            yield issue
+    
+    try:
+        counts = write_issue_folders(tracked(fetch_issues(since=watermark)), workers=workers)
+    except subprocess.CalledProcessError as e:
+        # Issues already written stay; the watermark is only advanced after a complete pull
+        print(f"Error running gh command: {e}")
+        print(f"Error output: {e.stderr}")
+        print("Failed to fetch issues")
+        return
     
-    # Prepare frontmatter data
-    frontmatter = {
-        'issue_number': issue_number,
+    print_sync_summary(counts)
+    if newest:
+        save_sync_state({**state, "updated_at": newest})
+
+
+def issue_frontmatter(issue_data):
+    """The YAML frontmatter fields of an issue's markdown file."""
+    comments = issue_data.get('comments', [])
+    return {
+        'issue_number': issue_data['number'],
         'title': issue_data['title'],
         'state': issue_data['state'],
         'created_at': issue_data['createdAt'],
@@ -99,37 +231,226 @@ def create_issue_folder(issue_data):
         'milestone': issue_data.get('milestone', {}).get('title') if issue_data.get('milestone') else None,
         'comment_count': len(comments)
     }
+
+
+def render_issue_markdown(issue_data):
+    """Render an issue (as returned by `gh issue list/view --json`) to markdown with YAML frontmatter."""
+    issue_number = issue_data['number']
+    comments = issue_data.get('comments', [])
+    frontmatter = issue_frontmatter(issue_data)
+    
+    parts = [
+        "---\n",
+        yaml.dump(frontmatter, default_flow_style=False),
+        "---\n\n",
+        f"# Issue #{issue_number}: {issue_data['title']}\n\n",
+    ]
+    if issue_data.get('body'):
+        parts += ["## Description\n\n", issue_data['body'], "\n\n"]
+    
+    # Comments section
+    if comments:
+        parts.append("## Comments\n\n")
+        for comment in comments:
+            author = comment.get('author', {}).get('login', 'unknown')
+            created_at = comment.get('createdAt', '')
+            body = comment.get('body', '')
+            parts += [f"### @{author} - {created_at}\n\n", body, "\n\n---\n\n"]
+    
+    parts += ["## Notes\n\n", "_Add your implementation notes, decisions, and documentation here._\n"]
+    return "".join(parts)
+
+
+def write_if_changed(path, content):
+    """Write content to path unless the file already holds exactly that content.
     
-    # Write the issue file
-    with open(issue_file, 'w') as f:
-        f.write("---\n")
-        f.write(yaml.dump(frontmatter, default_flow_style=False))
-        f.write("---\n\n")
-        f.write(f"# Issue #{issue_number}: {issue_data['title']}\n\n")
-        if issue_data.get('body'):
-            f.write("## Description\n\n")
-            f.write(issue_data['body'])
-            f.write("\n\n")
-        
-        # Write comments section
-        if comments:
-            f.write("## Comments\n\n")
-            for comment in comments:
-                author = comment.get('author', {}).get('login', 'unknown')
-                created_at = comment.get('createdAt', '')
-                body = comment.get('body', '')
-                
-                f.write(f"### @{author} - {created_at}\n\n")
-                f.write(body)
-                f.write("\n\n---\n\n")
-        
-        f.write("## Notes\n\n")
-        f.write("_Add your implementation notes, decisions, and documentation here._\n")
+    Returns:
+        str: "created", "updated" or "unchanged"
+    """
+    # Compare bytes: text mode would translate the \r\n that issue bodies often contain
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return "unchanged"
+        status = "updated"
+    except FileNotFoundError:
+        status = "created"
+    path.write_bytes(data)
+    return status
+
+
+def open_index(rebuild=False):
+    """Open the issue index, bringing it in step with the markdown files.
+    
+    A new or outdated index is built from the files; otherwise only files
+    changed since they were indexed (e.g. by hand or by `git pull`) are re-read.
+    
+    Args:
+        rebuild: Rebuild from every file even if the index looks current
+    """
+    return index.ISSUES.open(ISSUES_DIR, "issue-*/issue-*.md", read_issue_entry, rebuild=rebuild)
+
+
+def read_issue_entry(issue_file, data):
+    """The index entry for an issue markdown file, or None if it has no issue frontmatter."""
+    text = data.decode("utf-8")
+    # The closing delimiter is a line of its own; titles may contain "---"
+    head, found, _ = text[4:].partition("\n---\n")
+    try:
+        frontmatter = yaml.load(head, Loader=YAML_LOADER) if text.startswith("---\n") and found else None
+    except yaml.YAMLError as e:
+        print(f"  ⚠️  Skipping {issue_file}: {e}")
+        return None
+    if isinstance(frontmatter, dict) and frontmatter.get('issue_number') is not None:
+        return index.issue_entry(frontmatter, issue_file, ISSUES_DIR, data)
+    return None
+
+
+def _write_issue(issue_data):
+    """Write an issue's markdown file if it changed; returns (status, index entry)."""
+    issue_number = issue_data['number']
+    if 'comments' not in issue_data:
+        issue_data['comments'] = get_issue_comments(issue_number)
+    issue_dir = ISSUES_DIR / f"issue-{issue_number:04d}"
+    issue_dir.mkdir(exist_ok=True)
+    issue_file = issue_dir / f"issue-{issue_number:04d}.md"
+    content = render_issue_markdown(issue_data)
+    status = write_if_changed(issue_file, content)
+    entry = index.issue_entry(issue_frontmatter(issue_data), issue_file, ISSUES_DIR, content.encode("utf-8"))
+    return status, entry
+
+
+def write_issue_folder(issue_data):
+    """Write an issue's folder and markdown file, skipping the write if nothing changed.
     
+    The issue index is updated either way.
+    
+    Returns:
+        str: "created", "updated" or "unchanged"
+    """
+    status, entry = _write_issue(issue_data)
+    conn = open_index()
+    try:
+        with conn:
+            index.ISSUES.upsert(conn, entry)
+    finally:
+        conn.close()
+    return status
+
+
+def _print_issue_status(issue_data, status):
+    comments = issue_data.get('comments', [])
     comment_info = f" ({len(comments)} comments)" if comments else ""
-    print(f"  ✓ Created/Updated issue-{issue_number:04d}: {issue_data['title'][:50]}...{comment_info}")
+    print(f"  ✓ {status.capitalize()} issue-{issue_data['number']:04d}: {issue_data['title'][:50]}...{comment_info}")
+
+
+def create_issue_folder(issue_data):
+    """Create a folder and markdown file for an issue."""
+    status = write_issue_folder(issue_data)
+    _print_issue_status(issue_data, status)
+    return status
+
+
+def write_issue_folders(issues, workers=None):
+    """Write many issue folders from a thread pool, reporting only issues that changed.
+    
+    The issue index is updated from the calling thread as results come in and
+    committed at the end, also when the iterable raises part-way (the issues
+    already submitted are still written and indexed). A failed write is reported
+    and the remaining ones are still indexed before the first error is raised.
+    
+    Args:
+        issues: Iterable of issue dicts in `gh issue list --json` shape; consumed
+            lazily, with a bounded number of writes in flight
+        workers: Thread count (default: ThreadPoolExecutor's default)
     
-    print(f"  ✓ Created/Updated issue-{issue_number:04d}: {issue_data['title'][:50]}...")
+    Returns:
+        Counter: number of issues per status (created/updated/unchanged)
+    """
+    counts = Counter(created=0, updated=0, unchanged=0)
+    window = 4 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    conn = open_index()
+    
+    def finish(issue, future):
+        status, entry = future.result()
+        index.ISSUES.upsert(conn, entry)
+        counts[status] += 1
+        if status != "unchanged":
+            _print_issue_status(issue, status)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Results are taken in input order, so the log follows the fetch order
+            try:
+                for issue in issues:
+                    pending.append((issue, pool.submit(_write_issue, issue)))
+                    if len(pending) >= window:
+                        finish(*pending.popleft())
+            finally:
+                # A failed write must not keep the later ones out of the index
+                error = None
+                while pending:
+                    issue, future = pending.popleft()
+                    try:
+                        finish(issue, future)
+                    except Exception as e:
+                        print(f"  ⚠️  Failed to write issue-{issue['number']:04d}: {e}")
+                        error = error or e
+                if error:
+                    raise error
+    finally:
+        conn.commit()
+        conn.close()
+    return counts
+
+
+def print_sync_summary(counts):
+    """Print the created/updated/unchanged totals of a pull."""
+    total = sum(counts.values())
+    print(
+        f"✓ {total} issues synced: {counts['created']} created, "
+        f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+    )
+
+
+def list_issues(state=None, labels=None, reindex=False):
+    """Print local issues from the index, optionally filtered.
+    
+    Args:
+        state: Only issues in this state (open/closed, any case)
+        labels: Only issues carrying all of these labels
+        reindex: Rebuild the index from the markdown files first
+    """
+    conn = open_index(rebuild=reindex)
+    try:
+        rows = index.ISSUES.query(conn, state=state, labels=labels or ())
+    finally:
+        conn.close()
+    
+    filters = [f"state: {state}"] if state else []
+    filters += [f"label: {label}" for label in labels or []]
+    if not rows:
+        if filters:
+            print(f"No issues match ({', '.join(filters)}).")
+        else:
+            print("No issues found in local directory. Run 'pull' first.")
+        return
+    
+    filter_info = f" ({', '.join(filters)})" if filters else ""
+    print(f"\n📋 {len(rows)} issues{filter_info}:\n")
+    
+    state_counts = Counter()
+    for row in rows:
+        state_counts[row['state']] += 1
+        status_icon = {'OPEN': '📝', 'CLOSED': '✅'}.get(row['state'], '❓')
+        row_labels = json.loads(row['labels'])
+        label_info = f"  [{', '.join(row_labels)}]" if row_labels else ""
+        print(f"  {status_icon} Issue #{row['number']:4d}: {row['title'][:60]}{label_info}")
+    
+    print("\n📈 State Breakdown:")
+    for row_state, count in sorted(state_counts.items()):
+        print(f"  {row_state:8s}: {count}")
 
 
 def parse_frontmatter(content):
@@ -340,7 +661,9 @@ def main():
         epilog="""
 Examples:
   issues-sync pull
+  issues-sync pull --full
   issues-sync pull --output /path/to/repo
+  issues-sync list --state open --label bug
   issues-sync create new_feature.md
   issues-sync epic epic_with_tasks.md
 """
@@ -361,6 +684,41 @@ Examples:
         metavar="DIR",
         help="Output directory for .github/issues/ folder"
     )
+    pull_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        metavar="N",
+        help="Parallel folder writes (default: Python's thread pool default)"
+    )
+    pull_parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"Ignore the saved watermark ({SYNC_STATE_FILE}) and re-download every issue"
+    )
+    
+    # List command
+    list_parser = subparsers.add_parser("list", help="List local issues from the index")
+    list_parser.add_argument(
+        "-o", "--output",
+        metavar="DIR",
+        help="Output directory for .github/issues/ folder"
+    )
+    list_parser.add_argument(
+        "--state",
+        help="Only issues in this state (open, closed)"
+    )
+    list_parser.add_argument(
+        "--label",
+        dest="labels",
+        action="append",
+        metavar="LABEL",
+        help="Only issues with this label (repeat to require several)"
+    )
+    list_parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help=f"Rebuild the index ({index.INDEX_FILE}) from the markdown files first"
+    )
     
     # Create command
     create_parser = subparsers.add_parser("create", help="Create issue from markdown file")
@@ -391,11 +749,16 @@ Examples:
     ensure_issues_directory()
     
     if args.command == "pull":
-        pull_all_issues()
+        pull_all_issues(workers=args.jobs, full=args.full)
+    elif args.command == "list":
+        list_issues(state=args.state, labels=args.labels, reindex=args.reindex)
     elif args.command == "create":
         create_issue_from_file(args.file)
     elif args.command == "epic":
         create_epic_with_children(args.file)
+    
+    if GH.stats.calls:
+        print(f"\n⏱️  {GH.stats.summary()}")
 
 
 if __name__ == "__main__":
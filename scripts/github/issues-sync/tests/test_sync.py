@@ -1,7 +1,13 @@
 """Tests for the issues-sync tool."""
 
+import json
+import os
+import subprocess
+
 import pytest
-from issues_sync.sync import parse_frontmatter
+from gh_runner import GhResult
+from issues_sync import sync
+from issues_sync.sync import parse_frontmatter, write_issue_folder, write_issue_folders
 
 
 class TestParseFrontmatter:
@@ -86,3 +92,291 @@ More content here.
         assert "Line 1" in body
         assert "Line 2" in body
         assert "## Section" in body
+
+
+def make_issue(number, title="Test Issue", body="Body text"):
+    return {
+        'number': number,
+        'title': title,
+        'body': body,
+        'state': 'OPEN',
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z',
+        'closedAt': None,
+        'author': {'login': 'octocat'},
+        'labels': [{'name': 'bug'}],
+        'assignees': [],
+        'milestone': None,
+        'comments': [],
+    }
+
+
+@pytest.fixture
+def issues_dir(tmp_path):
+    """Point the sync module at a temporary .github/issues folder."""
+    sync.set_issues_dir(str(tmp_path))
+    sync.ISSUES_DIR.mkdir(parents=True)
+    yield sync.ISSUES_DIR
+    sync.set_issues_dir(None)
+
+
+class TestWriteIssueFolders:
+    """Tests for change-aware issue folder writes."""
+
+    def test_write_issue_folder_status(self, issues_dir):
+        """Test that a file is only rewritten when its content changed."""
+        issue = make_issue(7, body="Line 1\r\nLine 2")
+        issue_file = issues_dir / "issue-0007" / "issue-0007.md"
+
+        assert write_issue_folder(issue) == "created"
+        mtime = issue_file.stat().st_mtime_ns
+        assert write_issue_folder(issue) == "unchanged"
+        assert issue_file.stat().st_mtime_ns == mtime
+
+        issue['title'] = 'Renamed'
+        assert write_issue_folder(issue) == "updated"
+        assert "# Issue #7: Renamed" in issue_file.read_text(encoding="utf-8")
+
+    def test_write_issue_folders_counts(self, issues_dir, capsys):
+        """Test the per-status counts and that unchanged issues are not reported."""
+        issues = [make_issue(n) for n in range(1, 6)]
+        assert write_issue_folders(issues, workers=3) == {'created': 5, 'updated': 0, 'unchanged': 0}
+
+        issues[2]['body'] = 'Edited'
+        capsys.readouterr()
+        counts = write_issue_folders(issues, workers=3)
+
+        assert counts == {'created': 0, 'updated': 1, 'unchanged': 4}
+        assert capsys.readouterr().out.splitlines() == ["  ✓ Updated issue-0003: Test Issue..."]
+
+    def test_write_issue_folders_indexes_past_a_failure(self, issues_dir, monkeypatch, capsys):
+        """Test that one failed write is reported and re-raised after the others are indexed."""
+        write_issue = sync._write_issue
+
+        def flaky(issue):
+            if issue['number'] == 2:
+                raise OSError("disk full")
+            return write_issue(issue)
+
+        monkeypatch.setattr(sync, "_write_issue", flaky)
+        with pytest.raises(OSError, match="disk full"):
+            write_issue_folders([make_issue(n) for n in range(1, 6)], workers=2)
+
+        conn = sync.open_index()
+        try:
+            assert [row['number'] for row in sync.index.ISSUES.query(conn)] == [1, 3, 4, 5]
+        finally:
+            conn.close()
+        assert "  ⚠️  Failed to write issue-0002: disk full" in capsys.readouterr().out.splitlines()
+
+
+def make_node(number, title="Test Issue", updated_at='2024-01-02T00:00:00Z'):
+    """An issue as the GraphQL query returns it."""
+    return {
+        'number': number,
+        'title': title,
+        'body': 'Body text',
+        'state': 'OPEN',
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': updated_at,
+        'closedAt': None,
+        'author': None,
+        'labels': {'nodes': [{'name': 'bug'}]},
+        'assignees': {'nodes': []},
+        'milestone': None,
+        'comments': {'totalCount': 1, 'nodes': [{'author': {'login': 'octocat'}, 'createdAt': 'z', 'body': 'Hi'}]},
+    }
+
+
+class TestIncrementalPull:
+    """Tests for streamed, watermark-based pulls."""
+
+    def fake_gh(self, monkeypatch, pages):
+        """Serve one list of nodes per gh call, recording the arguments."""
+        calls = []
+
+        def stream_gh_json(args):
+            calls.append(args)
+            yield from pages.pop(0)
+
+        monkeypatch.setattr(sync, "stream_gh_json", stream_gh_json)
+        return calls
+
+    def test_issue_from_node(self):
+        """Test that GraphQL connections are flattened to the gh --json shape."""
+        issue = sync.issue_from_node(make_node(3))
+
+        assert issue['labels'] == [{'name': 'bug'}]
+        assert issue['assignees'] == []
+        assert issue['author'] == {}
+        assert issue['comments'][0]['author']['login'] == 'octocat'
+        assert "author: unknown" in sync.render_issue_markdown(issue)
+
+    def test_more_than_100_comments_are_fetched_per_issue(self, issues_dir, monkeypatch):
+        """Test that an issue whose comments were cut off gets all of them from `gh issue view`."""
+        node = make_node(5, updated_at='2024-04-01T00:00:00Z')
+        node['comments'] = {'totalCount': 101, 'nodes': node['comments']['nodes'] * 100}
+        self.fake_gh(monkeypatch, [[node, make_node(6)]])
+        viewed = []
+
+        def run(args):
+            viewed.append(args)
+            comments = [{'author': None, 'createdAt': 'z', 'body': f'Comment {n}'} for n in range(101)]
+            return GhResult(args, 0, json.dumps(comments), "", 0.0)
+
+        monkeypatch.setattr(sync.GH, "run", run)
+        sync.pull_all_issues()
+
+        assert 'comments' not in sync.issue_from_node(node)
+        assert viewed == [["issue", "view", "5", "--json", "comments", "--jq", ".comments"]]
+        text = (issues_dir / "issue-0005" / "issue-0005.md").read_text(encoding="utf-8")
+        assert "Comment 100" in text and "comment_count: 101" in text
+        assert sync.load_sync_state()['updated_at'] == '2024-04-01T00:00:00Z'
+
+    def test_failed_comment_fetch_keeps_watermark(self, issues_dir, monkeypatch):
+        """Test that an issue whose comments can't be fetched is retried by the next pull."""
+        node = make_node(5, updated_at='2024-04-01T00:00:00Z')
+        node['comments']['totalCount'] = 101
+        self.fake_gh(monkeypatch, [[node]])
+        monkeypatch.setattr(sync.GH, "run", lambda args: GhResult(args, 1, "", "HTTP 502", 0.0))
+
+        sync.pull_all_issues()
+
+        assert not (issues_dir / "issue-0005" / "issue-0005.md").exists()
+        assert sync.load_sync_state() == {}
+
+    def test_pull_uses_saved_watermark(self, issues_dir, monkeypatch):
+        """Test that a second pull only asks for issues updated since the first."""
+        first = [make_node(1), make_node(2, updated_at='2024-03-05T10:00:00Z')]
+        edited = make_node(2, title='Edited', updated_at='2024-03-06T09:30:00Z')
+        calls = self.fake_gh(monkeypatch, [first, [edited], []])
+
+        sync.pull_all_issues()
+        assert not any(arg.startswith("since=") for arg in calls[0])
+        assert sync.load_sync_state()['updated_at'] == '2024-03-05T10:00:00Z'
+
+        sync.pull_all_issues()
+        assert calls[1][-2:] == ["-f", "since=2024-03-05T10:00:00Z"]
+        assert (issues_dir / "issue-0001").is_dir()
+        assert "# Issue #2: Edited" in (issues_dir / "issue-0002" / "issue-0002.md").read_text(encoding="utf-8")
+
+        # Nothing new: the watermark is kept
+        sync.pull_all_issues()
+        assert sync.load_sync_state()['updated_at'] == '2024-03-06T09:30:00Z'
+
+    def test_full_pull_ignores_watermark(self, issues_dir, monkeypatch):
+        """Test that --full re-downloads everything."""
+        sync.save_sync_state({'updated_at': '2024-03-05T10:00:00Z'})
+        calls = self.fake_gh(monkeypatch, [[make_node(1)]])
+
+        sync.pull_all_issues(full=True)
+
+        assert not any(arg.startswith("since=") for arg in calls[0])
+
+    def test_failed_pull_keeps_watermark(self, issues_dir, monkeypatch):
+        """Test that issues before a gh failure are written but the watermark stays put."""
+        sync.save_sync_state({'updated_at': '2024-01-01T00:00:00Z'})
+
+        def stream_gh_json(args):
+            yield make_node(1, updated_at='2024-05-01T00:00:00Z')
+            raise subprocess.CalledProcessError(1, ["gh"], stderr="rate limited")
+
+        monkeypatch.setattr(sync, "stream_gh_json", stream_gh_json)
+        sync.pull_all_issues()
+
+        assert (issues_dir / "issue-0001" / "issue-0001.md").exists()
+        assert sync.load_sync_state()['updated_at'] == '2024-01-01T00:00:00Z'
+
+
+class TestStreamGhJson:
+    """Tests for line-by-line gh output parsing."""
+
+    def test_yields_values_then_raises_on_error(self, tmp_path, monkeypatch):
+        """Test values are parsed per line and a non-zero exit is raised afterwards."""
+        gh = tmp_path / "gh"
+        gh.write_text('#!/bin/sh\necho \'{"number": 1}\'\necho\necho \'{"number": 2}\'\necho oops >&2\nexit 3\n')
+        gh.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        seen = []
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            for value in sync.stream_gh_json(["api", "graphql"]):
+                seen.append(value)
+
+        assert seen == [{'number': 1}, {'number': 2}]
+        assert excinfo.value.stderr.strip() == "oops"
+
+
+class TestIssueIndex:
+    """Tests for the SQLite issue index."""
+
+    def write_issues(self):
+        issues = [make_issue(n) for n in range(1, 5)]
+        issues[1]['state'] = 'CLOSED'
+        issues[2]['labels'] = [{'name': 'bug'}, {'name': 'ui'}]
+        issues[3]['labels'] = []
+        write_issue_folders(issues, workers=2)
+        return issues
+
+    def query(self, **filters):
+        conn = sync.open_index()
+        try:
+            return [row['number'] for row in sync.index.ISSUES.query(conn, **filters)]
+        finally:
+            conn.close()
+
+    def test_writes_update_index(self, issues_dir):
+        """Test that folder writes keep the index in step with the files."""
+        self.write_issues()
+
+        assert self.query() == [1, 2, 3, 4]
+        assert self.query(state='open') == [1, 3, 4]
+        assert self.query(labels=['BUG']) == [1, 2, 3]
+        assert self.query(state='open', labels=['bug', 'ui']) == [3]
+
+        write_issue_folder({**make_issue(2), 'labels': []})
+        assert self.query(labels=['bug']) == [1, 3]
+
+    def test_index_rebuilt_from_files(self, issues_dir):
+        """Test that a missing or outdated index is rebuilt with identical rows."""
+        self.write_issues()
+        conn = sync.open_index()
+        before = [dict(row) for row in conn.execute("SELECT * FROM issues ORDER BY number")]
+        conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        conn = sync.open_index()
+        try:
+            after = [dict(row) for row in conn.execute("SELECT * FROM issues ORDER BY number")]
+        finally:
+            conn.close()
+
+        assert after == before
+        assert after[0]["path"] == "issue-0001/issue-0001.md"
+
+    def test_files_changed_outside_sync_reindexed(self, issues_dir):
+        """Test that hand edits and deleted issue folders reach the index without --reindex."""
+        self.write_issues()
+        assert self.query(state='open') == [1, 3, 4]
+
+        issue_file = issues_dir / "issue-0003" / "issue-0003.md"
+        issue_file.write_text(issue_file.read_text().replace("state: OPEN", "state: CLOSED"))
+        (issues_dir / "issue-0004" / "issue-0004.md").unlink()
+
+        assert self.query(state='open') == [1]
+        assert self.query() == [1, 2, 3]
+
+    def test_list_issues(self, issues_dir, capsys):
+        """Test the filtered listing and its breakdown."""
+        self.write_issues()
+        capsys.readouterr()
+
+        sync.list_issues(state='open', labels=['ui'])
+        out = capsys.readouterr().out
+
+        assert "📋 1 issues (state: open, label: ui):" in out
+        assert "📝 Issue #   3: Test Issue  [bug, ui]" in out
+        assert "OPEN    : 1" in out
+
+        sync.list_issues(state='closed', labels=['ui'])
+        assert capsys.readouterr().out.strip() == "No issues match (state: closed, label: ui)."
@@ -0,0 +1,118 @@
+"""
+Benchmark `pull-requests-sync pull` and `summary` end to end against a fake gh.
+
+Synthetic pull requests, with their changed files and comments, are served by
+gh_runner.fake in pages of PR_PAGE_SIZE, exactly as `gh api graphql --paginate
+--jq ...nodes[]` prints them, so the run covers the real streaming, markdown
+writes and index updates without a network.
+
+Cases:
+  pull     first pull into an empty directory
+  repull   pull again over the result (same content)
+  summary  `summary` from the index
+
+Usage:
+  python -m pull_requests_sync.benchmark [--sizes 100 1000 10000] [--latency 0.5]
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+from gh_runner import GhRunner, fake
+from gh_runner.bench import measure, print_header, print_row
+
+from . import sync
+
+LABELS = ["bug", "enhancement", "documentation", "performance", "dependencies"]
+REVIEW_STATES = ["APPROVED", "CHANGES_REQUESTED", "COMMENTED"]
+
+
+def make_pr_node(n):
+    """A deterministic GraphQL pull request node, as PR_FIELDS selects it."""
+    merged = n % 4 != 0
+    files = [f"src/module_{n % 40}/file_{i}.py" for i in range(n % 12 + 1)]
+    return {
+        "number": n,
+        "title": f"PR {n}: improve module {n % 40}",
+        "body": f"## Summary\n\nChanges for #{n}.\n\n" + "Refactors the module. " * 15,
+        "state": "MERGED" if merged else "OPEN",
+        "isDraft": n % 10 == 0,
+        "url": f"https://github.com/octo/bench/pull/{n}",
+        "createdAt": f"2024-01-01T00:00:{n % 60:02d}Z",
+        "updatedAt": "2024-06-01T00:00:00Z",
+        "closedAt": "2024-06-02T00:00:00Z" if merged else None,
+        "mergedAt": "2024-06-02T00:00:00Z" if merged else None,
+        "headRefName": f"feature/{n}",
+        "baseRefName": "main",
+        "additions": n % 500,
+        "deletions": n % 200,
+        "changedFiles": len(files),
+        "reviewDecision": "APPROVED" if merged else None,
+        "author": {"login": f"user{n % 50}"},
+        "labels": {"nodes": [{"name": LABELS[(n + i) % len(LABELS)]} for i in range(n % 3)]},
+        "assignees": {"nodes": [{"login": f"user{n % 7}"}]},
+        "milestone": {"title": f"Sprint {n % 10}"} if n % 4 == 0 else None,
+        "latestReviews": {"nodes": [
+            {"author": {"login": f"user{(n + i) % 50}"}, "state": REVIEW_STATES[(n + i) % 3], "body": "Looks good."}
+            for i in range(n % 3)
+        ]},
+        "files": {"totalCount": len(files), "nodes": [{"path": path} for path in files]},
+        "comments": {"totalCount": n % 4, "nodes": [
+            {"author": {"login": f"user{i}"}, "createdAt": "2024-05-01T00:00:00Z", "body": f"Comment {i}.",
+             "url": f"https://github.com/octo/bench/pull/{n}#issuecomment-{i}"}
+            for i in range(n % 4)
+        ]},
+    }
+
+
+def pr_interactions(count):
+    """Cassette answering the paginated pull requests query with `count` PRs, newest first."""
+    nodes = [make_pr_node(n) for n in range(count, 0, -1)]
+    size = sync.PR_PAGE_SIZE
+    pages = [fake.json_lines(nodes[i:i + size]) for i in range(0, len(nodes), size)]
+    return [fake.interaction(["api", "graphql", "--paginate"], pages or [""], prefix=True)]
+
+
+def run_case(case, count, action):
+    sync.GH = GhRunner()
+    try:
+        # The per-PR log would dominate at 10k PRs
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            with measure() as measurement:
+                action()
+        print_row(case, count, measurement, len(sync.GH.stats.calls))
+    finally:
+        sync.GH.close()
+
+
+def bench_pull(sizes, latency, page_latency):
+    print_header("pull-requests-sync", latency)
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            with fake.on_path(tmp / "bin", pr_interactions(count), latency, page_latency):
+                prs_dir = tmp / "repo" / ".github" / "pull-requests"
+                prs_dir.mkdir(parents=True)
+                run_case("pull", count, lambda: sync.pull_all_prs(prs_dir))
+                run_case("repull", count, lambda: sync.pull_all_prs(prs_dir))
+                run_case("summary", count, lambda: sync.show_pr_summary(prs_dir))
+                written = sum(1 for _ in prs_dir.glob("pr-*/pr-*.md"))
+                if written != count:
+                    raise SystemExit(f"expected {count} PR files, found {written}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pull-requests-sync against a fake gh.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Pull request counts")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the fake gh answers a call")
+    parser.add_argument("--page-latency", type=float, default=0.0, help=f"Extra seconds per further page of {sync.PR_PAGE_SIZE}")
+    args = parser.parse_args()
+
+    bench_pull(args.sizes, args.latency, args.page_latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Pull request rows of the SQLite index over .github/pull-requests/ (see sync_index).
+
+The summary filters on status and labels; the index keeps them in step with the
+markdown files so the summary never re-parses them.
+"""
+
+from sync_index import INDEX_FILE, SyncIndex, file_fields
+
+PRS = SyncIndex(
+    table="prs",
+    labels_table="pr_labels",
+    extra_columns=(("status", "TEXT NOT NULL"), ("merged_at", "TEXT")),
+    indexed=("status",),
+)
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def pr_entry(frontmatter, file, directory, data):
+    """Build an index row from a PR file's frontmatter.
+
+    Args:
+        frontmatter: Frontmatter dict as written by the sync (pr_number, title, status, ...)
+        file: The PR's markdown file, already written
+        directory: The pull requests directory
+        data: The file's bytes
+    """
+    return {
+        'number': frontmatter['pr_number'],
+        'title': str(frontmatter.get('title', '')),
+        'state': str(frontmatter.get('state', '')),
+        'status': str(frontmatter.get('status', 'UNKNOWN')),
+        'author': _text(frontmatter.get('author')),
+        'labels': [str(label) for label in frontmatter.get('labels') or []],
+        'created_at': _text(frontmatter.get('created_at')),
+        'updated_at': _text(frontmatter.get('updated_at')),
+        'closed_at': _text(frontmatter.get('closed_at')),
+        'merged_at': _text(frontmatter.get('merged_at')),
+        **file_fields(file, directory, data),
+    }
@@ -6,30 +6,181 @@ Manages local pull request documentation in .github/pull-requests/ folder
 
 import os
 import json
+import math
 import subprocess
 import yaml
 import re
 import argparse
 from pathlib import Path
 from datetime import datetime
+from functools import partial
+
+from gh_runner import GhRunner
+
+from . import index
+
+# Every gh call goes through one runner: it caps concurrent gh processes, waits
+# out GitHub rate limits and keeps per-call latency for the end-of-run summary
+GH = GhRunner()
+
+# libyaml's parser when available: reading every file for an index rebuild is
+# dominated by YAML parsing
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Pull requests per GraphQL page; smaller than the maximum of 100 because each
+# one also carries up to 100 changed files and 100 comments
+PR_PAGE_SIZE = 25
+
+# Everything the markdown needs for one PR, including the changed files and
+# comments that used to take a `gh pr diff` and a REST call per PR
+PR_FIELDS = """
+fragment prFields on PullRequest {
+  number title body state isDraft url
+  createdAt updatedAt closedAt mergedAt
+  headRefName baseRefName additions deletions changedFiles reviewDecision
+  author { login }
+  labels(first: 100) { nodes { name } }
+  assignees(first: 100) { nodes { login } }
+  milestone { title }
+  latestReviews(first: 100) { nodes { author { login } state body } }
+  files(first: 100) { totalCount nodes { path } }
+  comments(first: 100) { totalCount nodes { author { login } createdAt body url } }
+}
+"""
+
+# `gh api graphql --paginate` follows $endCursor until pageInfo.hasNextPage is false
+PRS_QUERY = """
+query($owner: String!, $name: String!, $pageSize: Int!, $endCursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $pageSize, after: $endCursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { ...prFields }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+""" + PR_FIELDS
+
+PR_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) { ...prFields }
+  }
+}
+""" + PR_FIELDS
 
 
 def run_gh_command(args):
     """Run a gh CLI command and return the output."""
     try:
-        result = subprocess.run(
-            ["gh"] + args,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
+        return GH.run(args).check().stdout.strip()
     except subprocess.CalledProcessError as e:
         print(f"Error running gh command: {e}")
         print(f"Error output: {e.stderr}")
         return None
 
 
+def stream_gh_json(args):
+    """Run a gh command and yield each JSON value as its line arrives.
+    
+    Meant for `--jq` filters that emit one value per line, so a paginated
+    response is processed page by page instead of being buffered whole.
+    
+    Raises:
+        subprocess.CalledProcessError: gh exited with an error (after the
+            values it did print have been yielded)
+    """
+    for line in GH.stream(args):
+        if line.strip():
+            yield json.loads(line)
+
+
+def pr_from_node(node):
+    """Convert a GraphQL pull request node to the shape `gh pr list --json` produces.
+    
+    `files` (paths) and `comments` are only set when the node holds all of them;
+    create_pr_folder fetches the ones that were cut off at 100 separately.
+    """
+    pr = {
+        **node,
+        'author': node.get('author') or {},
+        'reviewDecision': node.get('reviewDecision') or '',
+        'labels': node['labels']['nodes'],
+        'assignees': node['assignees']['nodes'],
+        'latestReviews': [
+            {**review, 'author': review.get('author') or {}}
+            for review in node['latestReviews']['nodes']
+        ],
+    }
+    
+    files = pr.pop('files', None)
+    if files is not None and len(files['nodes']) >= files['totalCount']:
+        pr['files'] = [file['path'] for file in files['nodes']]
+    
+    comments = pr.pop('comments', None)
+    if comments is not None and len(comments['nodes']) >= comments['totalCount']:
+        pr['comments'] = [
+            {**comment, 'author': comment.get('author') or {}, 'html_url': comment.get('url', '')}
+            for comment in comments['nodes']
+        ]
+    
+    return pr
+
+
+def fetch_prs():
+    """Stream every pull request of the current repository, newest first, page by page."""
+    args = [
+        "api", "graphql", "--paginate",
+        "-f", f"query={PRS_QUERY}",
+        "-F", "owner={owner}",
+        "-F", "name={repo}",
+        "-F", f"pageSize={PR_PAGE_SIZE}",
+        "--jq", ".data.repository.pullRequests.nodes[]"
+    ]
+    for node in stream_gh_json(args):
+        yield pr_from_node(node)
+
+
+def fetch_pr(pr_number):
+    """Get one PR, with its changed files and comments, in a single GraphQL request."""
+    pr_json = run_gh_command([
+        "api", "graphql",
+        "-f", f"query={PR_QUERY}",
+        "-F", "owner={owner}",
+        "-F", "name={repo}",
+        "-F", f"number={pr_number}",
+        "--jq", ".data.repository.pullRequest"
+    ])
+    
+    if not pr_json:
+        return None
+    
+    return pr_from_node(json.loads(pr_json))
+
+
+def fallback_calls(pr_data):
+    """Number of extra gh calls create_pr_folder makes for a PR (files/comments not included)."""
+    return ('files' not in pr_data) + ('comments' not in pr_data)
+
+
+def print_request_report(pr_count, fallbacks):
+    """Compare the gh usage of a bulk pull with fetching files and comments PR by PR.
+    
+    Args:
+        pr_count: Pull requests synced
+        fallbacks: Separate files/comments fetches for PRs with more than 100 of either
+    """
+    pages = max(1, math.ceil(pr_count / PR_PAGE_SIZE))
+    # Per PR: `gh pr diff --name-only` and the REST comments endpoint, after one
+    # `gh pr list` that pages through 100 PRs per request
+    per_pr_processes = 1 + 2 * pr_count
+    per_pr_requests = max(1, math.ceil(pr_count / 100)) + 2 * pr_count
+    processes = 1 + fallbacks
+    print(
+        f"📉 gh usage: {processes} process{'es' if processes != 1 else ''}, {pages + fallbacks} API requests "
+        f"(per-PR fetching: {per_pr_processes} processes, {per_pr_requests} requests)"
+    )
+
+
 def ensure_prs_directory(output_dir: Path):
     """Create the pull requests directory if it doesn't exist."""
     prs_dir = output_dir / ".github" / "pull-requests"
@@ -38,48 +189,62 @@ def ensure_prs_directory(output_dir: Path):
     return prs_dir
 
 
-def pull_all_prs(prs_dir: Path):
-    """Pull all pull requests from GitHub and create/update local folders."""
-    print("\n📥 Pulling all pull requests from GitHub...")
+def open_index(prs_dir: Path, rebuild=False):
+    """Open the PR index, bringing it in step with the markdown files.
     
-    # Get all PRs (open, closed, merged) as JSON
-    prs_json = run_gh_command([
-        "pr", "list",
-        "--state", "all",
-        "--limit", "1000",
-        "--json", "number,title,body,state,isDraft,labels,assignees,author,milestone,"
-                 "createdAt,updatedAt,closedAt,mergedAt,mergeable,mergeCommit,"
-                 "headRefName,baseRefName,url,additions,deletions,changedFiles,"
-                 "reviewDecision,latestReviews"
-    ])
-    
-    if not prs_json:
-        print("Failed to fetch pull requests")
-        return
+    A new or outdated index is built from the files; otherwise only files
+    changed since they were indexed (e.g. by hand or by `git pull`) are re-read.
     
-    prs = json.loads(prs_json)
-    print(f"Found {len(prs)} pull requests")
-    
-    for pr in prs:
-        create_pr_folder(pr, prs_dir)
-    
-    print("✓ All pull requests synced")
+    Args:
+        prs_dir: The .github/pull-requests directory
+        rebuild: Rebuild from every file even if the index looks current
+    """
+    return index.PRS.open(prs_dir, "pr-*/pr-*.md", partial(read_pr_entry, prs_dir=prs_dir), rebuild=rebuild)
 
 
-def get_pr_details(pr_number):
-    """Get detailed information about a specific PR."""
-    pr_json = run_gh_command([
-        "pr", "view", str(pr_number),
-        "--json", "number,title,body,state,isDraft,labels,assignees,author,milestone,"
-                 "createdAt,updatedAt,closedAt,mergedAt,mergeable,mergeCommit,"
-                 "headRefName,baseRefName,url,additions,deletions,changedFiles,"
-                 "reviewDecision,latestReviews,reviews,commits,statusCheckRollup,comments"
-    ])
-    
-    if not pr_json:
+def read_pr_entry(pr_file: Path, data: bytes, prs_dir: Path):
+    """The index entry for a PR markdown file, or None if it has no PR frontmatter."""
+    text = data.decode("utf-8")
+    # The closing delimiter is a line of its own; titles may contain "---"
+    head, found, _ = text[4:].partition("\n---\n")
+    try:
+        frontmatter = yaml.load(head, Loader=YAML_LOADER) if text.startswith("---\n") and found else None
+    except yaml.YAMLError as e:
+        print(f"  ⚠️  Skipping {pr_file}: {e}")
         return None
+    if isinstance(frontmatter, dict) and frontmatter.get('pr_number') is not None:
+        return index.pr_entry(frontmatter, pr_file, prs_dir, data)
+    return None
+
+
+def pull_all_prs(prs_dir: Path):
+    """Pull all pull requests from GitHub and create/update local folders.
+    
+    PRs are fetched a page at a time, together with their changed files and
+    comments, and written as they arrive, so there is no cap on their number,
+    memory stays flat and there are no per-PR gh calls.
+    """
+    print("\n📥 Pulling all pull requests from GitHub...")
+    
+    count = 0
+    fallbacks = 0
+    conn = open_index(prs_dir)
+    try:
+        for pr in fetch_prs():
+            fallbacks += fallback_calls(pr)
+            create_pr_folder(pr, prs_dir, conn)
+            count += 1
+    except subprocess.CalledProcessError as e:
+        print(f"Error running gh command: {e}")
+        print(f"Error output: {e.stderr}")
+        print(f"Failed to fetch pull requests ({count} synced before the error)")
+        return
+    finally:
+        conn.commit()
+        conn.close()
     
-    return json.loads(pr_json)
+    print(f"✓ All {count} pull requests synced")
+    print_request_report(count, fallbacks)
 
 
 def get_pr_files(pr_number):
@@ -119,8 +284,15 @@ def get_pr_comments(pr_number):
     return comments
 
 
-def create_pr_folder(pr_data, prs_dir: Path):
-    """Create a folder and markdown file for a pull request."""
+def create_pr_folder(pr_data, prs_dir: Path, conn=None):
+    """Create a folder and markdown file for a pull request and update its index row.
+    
+    Args:
+        pr_data: PR dict in `gh pr list --json` shape
+        prs_dir: The .github/pull-requests directory
+        conn: Open index connection to add the row to (committed by the caller);
+            by default the index is opened and committed for this PR alone
+    """
     pr_number = pr_data['number']
     pr_dir = prs_dir / f"pr-{pr_number:04d}"
     pr_dir.mkdir(exist_ok=True)
@@ -207,9 +379,10 @@ def create_pr_folder(pr_data, prs_dir: Path):
             f.write("\n")
         
         # Comments section
-        comments = pr_data.get('comments', [])
-        if not comments:
-            # Try fetching comments separately if not included in PR data
+        if 'comments' in pr_data:
+            comments = pr_data['comments']
+        else:
+            # Not included in the PR data (or cut off): fetch them separately
             comments = get_pr_comments(pr_number)
         
         if comments:
@@ -252,13 +425,24 @@ def create_pr_folder(pr_data, prs_dir: Path):
         f.write("_Add code review feedback, suggestions, and action items._\n")
     
     # Get and save changed files list
-    files = get_pr_files(pr_number)
+    files = pr_data['files'] if 'files' in pr_data else get_pr_files(pr_number)
     if files and files[0]:  # Check if we got any files
         files_list_file = pr_dir / "changed-files.txt"
         with open(files_list_file, 'w') as f:
             f.write('\n'.join(files))
         print(f"  ✓ Saved {len(files)} changed files")
     
+    entry = index.pr_entry(frontmatter, pr_file, prs_dir, pr_file.read_bytes())
+    if conn is not None:
+        index.PRS.upsert(conn, entry)
+    else:
+        conn = open_index(prs_dir)
+        try:
+            with conn:
+                index.PRS.upsert(conn, entry)
+        finally:
+            conn.close()
+    
     status_indicator = "✅" if is_merged else ("🚧" if pr_data.get('isDraft') else "📝")
     print(f"  {status_indicator} Created/Updated pr-{pr_number:04d}: {pr_data['title'][:50]}...")
 
@@ -267,7 +451,7 @@ def pull_single_pr(pr_number, prs_dir: Path):
     """Pull a single PR and create/update its folder."""
     print(f"\n📥 Pulling PR #{pr_number}...")
     
-    pr_data = get_pr_details(pr_number)
+    pr_data = fetch_pr(pr_number)
     if not pr_data:
         print(f"Failed to fetch PR #{pr_number}")
         return
@@ -276,54 +460,56 @@ def pull_single_pr(pr_number, prs_dir: Path):
     print(f"✓ PR #{pr_number} synced")
 
 
-def show_pr_summary(prs_dir: Path):
-    """Show a summary of all PRs in the local directory."""
+def show_pr_summary(prs_dir: Path, status=None, labels=None, reindex=False):
+    """Show a summary of the local PRs, served from the index.
+    
+    Args:
+        prs_dir: The .github/pull-requests directory
+        status: Only PRs with this status (merged/open/draft/closed, any case)
+        labels: Only PRs carrying all of these labels
+        reindex: Rebuild the index from the markdown files first
+    """
     if not prs_dir.exists():
         print("No pull requests directory found. Run 'pull' first.")
         return
     
-    pr_dirs = sorted([d for d in prs_dir.iterdir() if d.is_dir() and d.name.startswith('pr-')])
-    
-    if not pr_dirs:
-        print("No pull requests found in local directory.")
+    conn = open_index(prs_dir, rebuild=reindex)
+    try:
+        rows = index.PRS.query(conn, status=status, labels=labels or ())
+    finally:
+        conn.close()
+    
+    filters = [f"status: {status}"] if status else []
+    filters += [f"label: {label}" for label in labels or []]
+    if not rows:
+        if filters:
+            print(f"No pull requests match ({', '.join(filters)}).")
+        else:
+            print("No pull requests found in local directory.")
         return
     
-    print(f"\n📊 Summary of {len(pr_dirs)} pull requests:\n")
+    filter_info = f" ({', '.join(filters)})" if filters else ""
+    print(f"\n📊 Summary of {len(rows)} pull requests{filter_info}:\n")
     
     status_counts = {'MERGED': 0, 'OPEN': 0, 'DRAFT': 0, 'CLOSED': 0}
     
-    for pr_dir in pr_dirs:
-        pr_file = pr_dir / f"{pr_dir.name}.md"
-        if not pr_file.exists():
-            continue
+    for row in rows:
+        row_status = row['status']
+        status_counts[row_status] = status_counts.get(row_status, 0) + 1
         
-        with open(pr_file, 'r') as f:
-            content = f.read()
+        status_icon = {
+            'MERGED': '✅',
+            'OPEN': '📝',
+            'DRAFT': '🚧',
+            'CLOSED': '❌'
+        }.get(row_status, '❓')
         
-        # Parse frontmatter
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                frontmatter = yaml.safe_load(parts[1])
-                status = frontmatter.get('status', 'UNKNOWN')
-                status_counts[status] = status_counts.get(status, 0) + 1
-                
-                pr_num = frontmatter.get('pr_number')
-                title = frontmatter.get('title', 'Unknown')[:60]
-                
-                status_icon = {
-                    'MERGED': '✅',
-                    'OPEN': '📝',
-                    'DRAFT': '🚧',
-                    'CLOSED': '❌'
-                }.get(status, '❓')
-                
-                print(f"  {status_icon} PR #{pr_num:4d}: {title}")
+        print(f"  {status_icon} PR #{row['number']:4d}: {row['title'][:60]}")
     
     print(f"\n📈 Status Breakdown:")
-    for status, count in sorted(status_counts.items()):
+    for row_status, count in sorted(status_counts.items()):
         if count > 0:
-            print(f"  {status:8s}: {count}")
+            print(f"  {row_status:8s}: {count}")
 
 
 def main():
@@ -336,6 +522,7 @@ Examples:
   pull-requests-sync pull                         # Sync all PRs
   pull-requests-sync pull 69                      # Sync only PR #69
   pull-requests-sync summary                      # Display PR statistics
+  pull-requests-sync summary --label bug          # Only PRs labelled bug
   pull-requests-sync -o /path pull                # Output to specific directory
 '''
     )
@@ -359,7 +546,23 @@ Examples:
     )
     
     # Summary command
-    subparsers.add_parser('summary', help='Show summary of local PRs')
+    summary_parser = subparsers.add_parser('summary', help='Show summary of local PRs')
+    summary_parser.add_argument(
+        '--state',
+        help='Only PRs with this status (merged, open, draft, closed)'
+    )
+    summary_parser.add_argument(
+        '--label',
+        dest='labels',
+        action='append',
+        metavar='LABEL',
+        help='Only PRs with this label (repeat to require several)'
+    )
+    summary_parser.add_argument(
+        '--reindex',
+        action='store_true',
+        help=f'Rebuild the index ({index.INDEX_FILE}) from the markdown files first'
+    )
     
     args = parser.parse_args()
     
@@ -375,7 +578,10 @@ Examples:
         else:
             pull_all_prs(prs_dir)
     elif args.command == 'summary':
-        show_pr_summary(prs_dir)
+        show_pr_summary(prs_dir, status=args.state, labels=args.labels, reindex=args.reindex)
+    
+    if GH.stats.calls:
+        print(f"\n⏱️  {GH.stats.summary()}")
 
 
 if __name__ == "__main__":
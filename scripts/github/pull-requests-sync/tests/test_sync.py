@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from pull_requests_sync import sync
 from pull_requests_sync.sync import ensure_prs_directory
 
 
@@ -22,3 +23,154 @@ def test_ensure_prs_directory_idempotent(tmp_path):
     
     assert prs_dir1 == prs_dir2
     assert prs_dir1.exists()
+
+
+def make_pr_node(number, title="Test PR"):
+    """A pull request as the GraphQL query returns it."""
+    return {
+        'number': number,
+        'title': title,
+        'body': 'PR body',
+        'state': 'MERGED',
+        'isDraft': False,
+        'url': f'https://github.com/o/r/pull/{number}',
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z',
+        'closedAt': '2024-01-02T00:00:00Z',
+        'mergedAt': '2024-01-02T00:00:00Z',
+        'headRefName': 'feature',
+        'baseRefName': 'main',
+        'additions': 10,
+        'deletions': 2,
+        'changedFiles': 1,
+        'reviewDecision': None,
+        'author': None,
+        'labels': {'nodes': [{'name': 'enhancement'}]},
+        'assignees': {'nodes': []},
+        'milestone': None,
+        'latestReviews': {'nodes': [{'author': {'login': 'reviewer'}, 'state': 'APPROVED', 'body': ''}]},
+        'files': {'totalCount': 2, 'nodes': [{'path': 'README.md'}, {'path': 'src/app.py'}]},
+        'comments': {'totalCount': 1, 'nodes': [
+            {'author': None, 'createdAt': '2024-01-01T12:00:00Z', 'body': 'LGTM', 'url': 'https://github.com/o/r/pull/1#c'},
+        ]},
+    }
+
+
+def test_pr_from_node():
+    """Test that GraphQL connections are flattened to the gh --json shape."""
+    pr = sync.pr_from_node(make_pr_node(5))
+
+    assert pr['labels'] == [{'name': 'enhancement'}]
+    assert pr['latestReviews'][0]['author']['login'] == 'reviewer'
+    assert pr['author'] == {}
+    assert pr['reviewDecision'] == ''
+    assert pr['files'] == ['README.md', 'src/app.py']
+    assert pr['comments'][0]['html_url'] == 'https://github.com/o/r/pull/1#c'
+    assert sync.fallback_calls(pr) == 0
+
+
+def test_pr_from_node_truncated_connections():
+    """Test that files/comments cut off at 100 are left for a separate fetch."""
+    node = make_pr_node(5)
+    node['files']['totalCount'] = 250
+    node['comments']['totalCount'] = 101
+
+    pr = sync.pr_from_node(node)
+
+    assert 'files' not in pr and 'comments' not in pr
+    assert sync.fallback_calls(pr) == 2
+
+
+def test_pull_all_prs_streams_pages(tmp_path, monkeypatch, capsys):
+    """Test that every streamed PR gets a folder without per-PR gh calls."""
+    calls = []
+
+    def stream_gh_json(args):
+        calls.append(args)
+        for number in range(1, 501):
+            yield make_pr_node(number)
+
+    def per_pr_call(pr_number):
+        raise AssertionError("files and comments should come from the bulk query")
+
+    monkeypatch.setattr(sync, "stream_gh_json", stream_gh_json)
+    monkeypatch.setattr(sync, "get_pr_comments", per_pr_call)
+    monkeypatch.setattr(sync, "get_pr_files", per_pr_call)
+    prs_dir = ensure_prs_directory(tmp_path)
+
+    sync.pull_all_prs(prs_dir)
+
+    assert "--paginate" in calls[0]
+    assert len(list(prs_dir.glob("pr-*"))) == 500
+    content = (prs_dir / "pr-0500" / "pr-0500.md").read_text()
+    assert "status: MERGED" in content
+    assert "- **reviewer**: APPROVED" in content
+    assert "### Comment by @unknown - 2024-01-01 12:00:00" in content
+    assert (prs_dir / "pr-0500" / "changed-files.txt").read_text() == "README.md\nsrc/app.py"
+    assert capsys.readouterr().out.splitlines()[-1] == (
+        "📉 gh usage: 1 process, 20 API requests (per-PR fetching: 1001 processes, 1005 requests)"
+    )
+
+
+def test_create_pr_folder_fetches_truncated_comments(tmp_path, monkeypatch):
+    """Test the fallback for PRs with more comments than the bulk query returns."""
+    node = make_pr_node(7)
+    node['comments']['totalCount'] = 150
+    fetched = []
+
+    def get_pr_comments(pr_number):
+        fetched.append(pr_number)
+        return [{'user': {'login': 'octocat'}, 'created_at': '', 'body': 'REST comment', 'html_url': ''}]
+
+    monkeypatch.setattr(sync, "get_pr_comments", get_pr_comments)
+    prs_dir = ensure_prs_directory(tmp_path)
+
+    sync.create_pr_folder(sync.pr_from_node(node), prs_dir)
+
+    assert fetched == [7]
+    assert "REST comment" in (prs_dir / "pr-0007" / "pr-0007.md").read_text()
+
+
+def test_summary_served_from_index(tmp_path, monkeypatch, capsys):
+    """Test that PR writes update the index and the summary filters from it."""
+    monkeypatch.setattr(sync, "get_pr_comments", lambda pr_number: [])
+    prs_dir = ensure_prs_directory(tmp_path)
+    open_pr = sync.pr_from_node({**make_pr_node(2, title="Open PR"), 'state': 'OPEN', 'mergedAt': None})
+    open_pr['labels'] = [{'name': 'bug'}]
+    sync.create_pr_folder(sync.pr_from_node(make_pr_node(1)), prs_dir)
+    sync.create_pr_folder(open_pr, prs_dir)
+
+    # The summary must not re-parse the markdown files the sync just indexed
+    def read_pr_entry(pr_file, data, prs_dir):
+        raise AssertionError(f"re-parsed {pr_file}")
+    monkeypatch.setattr(sync, "read_pr_entry", read_pr_entry)
+    capsys.readouterr()
+    sync.show_pr_summary(prs_dir, status='open', labels=['BUG'])
+    out = capsys.readouterr().out
+
+    assert "📊 Summary of 1 pull requests (status: open, label: BUG):" in out
+    assert "📝 PR #   2: Open PR" in out
+    assert "OPEN    : 1" in out
+
+
+def test_index_rebuilt_from_files(tmp_path, monkeypatch):
+    """Test that a missing index is rebuilt with the same rows the writes produced."""
+    monkeypatch.setattr(sync, "get_pr_comments", lambda pr_number: [])
+    prs_dir = ensure_prs_directory(tmp_path)
+    for number in (3, 1, 2):
+        sync.create_pr_folder(sync.pr_from_node(make_pr_node(number, title=f"Fix --- part {number}")), prs_dir)
+
+    conn = sync.open_index(prs_dir)
+    before = [dict(row) for row in conn.execute("SELECT * FROM prs ORDER BY number")]
+    conn.close()
+    (prs_dir / sync.index.INDEX_FILE).unlink()
+
+    conn = sync.open_index(prs_dir)
+    try:
+        after = [dict(row) for row in conn.execute("SELECT * FROM prs ORDER BY number")]
+    finally:
+        conn.close()
+
+    assert after == before
+    assert [row["number"] for row in after] == [1, 2, 3]
+    assert after[0]["path"] == "pr-0001/pr-0001.md"
@@ -0,0 +1,6 @@
+"""Shared SQLite index over the markdown trees written by the issue and PR sync tools."""
+
+from .index import INDEX_FILE, SCHEMA_VERSION, SyncIndex, connect, content_hash, file_fields, is_current
+
+__version__ = "0.1.0"
+__all__ = ["INDEX_FILE", "SCHEMA_VERSION", "SyncIndex", "connect", "content_hash", "file_fields", "is_current"]
@@ -0,0 +1,232 @@
+"""
+SQLite index over a synced markdown tree (.github/issues/, .github/pull-requests/).
+
+One row per issue or PR with the frontmatter fields that listings filter on, the
+markdown file's path, a hash of its content and the file's mtime and size. The
+sync tools update rows as they write files, so listings never re-parse the
+markdown.
+
+An index that is missing or has an older schema is rebuilt from the files once.
+Otherwise opening it stats every file and re-reads only those whose mtime or
+size differ from their row: a file whose content hash also changed (edited by
+hand, updated by `git pull`) is parsed and its row replaced, and rows of
+deleted files are dropped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+INDEX_FILE = ".index.sqlite"
+# 2: mtime_ns and size columns for detecting files changed outside the sync
+SCHEMA_VERSION = 2
+
+Column = Tuple[str, str]
+
+# Frontmatter fields every tool indexes; SyncIndex.extra_columns follow them
+HEAD_COLUMNS: Tuple[Column, ...] = (
+    ("number", "INTEGER PRIMARY KEY"),
+    ("title", "TEXT NOT NULL"),
+    ("state", "TEXT NOT NULL"),
+    ("author", "TEXT"),
+    ("labels", "TEXT NOT NULL"),
+    ("created_at", "TEXT"),
+    ("updated_at", "TEXT"),
+    ("closed_at", "TEXT"),
+)
+# Filled in by file_fields()
+FILE_COLUMNS: Tuple[Column, ...] = (
+    ("path", "TEXT NOT NULL"),
+    ("content_hash", "TEXT NOT NULL"),
+    ("mtime_ns", "INTEGER NOT NULL"),
+    ("size", "INTEGER NOT NULL"),
+)
+
+Entry = Dict[str, Any]
+ReadEntry = Callable[[Path, bytes], Optional[Entry]]
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 of a file's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_fields(file: Path, directory: Path, data: bytes) -> Entry:
+    """The path, content_hash, mtime_ns and size columns of a row.
+
+    Args:
+        file: The markdown file, already written
+        directory: The indexed directory; the stored path is relative to it
+        data: The file's bytes
+    """
+    stat = file.stat()
+    return {
+        'path': file.relative_to(directory).as_posix(),
+        'content_hash': content_hash(data),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+    }
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open an index database; use is_current() to see whether it needs a rebuild."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def is_current(conn: sqlite3.Connection) -> bool:
+    return conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+@dataclass(frozen=True)
+class SyncIndex:
+    """The tables of one tool's index.
+
+    Args:
+        table: Row table, one row per issue/PR keyed by number
+        labels_table: (number, label) pairs, for label filters
+        extra_columns: (name, SQL type) columns after HEAD_COLUMNS
+        indexed: Columns filtered on case-insensitively, given an SQL index
+    """
+
+    table: str
+    labels_table: str
+    extra_columns: Tuple[Column, ...] = ()
+    indexed: Tuple[str, ...] = ("state",)
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(name for name, _ in HEAD_COLUMNS + self.extra_columns + FILE_COLUMNS)
+
+    def schema(self) -> str:
+        definitions = ",\n    ".join(f"{name} {kind}" for name, kind in HEAD_COLUMNS + self.extra_columns + FILE_COLUMNS)
+        statements = [
+            f"DROP TABLE IF EXISTS {self.table};",
+            f"DROP TABLE IF EXISTS {self.labels_table};",
+            f"CREATE TABLE {self.table} (\n    {definitions}\n);",
+            f"CREATE TABLE {self.labels_table} (\n"
+            "    number INTEGER NOT NULL,\n"
+            "    name TEXT NOT NULL COLLATE NOCASE,\n"
+            "    PRIMARY KEY (number, name)\n"
+            ");",
+            f"CREATE INDEX {self.labels_table}_name ON {self.labels_table} (name);",
+        ]
+        statements += [
+            f"CREATE INDEX {self.table}_{column} ON {self.table} ({column} COLLATE NOCASE);"
+            for column in self.indexed
+        ]
+        return "\n".join(statements) + "\n"
+
+    def open(self, directory: Path, pattern: str, read_entry: ReadEntry, rebuild: bool = False) -> sqlite3.Connection:
+        """Open the index in `directory`, bringing it in step with the files first.
+
+        Args:
+            directory: The synced directory; the index file lives in it
+            pattern: Glob (relative to `directory`) of the markdown files
+            read_entry: Builds a row from a file and its bytes, or returns None to leave it out
+            rebuild: Rebuild even if the index looks current
+        """
+        conn = connect(directory / INDEX_FILE)
+        files = sorted(directory.glob(pattern))
+        if rebuild or not is_current(conn):
+            self.rebuild(conn, (entry for entry in (read_entry(f, f.read_bytes()) for f in files) if entry))
+        else:
+            self.refresh(conn, directory, files, read_entry)
+        return conn
+
+    def upsert(self, conn: sqlite3.Connection, entry: Entry) -> None:
+        """Insert or replace one row (not committed)."""
+        columns = self.columns
+        row = {**entry, 'labels': json.dumps(entry['labels'])}
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)})",
+            row
+        )
+        conn.execute(f"DELETE FROM {self.labels_table} WHERE number = ?", (entry['number'],))
+        conn.executemany(
+            f"INSERT OR IGNORE INTO {self.labels_table} (number, name) VALUES (?, ?)",
+            [(entry['number'], label) for label in entry['labels']]
+        )
+
+    def _delete(self, conn: sqlite3.Connection, number: int, path: str) -> None:
+        # Only if the row still belongs to `path`: a re-parsed file may have taken the number
+        if conn.execute(f"DELETE FROM {self.table} WHERE number = ? AND path = ?", (number, path)).rowcount:
+            conn.execute(f"DELETE FROM {self.labels_table} WHERE number = ?", (number,))
+
+    def rebuild(self, conn: sqlite3.Connection, entries: Iterable[Entry]) -> None:
+        """Recreate the index from scratch with the given rows, in one transaction."""
+        conn.executescript(self.schema())
+        with conn:
+            for entry in entries:
+                self.upsert(conn, entry)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def refresh(self, conn: sqlite3.Connection, directory: Path, files: Sequence[Path], read_entry: ReadEntry) -> int:
+        """Re-index files changed since their row was written and drop rows of deleted files.
+
+        A file is only read when its mtime or size differs from its row, and only
+        parsed when its content hash differs too.
+
+        Returns:
+            int: Rows replaced, added or dropped
+        """
+        rows = {
+            row['path']: row
+            for row in conn.execute(f"SELECT number, path, content_hash, mtime_ns, size FROM {self.table}")
+        }
+        changed = 0
+        with conn:
+            for file in files:
+                row = rows.pop(file.relative_to(directory).as_posix(), None)
+                stat = file.stat()
+                if row is not None and (row['mtime_ns'], row['size']) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                data = file.read_bytes()
+                if row is not None and row['content_hash'] == content_hash(data):
+                    conn.execute(
+                        f"UPDATE {self.table} SET mtime_ns = ?, size = ? WHERE number = ?",
+                        (stat.st_mtime_ns, stat.st_size, row['number'])
+                    )
+                    continue
+                entry = read_entry(file, data)
+                if row is not None:
+                    self._delete(conn, row['number'], row['path'])
+                if entry is not None:
+                    self.upsert(conn, entry)
+                changed += 1
+            for row in rows.values():
+                self._delete(conn, row['number'], row['path'])
+                changed += 1
+        return changed
+
+    def query(self, conn: sqlite3.Connection, labels: Sequence[str] = (), **filters: Optional[str]) -> List[sqlite3.Row]:
+        """Rows matching the column filters and all of the given labels (case-insensitive), by number.
+
+        Args:
+            labels: Labels that must all be present
+            **filters: column=value; None or empty values are ignored
+
+        Returns:
+            list: Row objects with the index columns; `labels` is a JSON list
+        """
+        where, params = [], []
+        for column, value in filters.items():
+            if column not in self.columns:
+                raise ValueError(f"unknown index column: {column}")
+            if value:
+                where.append(f"{column} = ? COLLATE NOCASE")
+                params.append(value)
+        for label in labels:
+            where.append(f"number IN (SELECT number FROM {self.labels_table} WHERE name = ?)")
+            params.append(label)
+        sql = f"SELECT * FROM {self.table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return conn.execute(sql + " ORDER BY number", params).fetchall()
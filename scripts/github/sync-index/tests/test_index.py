@@ -0,0 +1,138 @@
+"""Tests for sync_index."""
+
+import json
+import os
+
+import pytest
+from sync_index import INDEX_FILE, SyncIndex, file_fields
+
+ITEMS = SyncIndex(table="items", labels_table="item_labels", extra_columns=(("status", "TEXT NOT NULL"),))
+
+
+class Tree:
+    """Item files holding their row as JSON, with a count of parsed files."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.parsed = []
+
+    def write(self, number, **fields):
+        path = self.directory / f"item-{number}.json"
+        path.write_text(json.dumps({'number': number, 'state': 'OPEN', 'status': 'OPEN', 'labels': [], **fields}))
+        return path
+
+    def read_entry(self, file, data):
+        self.parsed.append(file.name)
+        fields = json.loads(data)
+        if 'number' not in fields:
+            return None
+        return {
+            'title': f"Item {fields['number']}", 'author': None,
+            'created_at': None, 'updated_at': None, 'closed_at': None,
+            **fields, **file_fields(file, self.directory, data),
+        }
+
+    def open(self, rebuild=False):
+        return ITEMS.open(self.directory, "item-*.json", self.read_entry, rebuild=rebuild)
+
+    def numbers(self, **filters):
+        conn = self.open()
+        try:
+            return [row['number'] for row in ITEMS.query(conn, **filters)]
+        finally:
+            conn.close()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    return Tree(tmp_path)
+
+
+def test_schema_from_columns():
+    """Test that extra columns sit between the frontmatter and file columns."""
+    assert ITEMS.columns[7:10] == ("closed_at", "status", "path")
+    assert ITEMS.columns[-3:] == ("content_hash", "mtime_ns", "size")
+    assert "CREATE INDEX items_state ON items (state COLLATE NOCASE);" in ITEMS.schema()
+
+
+def test_built_once_then_served_from_rows(tree):
+    """Test that a new index reads every file once and an unchanged tree reads none."""
+    for number in (2, 1, 3):
+        tree.write(number)
+    tree.write(4, labels=["Bug"], state="CLOSED")
+
+    assert tree.numbers() == [1, 2, 3, 4]
+    assert tree.parsed == ["item-1.json", "item-2.json", "item-3.json", "item-4.json"]
+    assert (tree.directory / INDEX_FILE).exists()
+
+    tree.parsed.clear()
+    assert tree.numbers(state="closed", labels=["bug"]) == [4]
+    assert tree.numbers(status=None) == [1, 2, 3, 4]
+    assert tree.parsed == []
+
+
+def test_refresh_reparses_changed_files_only(tree):
+    """Test that edited, added and deleted files update the index without a rebuild."""
+    for number in (1, 2, 3):
+        tree.write(number)
+    tree.open().close()
+    tree.parsed.clear()
+
+    tree.write(1, state="CLOSED")
+    tree.write(5)
+    (tree.directory / "item-3.json").unlink()
+
+    assert tree.numbers(state="open") == [2, 5]
+    assert tree.numbers() == [1, 2, 5]
+    assert sorted(tree.parsed) == ["item-1.json", "item-5.json"]
+
+
+def test_touched_file_not_reparsed(tree):
+    """Test that a new mtime with the same content only refreshes the stored stat."""
+    path = tree.write(1)
+    tree.open().close()
+    tree.parsed.clear()
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    conn = tree.open()
+    try:
+        row = conn.execute("SELECT mtime_ns FROM items").fetchone()
+    finally:
+        conn.close()
+
+    assert row['mtime_ns'] == stat.st_mtime_ns + 10**9
+    assert tree.parsed == []
+
+
+def test_file_that_stops_parsing_is_dropped(tree):
+    """Test that a file read_entry no longer accepts loses its row and labels."""
+    path = tree.write(1, labels=["bug"])
+    tree.write(2)
+    tree.open().close()
+
+    path.write_text("{}")
+    assert tree.numbers() == [2]
+    assert tree.numbers(labels=["bug"]) == []
+
+
+def test_outdated_schema_rebuilt(tree):
+    """Test that an index with another schema version is rebuilt from the files."""
+    tree.write(1)
+    conn = tree.open()
+    conn.execute("PRAGMA user_version = 1")
+    conn.close()
+    tree.parsed.clear()
+
+    assert tree.numbers() == [1]
+    assert tree.parsed == ["item-1.json"]
+
+
+def test_query_rejects_unknown_column(tree):
+    """Test that a misspelt filter fails instead of matching everything."""
+    conn = tree.open()
+    try:
+        with pytest.raises(ValueError):
+            ITEMS.query(conn, sate="open")
+    finally:
+        conn.close()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+md2html Converter Benchmark
+
+Measures the per-document cost of converting Markdown with a freshly
+constructed markdown.Markdown instance (the pre-caching behaviour) versus the
+cached, reset-between-documents converter used by convert_many().
+
+Usage:
+    python benchmark.py [SRC_DIR] [--repeat N]
+
+    With SRC_DIR, every .md/.markdown file below it forms the corpus.
+    Without it, a synthetic README-style corpus is generated.
+
+Example:
+    python benchmark.py ../../../projects --repeat 5
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+from md2html import create_markdown_converter, convert_many, discover_markdown_files
+
+
+def synthetic_corpus(count=50):
+    """Build README-sized documents with headings, lists, tables and code."""
+    docs = []
+    for i in range(count):
+        docs.append(f"""# Project {i}
+
+## Overview
+
+Project {i} is a **sample** document with `inline code` and a [link](https://example.com/{i}).
+
+- Feature one
+- Feature two
+- Feature three
+
+## Usage
+
+```python
+def main():
+    print("project {i}")
+```
+
+| Option | Default |
+|--------|---------|
+| debug  | false   |
+| level  | {i}     |
+
+> Note: generated for benchmarking.
+""")
+    return docs
+
+
+def bench_fresh(docs):
+    """Old behaviour: construct a new Markdown object for every document."""
+    start = time.perf_counter()
+    for doc in docs:
+        create_markdown_converter().convert(doc)
+    return time.perf_counter() - start
+
+
+def bench_construct(count):
+    """Cost of building the Markdown object alone, with no conversion."""
+    start = time.perf_counter()
+    for _ in range(count):
+        create_markdown_converter()
+    return time.perf_counter() - start
+
+
+def bench_cached(docs):
+    """New behaviour: one cached converter, reset between documents."""
+    start = time.perf_counter()
+    for _ in convert_many(docs):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark fresh vs cached Markdown converters',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('src_dir', nargs='?', help='Directory of markdown files to use as corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per strategy; best is reported (default: 3)')
+    args = parser.parse_args()
+
+    if args.src_dir:
+        files = discover_markdown_files(args.src_dir)
+        docs = [f.read_text(encoding='utf-8') for f in files]
+        source = f"{len(docs)} file(s) from {args.src_dir}"
+    else:
+        docs = synthetic_corpus()
+        source = f"{len(docs)} synthetic document(s)"
+
+    if not docs:
+        print("Error: no markdown documents found")
+        return 1
+
+    # Warm up imports and the cached converter so neither side pays for them
+    bench_cached(docs[:1])
+
+    fresh = min(bench_fresh(docs) for _ in range(args.repeat))
+    cached = min(bench_cached(docs) for _ in range(args.repeat))
+    construct = min(bench_construct(len(docs)) for _ in range(args.repeat))
+
+    per_fresh = fresh / len(docs) * 1000
+    per_cached = cached / len(docs) * 1000
+
+    print(f"📚 Corpus: {source}")
+    print(f"🐢 Fresh converter per document:  {per_fresh:.3f} ms/doc ({fresh:.3f}s total)")
+    print(f"⚡ Cached converter (reset):       {per_cached:.3f} ms/doc ({cached:.3f}s total)")
+    print(f"🏗️  Construction overhead avoided:  {construct / len(docs) * 1000:.3f} ms/doc")
+    if cached > 0:
+        print(f"📈 Speedup: {fresh / cached:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
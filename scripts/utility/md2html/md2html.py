@@ -7,6 +7,12 @@ Inspired by the Alpine Resume styling.
 
 Usage:
     python md2html.py input.md [output.html]
+    python md2html.py --recursive SRC_DIR OUT_DIR [--jobs N] [--force] [--external-assets]
+                                         [--highlight-cache DIR] [--search-index]
+                                         [--precompress]
+    python md2html.py --watch DIR [--out-dir OUT_DIR] [--port 8000] [--search-index]
+                                  [--precompress]
+    python md2html.py input.md [output.html] --stream
     
     If output.html is not specified, it will use the input filename with .html extension.
 
@@ -16,14 +22,58 @@ Example:
     
     python md2html.py docs/guide.md output/guide.html
     # Creates guide.html in output directory
+    
+    python md2html.py --recursive projects site/projects
+    # Converts every .md/.markdown file under projects/ in parallel,
+    # mirroring the directory layout under site/projects/. Files whose content
+    # (and the converter/template) is unchanged since the last run are skipped.
 """
 
 import sys
 import os
 import re
+import json
+import time
+import hashlib
+import argparse
+import textwrap
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from html import unescape
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 import markdown
-from markdown.extensions import fenced_code, tables, toc, nl2br, sane_lists
+from markdown.extensions import fenced_code, tables, toc, nl2br, sane_lists, codehilite
+
+try:
+    from precompress import compress_files, print_summary as print_precompress_summary
+except ImportError:  # optional: pip install -e scripts/utility/precompress
+    compress_files = None
+
+try:
+    import pygments
+    PYGMENTS_VERSION = pygments.__version__
+except ImportError:  # codehilite falls back to plain <pre><code> without Pygments
+    PYGMENTS_VERSION = None
+
+MARKDOWN_SUFFIXES = ('.md', '.markdown')
+
+# Directories never descended into when discovering markdown files
+SKIP_DIRS = {'.git', '.venv', 'venv', 'node_modules', '__pycache__'}
+
+# Bump when the conversion pipeline changes in a way that alters output
+CONVERTER_VERSION = '1.1.1'
+
+# Build manifest written next to the output of --recursive runs
+MANIFEST_NAME = '.md2html-manifest.json'
+
+# Options for the codehilite extension; part of the build fingerprint
+CODEHILITE_CONFIG = {
+    'css_class': 'highlight',
+    'linenums': False
+}
 
 def read_markdown_file(file_path):
     """Read markdown content from file."""
@@ -41,9 +91,9 @@ def extract_title(markdown_content):
         return match.group(1).strip()
     return "Documentation"
 
-def convert_markdown_to_html(markdown_content):
-    """Convert markdown content to HTML with extensions."""
-    md = markdown.Markdown(
+def create_markdown_converter():
+    """Build a new Markdown instance configured with md2html's extensions."""
+    return markdown.Markdown(
         extensions=[
             'fenced_code',
             'tables',
@@ -53,40 +103,145 @@ def convert_markdown_to_html(markdown_content):
             'codehilite',
         ],
         extension_configs={
-            'codehilite': {
-                'css_class': 'highlight',
-                'linenums': False
-            }
+            'codehilite': dict(CODEHILITE_CONFIG)
         }
     )
+
+# Per-process converter, built lazily by get_markdown_converter()
+_converter = None
+
+def get_markdown_converter():
+    """
+    Return the cached Markdown instance for this process.
+    
+    Constructing a Markdown object loads and configures every extension, which
+    costs far more than converting a typical README. The instance is built once
+    and reused; callers must reset() it between documents (as
+    convert_markdown_to_html does). Not safe to share across threads.
+    """
+    global _converter
+    if _converter is None:
+        _converter = create_markdown_converter()
+    return _converter
+
+def convert_markdown_to_html(markdown_content):
+    """Convert markdown content to HTML with extensions."""
+    md = get_markdown_converter()
+    md.reset()
     return md.convert(markdown_content)
 
-def generate_html_template(title, content):
-    """Generate complete HTML page with theme toggle."""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <meta name="description" content="{title}">
-  <title>{title}</title>
-  
-  <!-- Bootstrap Icons CDN -->
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  
-  <!-- Theme Initialization - Prevent FOUC -->
-  <script>
-    (function() {{
-      const savedTheme = localStorage.getItem('theme');
-      const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
-      const theme = savedTheme || (prefersDark ? 'dark' : 'light');
-      document.documentElement.setAttribute('data-theme', theme);
-    }})();
-  </script>
-  
-  <style>
-    /* CSS Variables for Theme */
-    :root {{
+def convert_many(markdown_documents):
+    """
+    Convert an iterable of markdown strings, yielding HTML for each in order.
+    
+    All documents share the cached converter, which is reset between them so
+    state such as TOC anchors and footnotes never leaks from one to the next.
+    """
+    for markdown_content in markdown_documents:
+        yield convert_markdown_to_html(markdown_content)
+
+class HighlightCache:
+    """
+    Persistent on-disk cache of Pygments-highlighted code blocks.
+    
+    Each entry is one file named by a hash of (language, code hash, Pygments
+    version, style and formatter options), so identical snippets repeated
+    across many documents are lexed and formatted once. One file per entry
+    keeps the cache safe to share between the batch worker processes.
+    """
+    
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._memory = {}
+    
+    def key(self, lang, code, style, options):
+        """Return the cache key for a code block."""
+        code_hash = hashlib.sha256(code.encode('utf-8')).hexdigest()
+        parts = [lang, code_hash, PYGMENTS_VERSION, style, options]
+        raw = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.html"
+    
+    def get(self, key):
+        """Return cached HTML for key, or None (counting the hit or miss)."""
+        html = self._memory.get(key)
+        if html is None:
+            try:
+                html = self._path(key).read_text(encoding='utf-8')
+                self._memory[key] = html
+            except OSError:
+                pass
+        if html is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return html
+    
+    def put(self, key, html):
+        """Store highlighted HTML for key."""
+        self._memory[key] = html
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(html, encoding='utf-8')
+        os.replace(tmp_path, path)
+    
+    def stats(self):
+        """Return a snapshot of hit/miss counts."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+# Active cache for this process, set by install_highlight_cache()
+_highlight_cache = None
+
+class CachedCodeHilite(codehilite.CodeHilite):
+    """CodeHilite that consults the active HighlightCache before running Pygments."""
+    
+    def hilite(self, shebang=True):
+        cache = _highlight_cache
+        if cache is None or not (PYGMENTS_VERSION and self.use_pygments):
+            return super().hilite(shebang)
+        
+        options = dict(self.options)
+        style = options.pop('style', 'default')
+        lang = [self.lang, shebang, self.guess_lang, self.lang_prefix, str(self.pygments_formatter)]
+        key = cache.key(lang, self.src.strip('\n'), style, options)
+        
+        html = cache.get(key)
+        if html is None:
+            html = super().hilite(shebang)
+            cache.put(key, html)
+        return html
+
+def install_highlight_cache(cache_dir):
+    """
+    Route all code highlighting in this process through an on-disk cache.
+    
+    fenced_code and codehilite construct CodeHilite by module-level name, so
+    the cached subclass is swapped in there. Returns the active HighlightCache.
+    """
+    global _highlight_cache
+    _highlight_cache = HighlightCache(cache_dir)
+    fenced_code.CodeHilite = CachedCodeHilite
+    codehilite.CodeHilite = CachedCodeHilite
+    return _highlight_cache
+
+def is_highlight_cache_installed(cache_dir):
+    """True if this process already highlights through a cache in cache_dir."""
+    return _highlight_cache is not None and _highlight_cache.cache_dir == Path(cache_dir)
+
+def highlight_cache_stats():
+    """Return hit/miss counts for this process's highlight cache (zeros if disabled)."""
+    if _highlight_cache is None:
+        return {'hits': 0, 'misses': 0}
+    return _highlight_cache.stats()
+
+# Page stylesheet, kept at its inline indentation so inline output is unchanged
+PAGE_CSS = """    /* CSS Variables for Theme */
+    :root {
       /* Light theme colors */
       --bg-primary: #ffffff;
       --bg-secondary: #f8f9fa;
@@ -103,9 +258,9 @@ def generate_html_template(title, content):
       --blockquote-bg: #eff6ff;
       --table-header-bg: #f1f5f9;
       --highlight-bg: #fef3c7;
-    }}
+    }
     
-    [data-theme="dark"] {{
+    [data-theme="dark"] {
       /* Dark theme colors */
       --bg-primary: #1a202c;
       --bg-secondary: #2d3748;
@@ -122,28 +277,28 @@ def generate_html_template(title, content):
       --blockquote-bg: #1e3a5f;
       --table-header-bg: #374151;
       --highlight-bg: #7c2d12;
-    }}
+    }
     
     /* Prevent FOUC */
-    [x-cloak] {{ display: none !important; }}
+    [x-cloak] { display: none !important; }
     
-    * {{
+    * {
       box-sizing: border-box;
       margin: 0;
       padding: 0;
-    }}
+    }
     
-    body {{
+    body {
       font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
       line-height: 1.6;
       color: var(--text-primary);
       background-color: var(--bg-primary);
       transition: background-color 0.3s ease, color 0.3s ease;
       overflow-x: hidden;
-    }}
+    }
     
     /* Header Styling */
-    header {{
+    header {
       background-color: var(--bg-primary);
       border-bottom: 1px solid var(--border-color);
       padding: 1rem 0;
@@ -151,25 +306,25 @@ def generate_html_template(title, content):
       top: 0;
       z-index: 1000;
       box-shadow: 0 2px 4px var(--shadow);
-    }}
+    }
     
-    .header-content {{
+    .header-content {
       max-width: 1200px;
       margin: 0 auto;
       padding: 0 2rem;
       display: flex;
       justify-content: space-between;
       align-items: center;
-    }}
+    }
     
-    .header-title {{
+    .header-title {
       font-size: 1.25rem;
       font-weight: 600;
       color: var(--text-primary);
-    }}
+    }
     
     /* Theme Toggle Button */
-    .theme-toggle {{
+    .theme-toggle {
       background: none;
       border: none;
       cursor: pointer;
@@ -181,247 +336,357 @@ def generate_html_template(title, content):
       border-radius: 0.375rem;
       transition: background-color 0.2s ease, transform 0.1s ease;
       font-size: 1.25rem;
-    }}
+    }
     
-    .theme-toggle:hover {{
+    .theme-toggle:hover {
       background-color: var(--bg-secondary);
-    }}
+    }
     
-    .theme-toggle:active {{
+    .theme-toggle:active {
       transform: scale(0.95);
-    }}
+    }
     
-    .theme-toggle i {{
+    .theme-toggle i {
       transition: transform 0.3s ease;
-    }}
+    }
     
     /* Main Content Container */
-    .container {{
+    .container {
       max-width: 1200px;
       margin: 0 auto;
       padding: 2rem;
-    }}
+    }
     
-    @media (max-width: 768px) {{
-      .container {{
+    @media (max-width: 768px) {
+      .container {
         padding: 1rem;
-      }}
-    }}
+      }
+    }
     
     /* Content Styling */
-    .content {{
+    .content {
       background-color: var(--bg-primary);
       border-radius: 0.5rem;
       padding: 2rem;
       box-shadow: 0 1px 3px var(--shadow);
-    }}
+    }
     
-    @media (max-width: 768px) {{
-      .content {{
+    @media (max-width: 768px) {
+      .content {
         padding: 1.5rem;
-      }}
-    }}
+      }
+    }
     
     /* Typography */
-    h1, h2, h3, h4, h5, h6 {{
+    h1, h2, h3, h4, h5, h6 {
       color: var(--text-primary);
       margin-top: 2rem;
       margin-bottom: 1rem;
       font-weight: 600;
       line-height: 1.3;
-    }}
-    
-    h1 {{ font-size: 2.5rem; margin-top: 0; }}
-    h2 {{ font-size: 2rem; border-bottom: 2px solid var(--border-color); padding-bottom: 0.5rem; }}
-    h3 {{ font-size: 1.5rem; }}
-    h4 {{ font-size: 1.25rem; }}
-    h5 {{ font-size: 1.125rem; }}
-    h6 {{ font-size: 1rem; }}
-    
-    @media (max-width: 768px) {{
-      h1 {{ font-size: 2rem; }}
-      h2 {{ font-size: 1.75rem; }}
-      h3 {{ font-size: 1.375rem; }}
-    }}
-    
-    p {{
+    }
+    
+    h1 { font-size: 2.5rem; margin-top: 0; }
+    h2 { font-size: 2rem; border-bottom: 2px solid var(--border-color); padding-bottom: 0.5rem; }
+    h3 { font-size: 1.5rem; }
+    h4 { font-size: 1.25rem; }
+    h5 { font-size: 1.125rem; }
+    h6 { font-size: 1rem; }
+    
+    @media (max-width: 768px) {
+      h1 { font-size: 2rem; }
+      h2 { font-size: 1.75rem; }
+      h3 { font-size: 1.375rem; }
+    }
+    
+    p {
       margin-bottom: 1rem;
       color: var(--text-secondary);
-    }}
+    }
     
     /* Links */
-    a {{
+    a {
       color: var(--link-color);
       text-decoration: none;
       transition: color 0.2s ease;
-    }}
+    }
     
-    a:hover {{
+    a:hover {
       color: var(--link-hover);
       text-decoration: underline;
-    }}
+    }
     
     /* Lists */
-    ul, ol {{
+    ul, ol {
       margin-bottom: 1rem;
       padding-left: 2rem;
       color: var(--text-secondary);
-    }}
+    }
     
-    li {{
+    li {
       margin-bottom: 0.5rem;
-    }}
+    }
     
-    ul ul, ol ol, ul ol, ol ul {{
+    ul ul, ol ol, ul ol, ol ul {
       margin-top: 0.5rem;
       margin-bottom: 0.5rem;
-    }}
+    }
     
     /* Code */
-    code {{
+    code {
       background-color: var(--bg-code);
       color: var(--code-text);
       padding: 0.2rem 0.4rem;
       border-radius: 0.25rem;
       font-family: 'Monaco', 'Courier New', monospace;
       font-size: 0.875rem;
-    }}
+    }
     
-    pre {{
+    pre {
       background-color: var(--bg-code);
       border: 1px solid var(--border-color);
       border-radius: 0.5rem;
       padding: 1rem;
       overflow-x: auto;
       margin-bottom: 1rem;
-    }}
+    }
     
-    pre code {{
+    pre code {
       background: none;
       padding: 0;
       color: var(--text-primary);
       font-size: 0.875rem;
       line-height: 1.5;
-    }}
+    }
     
     /* Blockquotes */
-    blockquote {{
+    blockquote {
       border-left: 4px solid var(--blockquote-border);
       background-color: var(--blockquote-bg);
       padding: 1rem 1.5rem;
       margin: 1rem 0;
       border-radius: 0.25rem;
-    }}
+    }
     
-    blockquote p {{
+    blockquote p {
       margin-bottom: 0;
       color: var(--text-primary);
-    }}
+    }
     
     /* Tables */
-    table {{
+    table {
       width: 100%;
       border-collapse: collapse;
       margin-bottom: 1rem;
       overflow-x: auto;
       display: block;
-    }}
+    }
     
-    @media (min-width: 768px) {{
-      table {{
+    @media (min-width: 768px) {
+      table {
         display: table;
-      }}
-    }}
+      }
+    }
     
-    thead {{
+    thead {
       background-color: var(--table-header-bg);
-    }}
+    }
     
-    th, td {{
+    th, td {
       padding: 0.75rem;
       text-align: left;
       border-bottom: 1px solid var(--border-color);
-    }}
+    }
     
-    th {{
+    th {
       font-weight: 600;
       color: var(--text-primary);
-    }}
+    }
     
-    td {{
+    td {
       color: var(--text-secondary);
-    }}
+    }
     
-    tr:hover {{
+    tr:hover {
       background-color: var(--bg-secondary);
-    }}
+    }
     
     /* Horizontal Rule */
-    hr {{
+    hr {
       border: none;
       border-top: 2px solid var(--border-color);
       margin: 2rem 0;
-    }}
+    }
     
     /* Images */
-    img {{
+    img {
       max-width: 100%;
       height: auto;
       border-radius: 0.5rem;
       margin: 1rem 0;
-    }}
+    }
     
     /* Strong and Emphasis */
-    strong {{
+    strong {
       font-weight: 600;
       color: var(--text-primary);
-    }}
+    }
     
-    em {{
+    em {
       font-style: italic;
-    }}
+    }
     
     /* Smooth scrolling */
-    html {{
+    html {
       scroll-behavior: smooth;
-    }}
+    }
     
     /* Respect reduced motion preference */
-    @media (prefers-reduced-motion: reduce) {{
-      * {{
+    @media (prefers-reduced-motion: reduce) {
+      * {
         animation-duration: 0.01ms !important;
         animation-iteration-count: 1 !important;
         transition-duration: 0.01ms !important;
         scroll-behavior: auto !important;
-      }}
-    }}
+      }
+    }
     
     /* Print styles */
-    @media print {{
-      body {{
+    @media print {
+      body {
         background: white;
         color: black;
-      }}
+      }
       
-      header {{
+      header {
         position: static;
         box-shadow: none;
-      }}
+      }
       
-      .theme-toggle {{
+      .theme-toggle {
         display: none;
-      }}
+      }
       
-      a {{
+      a {
         color: #0066cc;
         text-decoration: underline;
-      }}
+      }
       
-      pre, blockquote {{
+      pre, blockquote {
         page-break-inside: avoid;
-      }}
-    }}
-  </style>
+      }
+    }"""
+
+# Theme toggle behaviour, loaded at the end of <body>
+PAGE_SCRIPT = """    // Initialize theme icons on page load
+    function updateThemeIcon() {
+      const theme = document.documentElement.getAttribute('data-theme');
+      const lightIcon = document.getElementById('theme-icon-light');
+      const darkIcon = document.getElementById('theme-icon-dark');
+      
+      if (theme === 'dark') {
+        lightIcon.style.display = 'block';
+        darkIcon.style.display = 'none';
+      } else {
+        lightIcon.style.display = 'none';
+        darkIcon.style.display = 'block';
+      }
+    }
+    
+    // Toggle theme function
+    function toggleTheme() {
+      const currentTheme = document.documentElement.getAttribute('data-theme');
+      const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+      
+      document.documentElement.setAttribute('data-theme', newTheme);
+      localStorage.setItem('theme', newTheme);
+      updateThemeIcon();
+    }
+    
+    // Update icon on load
+    updateThemeIcon();
+    
+    // Listen for system theme changes
+    window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', (e) => {
+      if (!localStorage.getItem('theme')) {
+        const newTheme = e.matches ? 'dark' : 'light';
+        document.documentElement.setAttribute('data-theme', newTheme);
+        updateThemeIcon();
+      }
+    });"""
+
+def shared_asset_files():
+    """
+    Return {filename: contents} for the external stylesheet and script.
+    
+    Filenames embed a hash of their contents (md2html.<hash>.css/.js), so they
+    can be cached forever and a changed stylesheet always gets a new URL.
+    """
+    assets = {}
+    for ext, text in (('css', PAGE_CSS), ('js', PAGE_SCRIPT)):
+        contents = textwrap.dedent(text).strip() + '\n'
+        digest = hashlib.sha256(contents.encode('utf-8')).hexdigest()[:10]
+        assets[f"md2html.{digest}.{ext}"] = contents
+    return assets
+
+def write_shared_assets(asset_dir):
+    """Write the shared CSS/JS into asset_dir (skipping existing files) and return their paths."""
+    asset_dir = Path(asset_dir)
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, contents in shared_asset_files().items():
+        path = asset_dir / name
+        if not path.exists():
+            path.write_text(contents, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+def shared_asset_urls(output_path, asset_dir):
+    """Return (css_href, js_href) for a page at output_path, relative to its directory."""
+    page_dir = Path(output_path).parent
+    css_name, js_name = shared_asset_files()
+    return tuple(
+        Path(os.path.relpath(Path(asset_dir) / name, page_dir)).as_posix()
+        for name in (css_name, js_name)
+    )
+
+def generate_html_template(title, content, asset_urls=None):
+    """
+    Generate complete HTML page with theme toggle.
+    
+    By default the stylesheet and theme script are inlined. Pass asset_urls as
+    (css_href, js_href) to link the shared external files instead.
+    """
+    if asset_urls:
+        css_href, js_href = asset_urls
+        styles = f'<link rel="stylesheet" href="{css_href}">'
+        scripts = f'<script src="{js_href}"></script>'
+    else:
+        styles = f"<style>\n{PAGE_CSS}\n  </style>"
+        scripts = f"<script>\n{PAGE_SCRIPT}\n  </script>"
+    
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <meta name="description" content="{title}">
+  <title>{title}</title>
+  
+  <!-- Bootstrap Icons CDN -->
+  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
+  
+  <!-- Theme Initialization - Prevent FOUC -->
+  <script>
+    (function() {{
+      const savedTheme = localStorage.getItem('theme');
+      const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
+      const theme = savedTheme || (prefersDark ? 'dark' : 'light');
+      document.documentElement.setAttribute('data-theme', theme);
+    }})();
+  </script>
+  
+  {styles}
 </head>
 <body>
   <!-- Header with Theme Toggle -->
@@ -447,98 +712,888 @@ def generate_html_template(title, content):
   </div>
   
   <!-- Theme Toggle Script -->
-  <script>
-    // Initialize theme icons on page load
-    function updateThemeIcon() {{
-      const theme = document.documentElement.getAttribute('data-theme');
-      const lightIcon = document.getElementById('theme-icon-light');
-      const darkIcon = document.getElementById('theme-icon-dark');
-      
-      if (theme === 'dark') {{
-        lightIcon.style.display = 'block';
-        darkIcon.style.display = 'none';
-      }} else {{
-        lightIcon.style.display = 'none';
-        darkIcon.style.display = 'block';
-      }}
-    }}
+  {scripts}
+</body>
+</html>"""
+
+# Stand-in for the page body when splitting the template for streaming
+_CONTENT_MARKER = '<!--md2html:content-->'
+
+def split_html_template(title, asset_urls=None):
+    """Return the (head, tail) of the page template around the content slot."""
+    page = generate_html_template(title, _CONTENT_MARKER, asset_urls)
+    head, tail = page.split(_CONTENT_MARKER, 1)
+    return head, tail
+
+def find_title_in_file(input_path):
+    """Scan a markdown file line by line for its title without loading it whole."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') and not line.startswith('##'):
+                title = extract_title(line)
+                if title != "Documentation":
+                    return title
+    return "Documentation"
+
+_FENCE_RE = re.compile(r' *(`{3,}|~{3,})')
+
+def iter_markdown_sections(input_path):
+    """
+    Yield a markdown file in chunks, split before each top-level '# ' heading.
     
-    // Toggle theme function
-    function toggleTheme() {{
-      const currentTheme = document.documentElement.getAttribute('data-theme');
-      const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-      
-      document.documentElement.setAttribute('data-theme', newTheme);
-      localStorage.setItem('theme', newTheme);
-      updateThemeIcon();
-    }}
+    Only headings after a blank line start a section, since markdown joins a
+    heading directly below other lines (e.g. table rows) to that block.
+    Headings inside fenced code blocks are ignored; like fenced_code, a fence
+    only closes on an unindented line of exactly the opening backticks or
+    tildes. Only one section is held in memory at a time.
+    """
+    fence = None
+    section = []
+    previous_blank = False
+    with open(input_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if fence is None:
+                match = _FENCE_RE.match(line)
+                if match:
+                    fence = match.group(1)
+                elif section and previous_blank and re.match(r'#\s', line):
+                    yield ''.join(section)
+                    section = []
+            elif line.startswith(fence) and not line[len(fence):].strip(' \r\n'):
+                fence = None
+            previous_blank = not line.strip()
+            section.append(line)
+    if section:
+        yield ''.join(section)
+
+# Search index files written to the root of the --recursive output
+SEARCH_INDEX_NAME = 'search-index.json'
+SEARCH_SCRIPT_NAME = 'md2html-search.js'
+
+# Term weights: a title match outranks a heading match outranks body text
+TITLE_WEIGHT = 10
+HEADING_WEIGHT = 5
+MAX_BODY_WEIGHT = 5
+
+SEARCH_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has',
+    'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to',
+    'was', 'were', 'will', 'with',
+}
+
+def tokenize(text):
+    """Split text into lowercase search terms, dropping stopwords and 1-char tokens."""
+    return [
+        term for term in re.findall(r'[a-z0-9]+', text.lower())
+        if len(term) > 1 and term not in SEARCH_STOPWORDS
+    ]
+
+class SearchDocument:
+    """Title, headings and body term counts for one page, gathered during conversion."""
     
-    // Update icon on load
-    updateThemeIcon();
+    def __init__(self):
+        self.title = ''
+        self.headings = []
+        self.terms = Counter()
     
-    // Listen for system theme changes
-    window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', (e) => {{
-      if (!localStorage.getItem('theme')) {{
-        const newTheme = e.matches ? 'dark' : 'light';
-        document.documentElement.setAttribute('data-theme', newTheme);
-        updateThemeIcon();
-      }}
-    }});
-  </script>
-</body>
-</html>"""
+    def add_html(self, html_content, toc_tokens):
+        """Record the headings and body text of a converted chunk."""
+        stack = list(toc_tokens)
+        while stack:
+            token = stack.pop(0)
+            self.headings.append(unescape(token['name']))
+            stack[:0] = token.get('children', [])
+        text = unescape(re.sub(r'<[^>]+>', ' ', html_content))
+        self.terms.update(tokenize(text))
+    
+    def to_dict(self):
+        return {'title': self.title, 'headings': self.headings, 'terms': dict(self.terms)}
+
+def build_search_index(documents):
+    """
+    Build a compact inverted index from {url: SearchDocument.to_dict()}.
+    
+    Format: {"docs": [[url, title], ...], "terms": {term: [doc, weight, doc, weight, ...]}}
+    where doc is a position in "docs". Postings are flattened pairs to keep
+    the JSON small.
+    """
+    docs = []
+    postings = {}
+    for doc_id, (url, doc) in enumerate(sorted(documents.items())):
+        docs.append([url, doc['title']])
+        weights = Counter()
+        for term, count in doc['terms'].items():
+            weights[term] += min(count, MAX_BODY_WEIGHT)
+        for heading in doc['headings']:
+            for term in set(tokenize(heading)):
+                weights[term] += HEADING_WEIGHT
+        for term in set(tokenize(doc['title'])):
+            weights[term] += TITLE_WEIGHT
+        for term, weight in weights.items():
+            postings.setdefault(term, []).extend([doc_id, weight])
+    return {'docs': docs, 'terms': dict(sorted(postings.items()))}
+
+SEARCH_SCRIPT = """// md2html search: looks up queries in the prebuilt search-index.json
+// Usage: md2htmlSearch('query').then(results => ...)   // [{url, title, score}]
+// Or add <input data-md2html-search> and <ul data-md2html-search-results>.
+(function () {
+  const script = document.currentScript;
+  const indexUrl = new URL('search-index.json', script ? script.src : location.href);
+  let index = null;
+
+  async function load() {
+    if (!index) index = fetch(indexUrl).then(r => r.json());
+    return index;
+  }
+
+  // Same rules as tokenize() in md2html.py; stopwords are never in the index
+  const STOPWORDS = new Set(%STOPWORDS%);
+
+  function tokenize(text) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || [])
+      .filter(t => t.length > 1 && !STOPWORDS.has(t));
+  }
+
+  async function search(query) {
+    const { docs, terms } = await load();
+    const keys = Object.keys(terms);
+    let scores = null;
+    for (const token of tokenize(query)) {
+      const hits = new Map();
+      for (const term of keys) {
+        if (!term.startsWith(token)) continue;
+        const boost = term === token ? 1 : 0.5;
+        const list = terms[term];
+        for (let i = 0; i < list.length; i += 2) {
+          hits.set(list[i], (hits.get(list[i]) || 0) + list[i + 1] * boost);
+        }
+      }
+      if (scores === null) {
+        scores = hits;
+      } else {
+        for (const doc of scores.keys()) {
+          if (hits.has(doc)) scores.set(doc, scores.get(doc) + hits.get(doc));
+          else scores.delete(doc);
+        }
+      }
+    }
+    return [...(scores || new Map())]
+      .sort((a, b) => b[1] - a[1])
+      .map(([doc, score]) => ({
+        url: new URL(docs[doc][0], indexUrl).href,
+        title: docs[doc][1],
+        score,
+      }));
+  }
+
+  window.md2htmlSearch = search;
+  search.tokenize = tokenize;
+
+  document.addEventListener('DOMContentLoaded', () => {
+    const input = document.querySelector('[data-md2html-search]');
+    const list = document.querySelector('[data-md2html-search-results]');
+    if (!input || !list) return;
+    input.addEventListener('input', async () => {
+      const results = input.value.trim().length > 1 ? await search(input.value) : [];
+      list.replaceChildren(...results.slice(0, 20).map(r => {
+        const li = document.createElement('li');
+        const a = document.createElement('a');
+        a.href = r.url;
+        a.textContent = r.title;
+        li.appendChild(a);
+        return li;
+      }));
+    });
+  });
+})();
+""".replace('%STOPWORDS%', json.dumps(sorted(SEARCH_STOPWORDS)))
+
+def write_search_index(out_dir, documents):
+    """Write search-index.json and the md2html-search.js lookup script into out_dir."""
+    out_dir = Path(out_dir)
+    index = build_search_index(documents)
+    (out_dir / SEARCH_INDEX_NAME).write_text(
+        json.dumps(index, separators=(',', ':'), ensure_ascii=False),
+        encoding='utf-8',
+    )
+    (out_dir / SEARCH_SCRIPT_NAME).write_text(SEARCH_SCRIPT, encoding='utf-8')
+    return index
+
+# Heading appended to every section but the last, see convert_section()
+_SECTION_BREAK = 'md2html-section-break'
+
+def convert_section(section, last):
+    """
+    Convert one section from iter_markdown_sections(); return (html, toc_tokens).
+    
+    convert() strips trailing whitespace, but in a whole-document conversion a
+    block such as a code block is followed by a blank line before the next
+    heading. So every section but the last is converted with a placeholder
+    '# ' heading appended, exactly where the next section's heading would be,
+    and the output is cut there.
+    """
+    if last:
+        html_content = convert_markdown_to_html(section)
+        return html_content, get_markdown_converter().toc_tokens
+    html_content = convert_markdown_to_html(f"{section}# {_SECTION_BREAK}\n")
+    html_content = html_content[:html_content.rindex(f'<h1 id="{_SECTION_BREAK}')]
+    return html_content, get_markdown_converter().toc_tokens[:-1]
+
+def convert_file_streaming(input_path, output_path, asset_urls=None, search_doc=None):
+    """
+    Convert a markdown file section by section, writing HTML as it goes.
+    
+    Peak memory stays proportional to the largest top-level section rather
+    than the whole document. Each section is converted independently, so
+    reference-style links and footnotes only resolve within their own section
+    and heading anchors are only de-duplicated within it; otherwise the output
+    is byte-identical to convert_file().
+    
+    Returns:
+        str: The page title used for the generated document
+    """
+    title = find_title_in_file(input_path)
+    head, tail = split_html_template(title, asset_urls)
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as out:
+        out.write(head)
+        sections = iter_markdown_sections(input_path)
+        section = next(sections, None)
+        while section is not None:
+            following = next(sections, None)
+            html_content, toc_tokens = convert_section(section, last=following is None)
+            if search_doc is not None:
+                search_doc.add_html(html_content, toc_tokens)
+            out.write(html_content)
+            section = following
+        out.write(tail)
+    return title
+
+def convert_file(input_path, output_path, asset_dir=None, stream=False, search_doc=None):
+    """
+    Convert a single markdown file into a complete themed HTML page.
+    
+    Errors are raised rather than exiting so callers (including the batch
+    workers) can decide how to report them. When asset_dir is given the page
+    links to the shared CSS/JS there instead of inlining them; the assets
+    themselves are written by write_shared_assets(). With stream, the file is
+    converted by convert_file_streaming() for bounded memory use. A
+    SearchDocument passed as search_doc is filled in for the search index.
+    
+    Returns:
+        str: The page title used for the generated document
+    """
+    output_path = Path(output_path)
+    asset_urls = shared_asset_urls(output_path, asset_dir) if asset_dir else None
+    if stream:
+        title = convert_file_streaming(input_path, output_path, asset_urls, search_doc)
+        if search_doc is not None:
+            search_doc.title = title
+        return title
+    
+    markdown_content = Path(input_path).read_text(encoding='utf-8')
+    title = extract_title(markdown_content)
+    html_content = convert_markdown_to_html(markdown_content)
+    if search_doc is not None:
+        search_doc.title = title
+        search_doc.add_html(html_content, get_markdown_converter().toc_tokens)
+    full_html = generate_html_template(title, html_content, asset_urls)
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(full_html, encoding='utf-8')
+    return title
+
+def discover_markdown_files(src_dir):
+    """Return every markdown file below src_dir, sorted, skipping hidden/vendor dirs."""
+    src_dir = Path(src_dir)
+    found = []
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in sorted(files):
+            if Path(name).suffix.lower() in MARKDOWN_SUFFIXES:
+                found.append(Path(root) / name)
+    return found
+
+def hash_file(path):
+    """Return the sha256 hex digest of a file's bytes."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def build_fingerprint(external_assets=False):
+    """
+    Identify the converter that produced an output.
+    
+    Combines CONVERTER_VERSION, the markdown and Pygments versions, the
+    codehilite options and a hash of the rendered page template, so upgrading
+    the highlighter or editing the template invalidates every entry.
+    In external-assets mode the template references the content-hashed asset
+    names, so stylesheet/script edits invalidate entries too. Streamed output
+    is byte-identical to whole-document output, so --stream is not part of it.
+    """
+    asset_urls = tuple(shared_asset_files()) if external_assets else None
+    template = generate_html_template('', '', asset_urls)
+    template_hash = hashlib.sha256(template.encode('utf-8')).hexdigest()
+    parts = [
+        CONVERTER_VERSION,
+        markdown.__version__,
+        str(PYGMENTS_VERSION),
+        json.dumps(CODEHILITE_CONFIG, sort_keys=True),
+        template_hash,
+    ]
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+def load_manifest(out_dir):
+    """Load the build manifest from out_dir, or an empty one if missing/corrupt."""
+    manifest_path = Path(out_dir) / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if isinstance(manifest.get('entries'), dict):
+            return manifest
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {'entries': {}}
+
+def save_manifest(out_dir, manifest):
+    """Write the build manifest atomically so an interrupted run can't corrupt it."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+
+def remove_output(output_path):
+    """Delete a generated page and its .gz/.br sidecars; True if the page existed."""
+    output_path = Path(output_path)
+    for sidecar in ('.gz', '.br'):
+        output_path.with_name(output_path.name + sidecar).unlink(missing_ok=True)
+    try:
+        output_path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+def is_up_to_date(entry, content_hash, fingerprint, output_path):
+    """True if a manifest entry proves output_path was built from this exact input."""
+    return (
+        entry is not None
+        and entry.get('hash') == content_hash
+        and entry.get('fingerprint') == fingerprint
+        and Path(output_path).exists()
+    )
+
+def _convert_job(input_path, output_path, asset_dir=None, stream=False, search=False):
+    """Process-pool worker: convert one file and report timing instead of raising."""
+    start = time.perf_counter()
+    before = highlight_cache_stats()
+    search_doc = SearchDocument() if search else None
+    try:
+        title = convert_file(input_path, output_path, asset_dir, stream, search_doc)
+        error = None
+    except Exception as e:
+        title = None
+        error = str(e)
+    after = highlight_cache_stats()
+    return {
+        'input': input_path,
+        'output': output_path,
+        'title': title,
+        'error': error,
+        'bytes': input_path.stat().st_size if input_path.exists() else 0,
+        'seconds': time.perf_counter() - start,
+        'highlight_hits': after['hits'] - before['hits'],
+        'highlight_misses': after['misses'] - before['misses'],
+        'search': search_doc.to_dict() if search_doc and not error else None,
+    }
+
+def convert_directory(src_dir, out_dir, jobs=None, force=False, external_assets=False,
+                      highlight_cache_dir=None, stream=False, search_index=False,
+                      precompress=False):
+    """
+    Convert every markdown file under src_dir into out_dir in parallel.
+    
+    The directory layout below src_dir is mirrored under out_dir. Files are
+    converted across a ProcessPoolExecutor so the markdown/Pygments import
+    cost is paid once per worker rather than once per file; jobs=1 converts
+    them in this process instead (as --watch does for every rebuild).
+    
+    A build manifest in out_dir records each input's content hash and the
+    converter fingerprint; inputs that match their entry (and whose output
+    still exists) are skipped unless force is set. Outputs of sources that
+    have been deleted since the last build are removed.
+    
+    With external_assets, one content-hashed md2html.<hash>.css/.js pair is
+    written to the root of out_dir and every page links to it.
+    
+    With highlight_cache_dir, every worker highlights code blocks through a
+    shared on-disk HighlightCache. With stream, files are converted section by
+    section (see convert_file_streaming).
+    
+    With search_index, each page's title, headings and body terms are kept in
+    its manifest entry (so skipped files stay indexed) and a search-index.json
+    plus md2html-search.js lookup script covering the whole tree are written
+    to the root of out_dir.
+    
+    With precompress, .gz/.br sidecars are written for every page and shared
+    file md2html produced; unchanged files keep their existing sidecars.
+    
+    Returns:
+        list: One result dict per converted file (input, output, title, error, bytes, seconds)
+    """
+    src_dir = Path(src_dir)
+    out_dir = Path(out_dir)
+    sources = discover_markdown_files(src_dir)
+    
+    print(f"Converting: {src_dir}")
+    print(f"Output to: {out_dir}")
+    print(f"📂 Found {len(sources)} markdown file(s)")
+    
+    manifest = load_manifest(out_dir)
+    old_entries = manifest['entries']
+    if not sources and not old_entries:
+        return []
+    
+    asset_dir = None
+    if external_assets:
+        asset_dir = out_dir
+        for path in write_shared_assets(asset_dir):
+            print(f"🎨 Shared asset: {path.name}")
+    
+    fingerprint = build_fingerprint(external_assets)
+    entries = {}
+    pending = []
+    hits = 0
+    
+    for source in sources:
+        rel = source.relative_to(src_dir).as_posix()
+        output_path = out_dir / source.relative_to(src_dir).with_suffix('.html')
+        content_hash = hash_file(source)
+        entry = old_entries.get(rel)
+        indexed = not search_index or (entry or {}).get('search') is not None
+        if not force and indexed and is_up_to_date(entry, content_hash, fingerprint, output_path):
+            entries[rel] = entry
+            hits += 1
+            continue
+        pending.append((source, output_path, content_hash))
+    
+    current = {source.relative_to(src_dir).as_posix() for source in sources}
+    for rel in sorted(set(old_entries) - current):
+        output = old_entries[rel].get('output')
+        if output and remove_output(out_dir / output):
+            print(f"  🗑️  {output} (source deleted)")
+    
+    results = []
+    start = time.perf_counter()
+    
+    def record(result, content_hash):
+        results.append(result)
+        rel = result['input'].relative_to(src_dir)
+        if result['error']:
+            print(f"  ❌ {rel}: {result['error']}")
+            return
+        print(f"  ✓ {rel} ({result['seconds'] * 1000:.1f} ms)")
+        entries[rel.as_posix()] = {
+            'hash': content_hash,
+            'fingerprint': fingerprint,
+            'output': result['output'].relative_to(out_dir).as_posix(),
+        }
+        if result['search']:
+            entries[rel.as_posix()]['search'] = result['search']
+    
+    if pending and jobs == 1:
+        if highlight_cache_dir and not is_highlight_cache_installed(highlight_cache_dir):
+            install_highlight_cache(highlight_cache_dir)
+        for source, output_path, content_hash in pending:
+            record(_convert_job(source, output_path, asset_dir, stream, search_index), content_hash)
+    elif pending:
+        pool_options = {}
+        if highlight_cache_dir:
+            pool_options = {'initializer': install_highlight_cache, 'initargs': (highlight_cache_dir,)}
+        with ProcessPoolExecutor(max_workers=jobs, **pool_options) as executor:
+            futures = {
+                executor.submit(
+                    _convert_job, source, output_path, asset_dir, stream, search_index
+                ): content_hash
+                for source, output_path, content_hash in pending
+            }
+            for future in as_completed(futures):
+                record(future.result(), futures[future])
+    
+    elapsed = time.perf_counter() - start
+    
+    # Entries for deleted sources are dropped; failed files stay misses next run
+    manifest['entries'] = entries
+    save_manifest(out_dir, manifest)
+    
+    print_batch_summary(results, elapsed)
+    print(f"♻️  Manifest: {hits} up to date (hit), {len(pending)} rebuilt (miss)")
+    if search_index:
+        documents = {
+            entry['output']: entry['search']
+            for entry in entries.values() if entry.get('search')
+        }
+        index = write_search_index(out_dir, documents)
+        size_kb = (out_dir / SEARCH_INDEX_NAME).stat().st_size / 1024
+        print(f"🔎 Search index: {len(index['docs'])} page(s), {len(index['terms'])} term(s), {size_kb:.1f} KB")
+    if highlight_cache_dir:
+        print_highlight_summary(
+            sum(r['highlight_hits'] for r in results),
+            sum(r['highlight_misses'] for r in results),
+        )
+    if precompress:
+        outputs = [out_dir / entry['output'] for entry in entries.values()]
+        if asset_dir:
+            outputs.extend(asset_dir / name for name in shared_asset_files())
+        if search_index:
+            outputs.extend([out_dir / SEARCH_INDEX_NAME, out_dir / SEARCH_SCRIPT_NAME])
+        print_precompress_summary(compress_files(outputs, jobs=jobs))
+    return results
+
+def print_batch_summary(results, elapsed):
+    """Print overall throughput for a batch conversion."""
+    converted = [r for r in results if not r['error']]
+    failed = len(results) - len(converted)
+    total_kb = sum(r['bytes'] for r in converted) / 1024
+    rate = len(converted) / elapsed if elapsed > 0 else 0.0
+    kb_rate = total_kb / elapsed if elapsed > 0 else 0.0
+    
+    print()
+    print(f"📊 Converted {len(converted)} file(s), {total_kb:.1f} KB of markdown, in {elapsed:.2f}s")
+    print(f"⚡ Throughput: {rate:.1f} files/s, {kb_rate:.1f} KB/s")
+    if failed:
+        print(f"❌ Failed: {failed}")
+
+def print_highlight_summary(hits, misses):
+    """Print code highlight cache hit rate."""
+    total = hits + misses
+    rate = hits / total * 100 if total else 0.0
+    print(f"🖍️  Highlight cache: {hits} hit(s), {misses} miss(es) ({rate:.1f}% hit rate)")
+
+# Server-sent events endpoint used by --watch to trigger browser reloads
+LIVE_RELOAD_PATH = '/__md2html/reload'
+
+LIVE_RELOAD_SCRIPT = f"""<script>
+  new EventSource('{LIVE_RELOAD_PATH}').onmessage = () => location.reload();
+</script>
+"""
+
+class LiveReload:
+    """Build counter that server threads can block on until the next rebuild."""
+    
+    def __init__(self):
+        self.version = 0
+        self._changed = threading.Condition()
+    
+    def notify(self):
+        """Record a rebuild and wake every waiting client."""
+        with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+    
+    def wait(self, version, timeout):
+        """Block until version moves past the given one (or timeout); return the current version."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+class LiveReloadHandler(SimpleHTTPRequestHandler):
+    """
+    Static file handler that injects the live-reload client into HTML pages.
+    
+    Expects the server to carry a LiveReload instance as server.live_reload.
+    """
+    
+    def do_GET(self):
+        if self.path.split('?', 1)[0] == LIVE_RELOAD_PATH:
+            self._stream_reload_events()
+            return
+        
+        path = self.translate_path(self.path)
+        if not (path.endswith('.html') and os.path.isfile(path)):
+            super().do_GET()
+            return
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            page = f.read()
+        if '</body>' in page:
+            page = page.replace('</body>', LIVE_RELOAD_SCRIPT + '</body>', 1)
+        else:
+            page += LIVE_RELOAD_SCRIPT
+        body = page.encode('utf-8')
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _stream_reload_events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        live_reload = self.server.live_reload
+        version = live_reload.version
+        try:
+            while True:
+                current = live_reload.wait(version, timeout=15)
+                if current != version:
+                    version = current
+                    self.wfile.write(b'data: reload\n\n')
+                else:
+                    self.wfile.write(b': keep-alive\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
+    def log_message(self, format, *args):
+        pass
+
+def snapshot_markdown_files(src_dir):
+    """Return {path: (mtime_ns, size)} for every markdown file under src_dir."""
+    snapshot = {}
+    for path in discover_markdown_files(src_dir):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+def watch_directory(src_dir, out_dir, port=8000, interval=1.0, external_assets=False,
+                    highlight_cache_dir=None, stream=False, search_index=False,
+                    precompress=False):
+    """
+    Serve out_dir over HTTP and re-render markdown under src_dir as it changes.
+    
+    After an initial incremental build, the source tree is polled every
+    interval seconds. Whenever a file is added, modified or deleted, the same
+    incremental convert_directory() build as --recursive runs again in this
+    process (jobs=1), so the markdown stack is imported once, only changed
+    files are re-rendered, deleted sources lose their pages, and the
+    manifest, search index and sidecars stay in step with a normal build.
+    Open pages reload via server-sent events.
+    """
+    src_dir = Path(src_dir)
+    out_dir = Path(out_dir)
+    build = partial(
+        convert_directory, src_dir, out_dir,
+        jobs=1,
+        external_assets=external_assets,
+        highlight_cache_dir=highlight_cache_dir,
+        stream=stream,
+        search_index=search_index,
+        precompress=precompress,
+    )
+    build()
+    
+    live_reload = LiveReload()
+    handler = partial(LiveReloadHandler, directory=str(out_dir))
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    server.live_reload = live_reload
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    print()
+    print(f"👀 Watching {src_dir} for changes (every {interval:g}s)")
+    print(f"🌐 Serving {out_dir} at http://127.0.0.1:{port}/")
+    print("   Press Ctrl+C to stop")
+    
+    snapshot = snapshot_markdown_files(src_dir)
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot_markdown_files(src_dir)
+            if current == snapshot:
+                continue
+            
+            print()
+            try:
+                build()
+            except OSError as e:  # a file vanished mid-build; retried on the next poll
+                print(f"  ❌ {e}")
+                continue
+            snapshot = current
+            live_reload.notify()
+    except KeyboardInterrupt:
+        print("\n⚠️  Stopped watching")
+    finally:
+        server.shutdown()
+        server.server_close()
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python md2html.py input.md [output.html]")
-        print("\nExample:")
-        print("  python md2html.py README.md")
-        print("  python md2html.py docs/guide.md output/guide.html")
+    parser = argparse.ArgumentParser(
+        description='Convert Markdown files to themed HTML pages with light/dark mode toggle',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python md2html.py README.md
+  python md2html.py docs/guide.md output/guide.html
+  python md2html.py --recursive projects site/projects --jobs 4
+  python md2html.py --recursive projects site/projects --force
+  python md2html.py --recursive projects site/projects --external-assets
+  python md2html.py --recursive projects site/projects --highlight-cache .md2html-cache
+  python md2html.py --watch docs --out-dir site/docs --port 8000
+  python md2html.py huge-report.md --stream
+  python md2html.py --recursive projects site/projects --search-index
+  python md2html.py --recursive projects site/projects --precompress
+        """
+    )
+    parser.add_argument('input', nargs='?', help='Markdown file to convert')
+    parser.add_argument('output', nargs='?', help='Output HTML file (default: input with .html extension)')
+    parser.add_argument(
+        '--recursive',
+        nargs=2,
+        metavar=('SRC_DIR', 'OUT_DIR'),
+        help='Convert every .md/.markdown file under SRC_DIR into OUT_DIR'
+    )
+    parser.add_argument(
+        '--watch',
+        metavar='DIR',
+        help='Serve DIR with live reload and re-render markdown files as they change'
+    )
+    parser.add_argument(
+        '--out-dir',
+        metavar='DIR',
+        help='Output directory for --watch (default: alongside the sources)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8000,
+        help='HTTP port for --watch (default: 8000)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='Seconds between source tree polls in --watch mode (default: 1.0)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for --recursive (default: number of CPUs; 1 converts in-process)'
+    )
+    parser.add_argument(
+        '--external-assets',
+        action='store_true',
+        help='Link one shared, content-hashed md2html.<hash>.css/.js pair instead of inlining them'
+    )
+    parser.add_argument(
+        '--highlight-cache',
+        metavar='DIR',
+        help='Cache highlighted code blocks on disk in DIR and reuse them across runs'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Convert large files section by section (split on top-level headings) with bounded memory'
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='Write search-index.json and md2html-search.js covering the --recursive/--watch output'
+    )
+    parser.add_argument(
+        '--precompress',
+        action='store_true',
+        help='Also write .gz (and .br with brotli installed) sidecars for generated files'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild every file in --recursive mode, ignoring the build manifest'
+    )
+    args = parser.parse_args()
+    
+    if args.precompress and compress_files is None:
+        print("Error: --precompress requires the precompress package")
+        print("  pip install -e scripts/utility/precompress")
+        sys.exit(1)
+    
+    if args.watch:
+        src_dir = Path(args.watch)
+        if not src_dir.is_dir():
+            print(f"Error: Source directory '{src_dir}' not found")
+            sys.exit(1)
+        watch_directory(
+            src_dir, Path(args.out_dir) if args.out_dir else src_dir,
+            port=args.port,
+            interval=args.interval,
+            external_assets=args.external_assets,
+            highlight_cache_dir=args.highlight_cache,
+            stream=args.stream,
+            search_index=args.search_index,
+            precompress=args.precompress,
+        )
+        return
+    
+    if args.recursive:
+        src_dir, out_dir = (Path(p) for p in args.recursive)
+        if not src_dir.is_dir():
+            print(f"Error: Source directory '{src_dir}' not found")
+            sys.exit(1)
+        results = convert_directory(
+            src_dir, out_dir,
+            jobs=args.jobs,
+            force=args.force,
+            external_assets=args.external_assets,
+            highlight_cache_dir=args.highlight_cache,
+            stream=args.stream,
+            search_index=args.search_index,
+            precompress=args.precompress,
+        )
+        if any(r['error'] for r in results):
+            sys.exit(1)
+        return
+    
+    if not args.input:
+        parser.print_usage()
         sys.exit(1)
     
-    input_path = Path(sys.argv[1])
+    input_path = Path(args.input)
     
     if not input_path.exists():
         print(f"Error: Input file '{input_path}' not found")
         sys.exit(1)
     
-    if not input_path.suffix.lower() in ['.md', '.markdown']:
+    if not input_path.suffix.lower() in MARKDOWN_SUFFIXES:
         print(f"Error: Input file must be a Markdown file (.md or .markdown)")
         sys.exit(1)
     
     # Determine output path
-    if len(sys.argv) >= 3:
-        output_path = Path(sys.argv[2])
+    if args.output:
+        output_path = Path(args.output)
     else:
         output_path = input_path.with_suffix('.html')
     
-    # Create output directory if it doesn't exist
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
     print(f"Converting: {input_path}")
     print(f"Output to: {output_path}")
     
-    # Read markdown content
-    markdown_content = read_markdown_file(input_path)
-    
-    # Extract title
-    title = extract_title(markdown_content)
-    
-    # Convert markdown to HTML
-    html_content = convert_markdown_to_html(markdown_content)
-    
-    # Generate complete HTML page
-    full_html = generate_html_template(title, html_content)
+    if args.highlight_cache:
+        install_highlight_cache(args.highlight_cache)
     
-    # Write output file
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        asset_dir = None
+        if args.external_assets:
+            asset_dir = output_path.parent
+            write_shared_assets(asset_dir)
+        title = convert_file(input_path, output_path, asset_dir, args.stream)
+        if args.precompress:
+            outputs = [output_path]
+            if asset_dir:
+                outputs.extend(asset_dir / name for name in shared_asset_files())
+            compress_files(outputs, jobs=1)
         print(f"✅ Successfully created: {output_path}")
         print(f"📄 Title: {title}")
         print(f"🎨 Features: Light/Dark theme toggle, responsive design, print-ready")
+        if args.highlight_cache:
+            stats = highlight_cache_stats()
+            print_highlight_summary(stats['hits'], stats['misses'])
     except Exception as e:
-        print(f"Error writing output file: {e}")
+        print(f"Error converting {input_path}: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,6 @@
+"""md2html is a standalone script rather than a package; make it importable from the tests."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,504 @@
+"""Tests for md2html."""
+
+import json
+import shutil
+import subprocess
+
+import md2html
+import pytest
+from markdown.extensions import codehilite, fenced_code
+
+PAGE = """# Guide
+
+Intro paragraph about the theme toggle.
+
+## Install
+
+```python
+def install():
+
+    return "ok"
+```
+"""
+
+
+def write_tree(root, files):
+    """Write {relative path: markdown} under root."""
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def build(src, out, jobs=1, **options):
+    """Run a --recursive build (in-process by default) and return {relative input: result}."""
+    results = md2html.convert_directory(src, out, jobs=jobs, **options)
+    return {r["input"].relative_to(src).as_posix(): r for r in results}
+
+
+@pytest.fixture
+def highlighting(monkeypatch):
+    """Undo install_highlight_cache() after the test."""
+    monkeypatch.setattr(md2html, "_highlight_cache", None)
+    monkeypatch.setattr(fenced_code, "CodeHilite", fenced_code.CodeHilite)
+    monkeypatch.setattr(codehilite, "CodeHilite", codehilite.CodeHilite)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A small source tree and an empty output directory."""
+    src = tmp_path / "src"
+    write_tree(src, {
+        "index.md": PAGE,
+        "docs/usage.markdown": "# Usage\n\nRun it.\n",
+        "docs/notes.txt": "not markdown",
+        "node_modules/pkg/README.md": "# Vendored\n",
+        ".hidden/page.md": "# Hidden\n",
+    })
+    return src, tmp_path / "out"
+
+
+class TestConvertDirectory:
+    """Tests for the --recursive batch build."""
+
+    def test_mirrors_layout_and_skips_vendor_dirs(self, tree):
+        """Test that markdown files are converted into the same layout under the output."""
+        src, out = tree
+
+        results = build(src, out)
+
+        assert sorted(results) == ["docs/usage.markdown", "index.md"]
+        assert all(r["error"] is None for r in results.values())
+        assert (out / "index.html").read_text().startswith("<!DOCTYPE html>")
+        assert '<h1 id="usage">Usage</h1>' in (out / "docs" / "usage.html").read_text()
+        assert not (out / "node_modules").exists()
+
+    def test_parallel_build_matches_single_file_conversion(self, tree, tmp_path):
+        """Test that pages from the process pool are identical to convert_file output."""
+        src, out = tree
+        build(src, out, jobs=2)
+
+        md2html.convert_file(src / "index.md", tmp_path / "single.html")
+
+        assert (out / "index.html").read_text() == (tmp_path / "single.html").read_text()
+
+    def test_errors_are_reported_per_file(self, tree):
+        """Test that an unreadable file fails alone and stays a miss for the next run."""
+        src, out = tree
+        (src / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+
+        results = build(src, out)
+
+        assert results["broken.md"]["error"]
+        assert results["index.md"]["error"] is None
+        assert "broken.md" not in md2html.load_manifest(out)["entries"]
+
+
+class TestManifest:
+    """Tests for incremental builds driven by the build manifest."""
+
+    def test_second_build_skips_unchanged_files(self, tree, capsys):
+        """Test that nothing is rebuilt when no input changed."""
+        src, out = tree
+        build(src, out)
+        capsys.readouterr()
+
+        assert build(src, out) == {}
+        assert "2 up to date (hit), 0 rebuilt (miss)" in capsys.readouterr().out
+
+    def test_edited_file_is_rebuilt(self, tree):
+        """Test that only the edited file is a miss."""
+        src, out = tree
+        build(src, out)
+        (src / "index.md").write_text("# Renamed\n", encoding="utf-8")
+
+        assert list(build(src, out)) == ["index.md"]
+        assert "Renamed" in (out / "index.html").read_text()
+
+    def test_missing_output_is_rebuilt(self, tree):
+        """Test that a deleted output is regenerated even though its input is unchanged."""
+        src, out = tree
+        build(src, out)
+        (out / "docs" / "usage.html").unlink()
+
+        assert list(build(src, out)) == ["docs/usage.markdown"]
+
+    def test_force_rebuilds_everything(self, tree):
+        """Test that --force ignores the manifest."""
+        src, out = tree
+        build(src, out)
+
+        assert sorted(build(src, out, force=True)) == ["docs/usage.markdown", "index.md"]
+
+    def test_fingerprint_change_forces_rebuild(self, tree, monkeypatch):
+        """Test that a new converter version invalidates every entry."""
+        src, out = tree
+        build(src, out)
+        before = md2html.build_fingerprint()
+
+        monkeypatch.setattr(md2html, "CONVERTER_VERSION", "0.0.0-test")
+
+        assert md2html.build_fingerprint() != before
+        assert sorted(build(src, out)) == ["docs/usage.markdown", "index.md"]
+
+    @pytest.mark.parametrize("name, value", [
+        ("PYGMENTS_VERSION", "0.0.0-test"),
+        ("CODEHILITE_CONFIG", {"css_class": "highlight", "linenums": True}),
+    ])
+    def test_fingerprint_tracks_highlighting(self, name, value, monkeypatch):
+        """Test that a Pygments upgrade or new codehilite options invalidate highlighted pages."""
+        before = md2html.build_fingerprint()
+
+        monkeypatch.setattr(md2html, name, value)
+
+        assert md2html.build_fingerprint() != before
+
+    def test_fingerprint_depends_on_asset_mode(self):
+        """Test that inline and external-asset builds never reuse each other's outputs."""
+        assert md2html.build_fingerprint(True) != md2html.build_fingerprint(False)
+
+    def test_stream_toggle_keeps_entries(self, tree):
+        """Test that switching --stream does not rebuild pages it would render identically."""
+        src, out = tree
+        build(src, out)
+
+        assert build(src, out, stream=True) == {}
+
+    def test_deleted_source_drops_its_entry_and_output(self, tree):
+        """Test that the manifest only lists current sources and stale pages are removed."""
+        src, out = tree
+        build(src, out)
+        (out / "docs" / "usage.html.gz").write_bytes(b"sidecar")
+        (src / "docs" / "usage.markdown").unlink()
+        build(src, out)
+
+        assert list(md2html.load_manifest(out)["entries"]) == ["index.md"]
+        assert not (out / "docs" / "usage.html").exists()
+        assert not (out / "docs" / "usage.html.gz").exists()
+        assert (out / "index.html").exists()
+
+    def test_corrupt_manifest_means_full_rebuild(self, tree):
+        """Test that an unreadable manifest is treated as empty."""
+        src, out = tree
+        build(src, out)
+        (out / md2html.MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+
+        assert len(build(src, out)) == 2
+        assert json.loads((out / md2html.MANIFEST_NAME).read_text())["entries"]
+
+
+class TestHighlightCache:
+    """Tests for the on-disk cache of highlighted code blocks."""
+
+    def test_second_build_hits_the_cache(self, tree, tmp_path, highlighting):
+        """Test that rebuilding identical code blocks never runs Pygments again."""
+        src, out = tree
+        cache_dir = tmp_path / "cache"
+
+        first = build(src, out, highlight_cache_dir=cache_dir)
+        first_html = (out / "index.html").read_text()
+        # Fresh worker processes, so the hit comes from disk
+        second = build(src, out, jobs=2, highlight_cache_dir=cache_dir, force=True)
+
+        assert first["index.md"]["highlight_misses"] == 1
+        assert first["index.md"]["highlight_hits"] == 0
+        assert second["index.md"]["highlight_misses"] == 0
+        assert second["index.md"]["highlight_hits"] == 1
+        assert (out / "index.html").read_text() == first_html
+        assert len(list(cache_dir.glob("*/*.html"))) == 1
+
+    def test_key_depends_on_language_and_options(self, tmp_path):
+        """Test that the same code highlighted differently gets different entries."""
+        cache = md2html.HighlightCache(tmp_path)
+        key = cache.key(["python"], "x = 1", "default", {})
+
+        assert cache.key(["python"], "x = 1", "default", {}) == key
+        assert cache.key(["ruby"], "x = 1", "default", {}) != key
+        assert cache.key(["python"], "x = 1", "monokai", {}) != key
+        assert cache.key(["python"], "x = 1", "default", {"linenos": True}) != key
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a new process (instance) reads entries written by another."""
+        md2html.HighlightCache(tmp_path).put("ab" * 32, "<pre>x</pre>")
+        cache = md2html.HighlightCache(tmp_path)
+
+        assert cache.get("ab" * 32) == "<pre>x</pre>"
+        assert cache.get("cd" * 32) is None
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+class TestWatch:
+    """Tests for the --watch rebuild loop."""
+
+    def test_changes_rebuild_like_a_normal_build(self, tree, monkeypatch):
+        """Test that edits, additions and deletions update pages, manifest and search index."""
+        src, out = tree
+        polls = []
+
+        def sleep(seconds):
+            polls.append(seconds)
+            if len(polls) == 1:
+                (src / "docs" / "usage.markdown").unlink()
+                (src / "new.md").write_text("# Fresh page\n", encoding="utf-8")
+                (src / "index.md").write_text("# Guide\n\nEdited.\n", encoding="utf-8")
+            else:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(md2html.time, "sleep", sleep)
+        md2html.watch_directory(src, out, port=0, search_index=True)
+
+        assert len(polls) == 2
+        assert not (out / "docs" / "usage.html").exists()
+        assert "Fresh page" in (out / "new.html").read_text()
+        assert "Edited." in (out / "index.html").read_text()
+        assert sorted(md2html.load_manifest(out)["entries"]) == ["index.md", "new.md"]
+        index = json.loads((out / md2html.SEARCH_INDEX_NAME).read_text())
+        assert [url for url, _ in index["docs"]] == ["index.html", "new.html"]
+        assert "fresh" in index["terms"]
+
+
+class TestExternalAssets:
+    """Tests for the shared, content-hashed stylesheet and script."""
+
+    def test_pages_link_hashed_assets(self, tree):
+        """Test that every page links the same assets by a path relative to itself."""
+        src, out = tree
+        build(src, out, external_assets=True)
+        css_name, js_name = md2html.shared_asset_files()
+
+        assert (out / css_name).is_file() and (out / js_name).is_file()
+        assert f'href="{css_name}"' in (out / "index.html").read_text()
+        usage = (out / "docs" / "usage.html").read_text()
+        assert f'href="../{css_name}"' in usage
+        assert f'src="../{js_name}"' in usage
+        assert "<style>" not in usage
+
+    def test_asset_names_follow_contents(self, monkeypatch):
+        """Test that editing the stylesheet changes its file name."""
+        before = list(md2html.shared_asset_files())
+
+        monkeypatch.setattr(md2html, "PAGE_CSS", md2html.PAGE_CSS + "\n    body { margin: 0; }")
+
+        after = list(md2html.shared_asset_files())
+        assert after[0] != before[0]
+        assert after[1] == before[1]
+
+
+class TestSections:
+    """Tests for splitting markdown into top-level sections for --stream."""
+
+    def test_splits_before_top_level_headings_only(self, tmp_path):
+        """Test that '# ' starts a section while '##' and fenced headings do not."""
+        path = tmp_path / "doc.md"
+        path.write_text(
+            "# One\n\n## Sub\n\n```\n# in code\n```\n\n# Two\n\n~~~\n# in tilde code\n\n~~~\n",
+            encoding="utf-8",
+        )
+
+        sections = list(md2html.iter_markdown_sections(path))
+
+        assert [section.splitlines()[0] for section in sections] == ["# One", "# Two"]
+        assert "".join(sections) == path.read_text()
+
+    def test_fence_closes_only_on_the_same_fence(self, tmp_path):
+        """Test that a shorter fence inside a longer one does not end the code block."""
+        path = tmp_path / "doc.md"
+        path.write_text("# One\n\n````\n```\n\n# in code\n````\n\n# Two\n", encoding="utf-8")
+
+        assert len(list(md2html.iter_markdown_sections(path))) == 2
+
+
+STREAM_DOC = """# Intro
+
+Some text with `code`.
+
+```python
+def f():
+
+    # not a heading
+
+    return 1
+```
+
+# Second
+
+~~~
+# also not a heading
+
+~~~
+
+| a | b |
+|---|---|
+| 1 | 2 |
+# Not split: joined to the table above
+
+````markdown
+```
+
+# inside a four-backtick fence
+```
+````
+
+## Sub
+
+<div>
+raw html
+</div>
+
+# Third
+
+    indented code
+
+# Last
+text
+"""
+
+
+class TestStreaming:
+    """Tests for --stream conversion."""
+
+    def test_output_matches_whole_document(self, tmp_path):
+        """Test that streamed pages are byte-identical to whole-document conversion."""
+        source = tmp_path / "doc.md"
+        source.write_text(STREAM_DOC, encoding="utf-8")
+
+        md2html.convert_file(source, tmp_path / "whole.html")
+        md2html.convert_file(source, tmp_path / "stream.html", stream=True)
+
+        assert len(list(md2html.iter_markdown_sections(source))) == 4
+        assert (tmp_path / "stream.html").read_text() == (tmp_path / "whole.html").read_text()
+
+    def test_search_document_matches_whole_document(self, tmp_path):
+        """Test that streaming indexes the same headings and terms."""
+        source = tmp_path / "doc.md"
+        source.write_text(STREAM_DOC, encoding="utf-8")
+        whole, stream = md2html.SearchDocument(), md2html.SearchDocument()
+
+        md2html.convert_file(source, tmp_path / "whole.html", search_doc=whole)
+        md2html.convert_file(source, tmp_path / "stream.html", stream=True, search_doc=stream)
+
+        assert stream.to_dict() == whole.to_dict()
+        assert "md2html" not in stream.terms
+
+
+class TestConverter:
+    """Tests for the cached, resettable converter."""
+
+    def test_convert_many_resets_between_documents(self):
+        """Test that heading ids don't carry over from one document to the next."""
+        html = list(md2html.convert_many(["# Same\n", "# Same\n"]))
+
+        assert html == ['<h1 id="same">Same</h1>'] * 2
+
+
+class TestSearchIndex:
+    """Tests for the site-wide search index."""
+
+    def test_tokenize_drops_stopwords_and_short_tokens(self):
+        """Test the search term rules."""
+        assert md2html.tokenize("The Theme-Toggle is a 2x win!") == ["theme", "toggle", "2x", "win"]
+
+    def test_index_contents(self, tree):
+        """Test docs, weights and that skipped files stay indexed."""
+        src, out = tree
+        build(src, out, search_index=True)
+        build(src, out, search_index=True)
+
+        index = json.loads((out / md2html.SEARCH_INDEX_NAME).read_text())
+
+        assert index["docs"] == [["docs/usage.html", "Usage"], ["index.html", "Guide"]]
+        usage, guide = 0, 1
+        # Title and H1 (heading) outweigh body text
+        assert index["terms"]["guide"] == [guide, 1 + md2html.HEADING_WEIGHT + md2html.TITLE_WEIGHT]
+        assert index["terms"]["install"] == [guide, 2 + md2html.HEADING_WEIGHT]
+        assert index["terms"]["run"] == [usage, 1]
+        assert "the" not in index["terms"]
+        assert (out / md2html.SEARCH_SCRIPT_NAME).is_file()
+
+    def test_lookup_script_embeds_the_stopwords(self):
+        """Test that md2html-search.js filters the same stopwords as the indexer."""
+        assert json.dumps(sorted(md2html.SEARCH_STOPWORDS)) in md2html.SEARCH_SCRIPT
+        assert "%STOPWORDS%" not in md2html.SEARCH_SCRIPT
+
+    def test_body_weight_is_capped(self):
+        """Test that repeating a word cannot outrank a title match."""
+        doc = md2html.SearchDocument()
+        doc.title = "Other"
+        doc.add_html("<p>" + "spam " * 50 + "</p>", [])
+
+        index = md2html.build_search_index({"a.html": doc.to_dict()})
+
+        assert index["terms"]["spam"] == [0, md2html.MAX_BODY_WEIGHT]
+        assert index["terms"]["other"] == [0, md2html.TITLE_WEIGHT]
+
+
+# Runs md2html-search.js under node with just enough of a browser to load it
+NODE_HARNESS = """
+const fs = require('fs');
+const [script, indexPath, calls] = process.argv.slice(2);
+globalThis.window = globalThis;
+globalThis.document = { currentScript: null, addEventListener() {} };
+globalThis.location = { href: 'http://localhost/site/' };
+globalThis.fetch = async () => ({ json: async () => JSON.parse(fs.readFileSync(indexPath, 'utf8')) });
+eval(fs.readFileSync(script, 'utf8'));
+(async () => {
+  const out = [];
+  for (const [fn, arg] of JSON.parse(calls)) {
+    out.push(fn === 'tokenize' ? md2htmlSearch.tokenize(arg) : await md2htmlSearch(arg));
+  }
+  console.log(JSON.stringify(out));
+})();
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run md2html-search.js")
+class TestSearchScript:
+    """Tests for md2html-search.js against a real index."""
+
+    @pytest.fixture
+    def run_js(self, tree, tmp_path):
+        """Build the search index and return a function calling the lookup script."""
+        src, out = tree
+        build(src, out, search_index=True)
+        harness = tmp_path / "harness.js"
+        harness.write_text(NODE_HARNESS, encoding="utf-8")
+
+        def run_js(*calls):
+            result = subprocess.run(
+                ["node", str(harness), str(out / md2html.SEARCH_SCRIPT_NAME),
+                 str(out / md2html.SEARCH_INDEX_NAME), json.dumps(calls)],
+                capture_output=True, text=True, check=True,
+            )
+            return json.loads(result.stdout)
+
+        return run_js
+
+    def test_tokenizes_like_the_indexer(self, run_js):
+        """Test that query terms follow exactly the rules used to build the index."""
+        texts = [
+            "The Theme-Toggle is a 2x win!",
+            "how to install it on the server",
+            "A B c -- x1 of and",
+            "Ünïcode café naïve",
+        ]
+
+        assert run_js(*[("tokenize", text) for text in texts]) == [md2html.tokenize(t) for t in texts]
+
+    def test_stopwords_in_queries_are_ignored(self, run_js):
+        """Test that a query containing stopwords still finds the page."""
+        with_stopwords, without, only_stopwords = run_js(
+            ("search", "the install of it"), ("search", "install"), ("search", "the and"),
+        )
+
+        assert [r["title"] for r in with_stopwords] == ["Guide"]
+        assert with_stopwords == without
+        assert with_stopwords[0]["url"] == "http://localhost/site/index.html"
+        assert only_stopwords == []
+
+    def test_prefix_queries_and_every_word(self, run_js):
+        """Test prefix matching and that every query word must match."""
+        prefix, both, single = run_js(("search", "inst"), ("search", "guide run"), ("search", "usage"))
+
+        assert [r["title"] for r in prefix] == ["Guide"]
+        assert both == []
+        assert [r["title"] for r in single] == ["Usage"]
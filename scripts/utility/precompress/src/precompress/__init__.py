@@ -0,0 +1,12 @@
+"""Pre-compressed (.gz/.br) sidecar output for generated site files."""
+
+from .writer import compress_file, compress_files, find_compressible_files, print_summary, write_output
+
+__version__ = "0.1.0"
+__all__ = [
+    "compress_file",
+    "compress_files",
+    "find_compressible_files",
+    "print_summary",
+    "write_output",
+]
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Write generated files with pre-compressed sidecars.
+
+Static hosts that support pre-compressed assets (nginx gzip_static/brotli_static,
+Netlify, Cloudflare Pages, etc.) serve `page.html.gz` / `page.html.br` directly
+when the browser accepts them, so no CPU is spent compressing on the fly.
+
+Sidecars are written at maximum compression. The sha256 of the source each
+sidecar was built from is recorded in a per-directory `.precompress.json`, so
+re-running over an unchanged tree does no compression work at all. Several
+processes may precompress into one directory at once: manifest updates are
+merged under a lock file instead of overwriting each other.
+
+Brotli output requires the optional `brotli` package; without it only .gz
+sidecars are produced.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # .br sidecars are skipped when brotli isn't installed
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): manifest updates are merged without a lock
+    fcntl = None
+
+
+# Per-directory record of the source hash each sidecar was built from
+MANIFEST_NAME = ".precompress.json"
+# Held while a process merges its entries into the manifest
+MANIFEST_LOCK_NAME = ".precompress.lock"
+
+# File types worth compressing for a static site
+DEFAULT_EXTENSIONS = (".html", ".css", ".js", ".json", ".md", ".svg", ".xml", ".txt")
+
+
+def available_encodings() -> list[str]:
+    """Return the sidecar suffixes this environment can produce."""
+    return ["gz", "br"] if brotli is not None else ["gz"]
+
+
+def write_output(
+    path: str | Path,
+    content: str | bytes,
+    precompress: bool = False,
+    encoding: str = "utf-8",
+) -> bool:
+    """
+    Write content to path, optionally followed by .gz/.br sidecars.
+
+    The file is only rewritten when its content changed, which keeps mtimes
+    stable for incremental tooling. Sidecars are refreshed only when the
+    source hash differs from the one they were built from.
+
+    Args:
+        path: Output file path (parent directories are created)
+        content: Text (encoded with `encoding`) or bytes
+        precompress: Also write pre-compressed sidecars
+        encoding: Text encoding used when content is a str
+
+    Returns:
+        True if the file itself was (re)written
+    """
+    path = Path(path)
+    data = content.encode(encoding) if isinstance(content, str) else content
+
+    changed = True
+    try:
+        changed = path.read_bytes() != data
+    except OSError:
+        pass
+
+    if changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    if precompress:
+        compress_files([path], jobs=1)
+    return changed
+
+
+def _compress_bytes(data: bytes, suffix: str) -> bytes:
+    if suffix == "gz":
+        # mtime=0 keeps the output byte-identical for identical input
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def compress_file(path: str | Path, encodings: list[str] | None = None) -> dict:
+    """
+    Write compressed sidecars for one file unconditionally.
+
+    Returns:
+        Dict with the source path, its sha256 and bytes written per suffix
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    sizes = {}
+    for suffix in encodings or available_encodings():
+        sidecar = path.with_name(f"{path.name}.{suffix}")
+        tmp = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(_compress_bytes(data, suffix))
+        os.replace(tmp, sidecar)
+        sizes[suffix] = sidecar.stat().st_size
+    return {
+        "path": path,
+        "hash": hashlib.sha256(data).hexdigest(),
+        "bytes": len(data),
+        "sizes": sizes,
+    }
+
+
+def _load_manifest(directory: Path) -> dict:
+    try:
+        return json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory: Path, updates: dict) -> None:
+    """Merge entries into the directory's manifest.
+
+    The manifest is re-read under the lock, so entries other processes wrote
+    since this one loaded it are kept.
+    """
+    target = directory / MANIFEST_NAME
+    with open(directory / MANIFEST_LOCK_NAME, "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        manifest = _load_manifest(directory)
+        manifest.update(updates)
+        tmp = target.with_name(f".{MANIFEST_NAME}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, target)
+
+
+def _is_fresh(path: Path, entry: dict | None, digest: str, encodings: list[str]) -> bool:
+    if not entry or entry.get("hash") != digest:
+        return False
+    return all(path.with_name(f"{path.name}.{suffix}").exists() for suffix in encodings)
+
+
+def compress_files(
+    paths,
+    jobs: int | None = None,
+    force: bool = False,
+    encodings: list[str] | None = None,
+) -> dict:
+    """
+    Write sidecars for many files in parallel, skipping unchanged sources.
+
+    Hashing happens up front in this process; only files whose hash differs
+    from the per-directory manifest (or whose sidecars are missing) are sent
+    to the process pool.
+
+    Args:
+        paths: Iterable of files to compress
+        jobs: Worker processes (default: number of CPUs; 1 runs inline)
+        force: Recompress even if the source hash is unchanged
+        encodings: Sidecar suffixes to write (default: all available)
+
+    Returns:
+        Dict with written/skipped counts, byte totals and elapsed seconds
+    """
+    encodings = encodings or available_encodings()
+    start = time.perf_counter()
+
+    manifests: dict[Path, dict] = {}
+    pending = []
+    skipped = 0
+    for path in paths:
+        path = Path(path)
+        directory = path.parent
+        if directory not in manifests:
+            manifests[directory] = _load_manifest(directory)
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if not force and _is_fresh(path, manifests[directory].get(path.name), digest, encodings):
+            skipped += 1
+            continue
+        pending.append(path)
+
+    if jobs == 1 or len(pending) <= 1:
+        results = [compress_file(path, encodings) for path in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(compress_file, pending, [encodings] * len(pending)))
+
+    updates: dict[Path, dict] = {}
+    for result in results:
+        path = result["path"]
+        updates.setdefault(path.parent, {})[path.name] = {"hash": result["hash"], "encodings": sorted(result["sizes"])}
+    for directory, entries in updates.items():
+        _save_manifest(directory, entries)
+
+    return {
+        "written": len(results),
+        "skipped": skipped,
+        "source_bytes": sum(r["bytes"] for r in results),
+        "compressed_bytes": {
+            suffix: sum(r["sizes"].get(suffix, 0) for r in results) for suffix in encodings
+        },
+        "encodings": encodings,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def find_compressible_files(root: str | Path, extensions=DEFAULT_EXTENSIONS) -> list[Path]:
+    """Return files under root (or root itself) with a compressible extension."""
+    root = Path(root)
+    if root.is_file():
+        return [root]
+    return sorted(
+        p for p in root.rglob("*")
+        if p.is_file()
+        and p.suffix.lower() in extensions
+        and not any(part.startswith(".") for part in p.relative_to(root).parts)
+    )
+
+
+def print_summary(stats: dict) -> None:
+    """Print a one-line summary of a compress_files() run."""
+    ratios = []
+    for suffix in stats["encodings"]:
+        size = stats["compressed_bytes"][suffix]
+        if stats["source_bytes"]:
+            ratios.append(f".{suffix} {size / stats['source_bytes'] * 100:.0f}%")
+    ratio_text = f" ({', '.join(ratios)} of original)" if ratios else ""
+    print(
+        f"🗜️  Precompressed {stats['written']} file(s), {stats['skipped']} unchanged"
+        f"{ratio_text} in {stats['seconds']:.2f}s"
+    )
+
+
+def main():
+    """CLI entry point for the precompress command."""
+    parser = argparse.ArgumentParser(
+        description="Write .gz (and .br when brotli is installed) sidecars for generated files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Precompress every HTML/CSS/JS/JSON file under a build directory
+  precompress site/
+
+  # Only HTML, recompressing everything
+  precompress site/ --ext .html --force
+        """,
+    )
+
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Files or directories to precompress",
+    )
+    parser.add_argument(
+        "--ext",
+        nargs="+",
+        default=list(DEFAULT_EXTENSIONS),
+        help="File extensions to include when walking directories",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompress even when the source is unchanged",
+    )
+
+    args = parser.parse_args()
+
+    extensions = tuple(e if e.startswith(".") else f".{e}" for e in args.ext)
+    files = []
+    for root in args.paths:
+        if not root.exists():
+            print(f"❌ Error: Path not found: {root}")
+            return 1
+        files.extend(find_compressible_files(root, extensions))
+
+    if brotli is None:
+        print("ℹ️  brotli not installed; writing .gz sidecars only")
+
+    stats = compress_files(files, jobs=args.jobs, force=args.force)
+    print_summary(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
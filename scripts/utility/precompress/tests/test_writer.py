@@ -0,0 +1,83 @@
+"""Tests for precompress."""
+
+import gzip
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from precompress import compress_files, find_compressible_files, write_output
+
+
+def test_write_output_creates_gzip_sidecar(tmp_path):
+    """Test that write_output writes the file and a matching .gz sidecar."""
+    page = tmp_path / "site" / "index.html"
+
+    changed = write_output(page, "<h1>Hello</h1>", precompress=True)
+
+    assert changed is True
+    assert page.read_text() == "<h1>Hello</h1>"
+    assert gzip.decompress((tmp_path / "site" / "index.html.gz").read_bytes()) == b"<h1>Hello</h1>"
+
+
+def test_write_output_skips_unchanged_content(tmp_path):
+    """Test that identical content is not rewritten."""
+    page = tmp_path / "index.html"
+    write_output(page, "same")
+
+    assert write_output(page, "same") is False
+    assert write_output(page, "different") is True
+
+
+def test_compress_files_skips_unchanged_sources(tmp_path):
+    """Test that a second run over an unchanged tree does no work."""
+    for name in ("a.html", "b.css"):
+        (tmp_path / name).write_text(name * 100)
+    files = find_compressible_files(tmp_path)
+
+    first = compress_files(files, jobs=1, encodings=["gz"])
+    second = compress_files(files, jobs=1, encodings=["gz"])
+
+    assert first["written"] == 2
+    assert second["written"] == 0
+    assert second["skipped"] == 2
+
+
+def test_compress_files_recompresses_changed_source(tmp_path):
+    """Test that editing a source refreshes its sidecar."""
+    page = tmp_path / "a.html"
+    page.write_text("old")
+    compress_files([page], jobs=1, encodings=["gz"])
+
+    page.write_text("new")
+    stats = compress_files([page], jobs=1, encodings=["gz"])
+
+    assert stats["written"] == 1
+    assert gzip.decompress((tmp_path / "a.html.gz").read_bytes()) == b"new"
+
+
+def test_find_compressible_files_ignores_hidden_and_sidecars(tmp_path):
+    """Test that hidden directories and existing sidecars are not collected."""
+    (tmp_path / "index.html").write_text("x")
+    (tmp_path / "index.html.gz").write_bytes(b"x")
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / ".cache" / "hidden.html").write_text("x")
+
+    assert find_compressible_files(tmp_path) == [tmp_path / "index.html"]
+
+
+def test_concurrent_processes_share_a_manifest(tmp_path):
+    """Test that processes precompressing into one directory keep each other's manifest entries."""
+    files = []
+    for n in range(40):
+        path = tmp_path / f"page-{n}.html"
+        path.write_text(f"page {n} " * 50)
+        files.append(path)
+
+    # One compress_files() per file and process, like parallel build jobs
+    with ProcessPoolExecutor(max_workers=8) as pool:
+        list(pool.map(partial(compress_files, jobs=1, encodings=["gz"]), [[path] for path in files]))
+
+    manifest = json.loads((tmp_path / ".precompress.json").read_text())
+    assert sorted(manifest) == sorted(path.name for path in files)
+    assert all((tmp_path / f"{path.name}.gz").exists() for path in files)
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,119 @@
+"""
+test_resume_prerender.py - First contentful paint of the dynamic resume, client vs pre-rendered.
+
+Tests: PERF-001 through PERF-003
+
+The dynamic-resume builder can write the initial view's markup into the page
+(--prerender) instead of rendering it in the browser from the embedded JSON.
+These tests build both variants of the same resume with the repo's
+dynamic_resume engine and load them from file://, so no server is needed.
+
+FCP is read from the Paint Timing API under CPU throttling (Chromium only) to
+approximate a slow phone; the medians are printed for comparison.
+"""
+
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Browser, Page, expect
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+DYNAMIC_RESUME = REPO_ROOT / "projects" / "dynamic-resume"
+RESUME_MD = DYNAMIC_RESUME / "releases" / "v2.4" / "william-claytor-resume.md"
+
+CPU_THROTTLE_RATE = 4
+FCP_RUNS = 5
+
+FCP_SCRIPT = "() => performance.getEntriesByName('first-contentful-paint')[0].startTime"
+
+
+@pytest.fixture(scope="module")
+def resume_builds(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Build the client-rendered and pre-rendered pages; returns file:// URLs by variant."""
+    sys.path.insert(0, str(DYNAMIC_RESUME / "src"))
+    from dynamic_resume import build_resume
+
+    md = RESUME_MD.read_text(encoding="utf-8")
+    out_dir = tmp_path_factory.mktemp("resume")
+    urls = {}
+    for variant, prerender in (("client", False), ("prerendered", True)):
+        path = out_dir / f"{variant}.html"
+        path.write_text(build_resume(md, profile="v2.4", prerender=prerender), encoding="utf-8")
+        urls[variant] = path.as_uri()
+    return urls
+
+
+def measure_fcp(page: Page, url: str) -> float:
+    """Load a page and return its first contentful paint in milliseconds."""
+    page.goto(url)
+    page.wait_for_function("performance.getEntriesByName('first-contentful-paint').length > 0")
+    return page.evaluate(FCP_SCRIPT)
+
+
+@pytest.mark.performance
+class TestResumePrerender:
+    """
+    Pre-rendered resume paints its content without waiting for the script.
+    Tests: PERF-001, PERF-002, PERF-003
+    """
+
+    def test_prerendered_content_without_javascript(self, browser: Browser, resume_builds: dict[str, str]):
+        """
+        PERF-001: Pre-rendered page shows the resume with JavaScript disabled.
+
+        The client-rendered page has only empty containers until its script runs.
+        """
+        context = browser.new_context(java_script_enabled=False)
+        page = context.new_page()
+        try:
+            page.goto(resume_builds["prerendered"])
+            expect(page.locator("#resumeName")).to_have_text("William Claytor")
+            assert page.locator("#viewPanel > section").count() > 0
+            assert page.locator("#navLinks a").count() > 1
+
+            page.goto(resume_builds["client"])
+            assert page.locator("#viewPanel > section").count() == 0
+        finally:
+            context.close()
+
+    def test_prerendered_page_hydrates_view_toggle(self, page: Page, resume_builds: dict[str, str], console_errors: list):
+        """
+        PERF-002: Hydrated page keeps the short/full toggle working.
+        """
+        page.goto(resume_builds["prerendered"])
+        short_sections = page.locator("#viewPanel > section").count()
+        expect(page.locator("#viewBtn")).to_have_text("Content: Short")
+
+        page.locator("#viewBtn").click()
+        expect(page.locator("#viewBtn")).to_have_text("Content: Full")
+        expect(page.locator("#viewPanel > section")).not_to_have_count(0)
+        assert page.locator("#viewPanel > section").count() >= short_sections
+        assert console_errors == []
+
+    def test_fcp_client_vs_prerendered(self, page: Page, browser_name: str, resume_builds: dict[str, str]):
+        """
+        PERF-003: Measure FCP for both variants under CPU throttling.
+
+        Medians over several cold loads; the pre-rendered page should not be slower.
+        """
+        if browser_name != "chromium":
+            pytest.skip("CPU throttling needs the Chromium DevTools protocol")
+
+        cdp = page.context.new_cdp_session(page)
+        cdp.send("Emulation.setCPUThrottlingRate", {"rate": CPU_THROTTLE_RATE})
+
+        medians = {}
+        for variant, url in resume_builds.items():
+            runs = [measure_fcp(page, url) for _ in range(FCP_RUNS)]
+            medians[variant] = statistics.median(runs)
+
+        saved = medians["client"] - medians["prerendered"]
+        print(
+            f"\nFCP at {CPU_THROTTLE_RATE}x CPU throttle (median of {FCP_RUNS}): "
+            f"client {medians['client']:.0f}ms, pre-rendered {medians['prerendered']:.0f}ms "
+            f"({saved:+.0f}ms saved)"
+        )
+        # Allow for timer noise; the pre-rendered page skips the whole client render
+        assert medians["prerendered"] <= medians["client"] * 1.1
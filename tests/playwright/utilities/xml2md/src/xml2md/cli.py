@@ -8,6 +8,11 @@ import click
 from .formatter import generate_markdown
 from .parser import parse_junit_xml
 
+try:
+    from precompress import write_output
+except ImportError:  # optional: uv pip install -e scripts/utility/precompress
+    write_output = None
+
 
 @click.command()
 @click.argument("xml_file", type=click.Path(exists=True, path_type=Path))
@@ -17,7 +22,12 @@ from .parser import parse_junit_xml
     type=click.Path(path_type=Path),
     help="Output path for Markdown file. Can be a file or directory.",
 )
-def main(xml_file: Path, output: Path | None) -> None:
+@click.option(
+    "--precompress",
+    is_flag=True,
+    help="Also write .gz/.br sidecars (requires the precompress package).",
+)
+def main(xml_file: Path, output: Path | None, precompress: bool) -> None:
     """
     Convert a JUnit XML test report to a Markdown report.
 
@@ -30,7 +40,15 @@ def main(xml_file: Path, output: Path | None) -> None:
         xml2md report.xml -o custom.md       # Custom output file
 
         xml2md report.xml -o results/        # Output to directory
+
+        xml2md report.xml --precompress      # Also write report.md.gz/.br
     """
+    if precompress and write_output is None:
+        raise click.ClickException(
+            "--precompress requires the precompress package "
+            "(uv pip install -e scripts/utility/precompress)"
+        )
+
     # Parse the XML
     try:
         suites = parse_junit_xml(xml_file)
@@ -51,7 +69,10 @@ def main(xml_file: Path, output: Path | None) -> None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write output
-    output_path.write_text(markdown)
+    if precompress:
+        write_output(output_path, markdown, precompress=True)
+    else:
+        output_path.write_text(markdown)
     click.echo(f"✅ Markdown report saved to: {output_path}")
 
 